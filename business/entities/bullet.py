@@ -2,13 +2,13 @@
 
 import math
 import settings
-from business.entities.entity import MovableEntity
+from business.entities.entity import MovableEntity, PoolableEntity
 from business.entities.interfaces import IBullet
 from business.world.interfaces import IGameWorld
 from presentation.sprite import BulletSprite
 
 
-class Bullet(MovableEntity, IBullet):
+class Bullet(MovableEntity, PoolableEntity, IBullet):
     """A bullet that moves towards a target direction."""
 
     def __init__(self, src_x, src_y, dst_x, dst_y, speed):
@@ -18,6 +18,13 @@ class Bullet(MovableEntity, IBullet):
         self.__damage_amount: int = 5
         self.__final_damage_amount: int = 0
 
+    def reset(self, src_x, src_y, dst_x, dst_y, speed):  # pylint: disable=arguments-differ
+        self._reset_position(src_x, src_y)
+        self._speed = speed
+        self.__dir_x, self.__dir_y = self.__calculate_direction(dst_x - src_x, dst_y - src_y)
+        self.__health = 1
+        self.__final_damage_amount = 0
+
     def __calculate_direction(self, dx, dy):
         distance = math.hypot(dx, dy)
         if distance != 0:
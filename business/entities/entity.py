@@ -2,7 +2,8 @@
 
 from math import sqrt
 from abc import abstractmethod
-from business.entities.interfaces import ICanMove, IDamageable, IHasPosition, IHasSprite
+from business.entities.entity_pool import EntityPool
+from business.entities.interfaces import ICanMove, IDamageable, IHasPosition, IHasSprite, IPoolable
 from business.world.interfaces import IGameWorld
 from presentation.sprite import Sprite
 
@@ -13,7 +14,53 @@ class Entity(IHasPosition, IHasSprite):
     def __init__(self, pos_x: float, pos_y: float, sprite: Sprite):
         self._pos_x: float = pos_x
         self._pos_y: float = pos_y
+        self._prev_pos_x: float = pos_x
+        self._prev_pos_y: float = pos_y
         self._sprite: Sprite = sprite
+        self._spatial_grid = None
+        self._handle: int | None = None
+
+    def _reset_position(self, pos_x: float, pos_y: float):
+        self._pos_x = pos_x
+        self._pos_y = pos_y
+        self._prev_pos_x = pos_x
+        self._prev_pos_y = pos_y
+        self._handle = None
+        self._sprite.reset(pos_x, pos_y)
+
+    def bind_handle(self, handle: int):
+        """Binds the handle that identifies this entity while it is in the world.
+
+        Args:
+            handle (int): The handle given by the world.
+        """
+        self._handle = handle
+
+    def bind_spatial_grid(self, grid):
+        """Binds the spatial grid that indexes this entity, or None to unbind it.
+
+        Args:
+            grid (SpatialHashGrid | None): The grid that keeps track of the entity position.
+        """
+        self._spatial_grid = grid
+
+    def store_previous_position(self):
+        """Remembers the current position as the position of the previous simulation step."""
+        self._prev_pos_x = self.pos_x
+        self._prev_pos_y = self.pos_y
+
+    def interpolated_position(self, alpha: float) -> tuple[float, float]:
+        """Gets the position between the previous and the current simulation step.
+
+        Args:
+            alpha (float): How far into the next step rendering is, from 0 to 1.
+
+        Returns:
+            tuple[float, float]: The interpolated position.
+        """
+        pos_x, pos_y = self.pos_x, self.pos_y
+        return (self._prev_pos_x + (pos_x - self._prev_pos_x) * alpha,
+                self._prev_pos_y + (pos_y - self._prev_pos_y) * alpha)
 
     def _get_distance_to(self, an_entity: IHasPosition) -> float:
         """Returns the distance to another entity using the Euclidean distance formula.
@@ -31,6 +78,11 @@ class Entity(IHasPosition, IHasSprite):
     def pos_y(self) -> float:
         return self._pos_y
 
+    @property
+    def handle(self) -> int | None:
+        """The stable handle of the entity, or None if it never joined a world."""
+        return self._handle
+
     @property
     def sprite(self) -> Sprite:
         return self._sprite
@@ -44,6 +96,31 @@ class Entity(IHasPosition, IHasSprite):
         self.sprite.update()
 
 
+class PoolableEntity(IPoolable):
+    """Mixin for entities that are recycled through the EntityPool instead of being rebuilt."""
+
+    @classmethod
+    def acquire(cls, *args):
+        """Gets an entity from the pool reset with the constructor arguments, or a new one.
+
+        Args:
+            *args: The arguments of the constructor.
+
+        Returns:
+            PoolableEntity: The entity, ready to be added to the world.
+        """
+        entity = EntityPool.acquire(cls)
+        if entity is None:
+            return cls(*args)
+
+        entity.reset(*args)
+        return entity
+
+    @property
+    def pool_key(self):
+        return type(self)
+
+
 class MovableEntity(Entity, ICanMove):
     """Base class for all entities that can move."""
 
@@ -66,6 +143,9 @@ class MovableEntity(Entity, ICanMove):
 
         self.sprite.update_pos(self._pos_x, self._pos_y)
 
+        if self._spatial_grid is not None:
+            self._spatial_grid.update(self)
+
     @property
     def speed(self) -> float:
         return self._speed
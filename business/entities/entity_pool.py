@@ -0,0 +1,66 @@
+"""This module contains the EntityPool class."""
+
+from collections.abc import Hashable
+
+import settings
+from business.entities.interfaces import IPoolable
+
+
+class EntityPool:
+    """Recycles entities that left the world.
+
+    Entities are released into the pool once their removal from the world is applied, and
+    acquiring an entity of the same kind later resets a released one instead of building a new
+    entity and sprite. Each kind keeps at most `settings.ENTITY_POOL_CAPACITY` free entities.
+    """
+
+    __free: dict[Hashable, list] = {}
+
+    @staticmethod
+    def acquire(key: Hashable):
+        """Takes a free entity out of the pool.
+
+        The caller must reset the entity before using it.
+
+        Args:
+            key (Hashable): The kind of entity, see `IPoolable.pool_key`.
+
+        Returns:
+            IPoolable | None: A released entity, or None if there is none of that kind.
+        """
+        free = EntityPool.__free.get(key)
+        return free.pop() if free else None
+
+    @staticmethod
+    def release(entity: IPoolable):
+        """Gives an entity that is no longer in the world back to the pool.
+
+        Args:
+            entity (IPoolable): The entity to recycle. It must not be used after this call.
+
+        Raises:
+            TypeError: If the entity can not be reset for reuse.
+        """
+        if not isinstance(entity, IPoolable):
+            raise TypeError(f"{type(entity).__name__} can not be recycled")
+
+        free = EntityPool.__free.setdefault(entity.pool_key, [])
+        if len(free) < settings.ENTITY_POOL_CAPACITY:
+            free.append(entity)
+
+    @staticmethod
+    def free_count(key: Hashable) -> int:
+        """Gets the number of free entities of a kind.
+
+        Args:
+            key (Hashable): The kind of entity.
+
+        Returns:
+            int: The number of entities waiting to be reused.
+        """
+        return len(EntityPool.__free.get(key, ()))
+
+    @staticmethod
+    def clear():
+        """Drops every free entity."""
+        EntityPool.__free.clear()
@@ -1,17 +1,21 @@
 """Module for the ExperienceGem class."""
 
-from business.entities.entity import Entity
+from business.entities.entity import Entity, PoolableEntity
 from business.entities.interfaces import IExperienceGem
 from presentation.sprite import ExperienceGemSprite, SpeedGemSprite, DamageGemSprite, DefenceGemSprite, HealthGemSprite
 
 
-class ExperienceGem(Entity, IExperienceGem):
+class ExperienceGem(Entity, PoolableEntity, IExperienceGem):
     """Represents an experience gem in the game world."""
 
     def __init__(self, pos_x: float, pos_y: float, amount: int):
         super().__init__(pos_x, pos_y, ExperienceGemSprite(pos_x, pos_y))
         self.__amount = amount
 
+    def reset(self, pos_x: float, pos_y: float, amount: int):  # pylint: disable=arguments-differ
+        self._reset_position(pos_x, pos_y)
+        self.__amount = amount
+
     def json_format(self):
         return {
             'pos_x': self.pos_x,
@@ -28,15 +32,27 @@ class ExperienceGem(Entity, IExperienceGem):
 
         return ExperienceGem(src_x, src_y, amount)
 
+    def absorb(self, amount: int):
+        """Adds the experience of a gem merged into this one.
+
+        Args:
+            amount (int): The experience of the merged gem.
+        """
+        self.__amount += amount
+
     @property
     def amount(self) -> int:
         return self.__amount
 
+    @property
+    def mergeable(self) -> bool:
+        return True
+
     def __str__(self):
         return f"ExperienceGem(amount={self.__amount}, pos=({self.pos_x}, {self.pos_y}))"
 
 
-class SpeedGem(Entity, IExperienceGem):
+class SpeedGem(Entity, PoolableEntity, IExperienceGem):
     """Gema temporal que incrementa la velocidad del jugador"""
 
     def __init__(self, pos_x: float, pos_y: float, amount: int, speed_boost: int, duration: int):
@@ -45,6 +61,12 @@ class SpeedGem(Entity, IExperienceGem):
         self.__duration = duration
         self.__amount = amount
 
+    def reset(self, pos_x: float, pos_y: float, amount: int, speed_boost: int, duration: int):  # pylint: disable=arguments-differ
+        self._reset_position(pos_x, pos_y)
+        self.__speed_boost = speed_boost
+        self.__duration = duration
+        self.__amount = amount
+
     def json_format(self):
         return {
             'pos_x': self.pos_x,
@@ -73,12 +95,16 @@ class SpeedGem(Entity, IExperienceGem):
     def amount(self) -> int:
         return self.__amount
 
+    @property
+    def mergeable(self) -> bool:
+        return False
+
     def __str__(self):
         return (f"SpeedGem(amount={self.amount}, pos=({self.pos_x}, {self.pos_y}), "
                 f"speed_boost={self.__speed_boost}, duration={self.__duration})")
 
 
-class DamageGem(Entity, IExperienceGem):
+class DamageGem(Entity, PoolableEntity, IExperienceGem):
     """Gema temporal que incrementa el daño del jugador"""
 
     def __init__(self, pos_x: float, pos_y: float, amount: int, damage_boost: int, duration: int):
@@ -87,6 +113,12 @@ class DamageGem(Entity, IExperienceGem):
         self.__duration = duration
         self.__amount = amount
 
+    def reset(self, pos_x: float, pos_y: float, amount: int, damage_boost: int, duration: int):  # pylint: disable=arguments-differ
+        self._reset_position(pos_x, pos_y)
+        self.__damage_boost = damage_boost
+        self.__duration = duration
+        self.__amount = amount
+
     def json_format(self):
         return {
             'pos_x': self.pos_x,
@@ -115,12 +147,16 @@ class DamageGem(Entity, IExperienceGem):
     def amount(self) -> int:
         return self.__amount
 
+    @property
+    def mergeable(self) -> bool:
+        return False
+
     def __str__(self):
         return (f"DamageGem(amount={self.amount}, pos=({self.pos_x}, {self.pos_y}), "
                 f"damage_boost={self.__damage_boost}, duration={self.__duration})")
 
 
-class DefenceGem(Entity, IExperienceGem):
+class DefenceGem(Entity, PoolableEntity, IExperienceGem):
     """Gema temporal que incrementa la defensa del jugador"""
 
     def __init__(self, pos_x: float, pos_y: float, amount: int, defence_boost: int, duration: int):
@@ -129,6 +165,12 @@ class DefenceGem(Entity, IExperienceGem):
         self.__duration = duration
         self.__amount = amount
 
+    def reset(self, pos_x: float, pos_y: float, amount: int, defence_boost: int, duration: int):  # pylint: disable=arguments-differ
+        self._reset_position(pos_x, pos_y)
+        self.__defence_boost = defence_boost
+        self.__duration = duration
+        self.__amount = amount
+
     def json_format(self):
         return {
             'pos_x': self.pos_x,
@@ -157,12 +199,16 @@ class DefenceGem(Entity, IExperienceGem):
     def amount(self) -> int:
         return self.__amount
 
+    @property
+    def mergeable(self) -> bool:
+        return False
+
     def __str__(self):
         return (f"DefenceGem(amount={self.amount}, pos=({self.pos_x}, {self.pos_y}), "
                 f"defence_boost={self.__defence_boost}, duration={self.__duration})")
 
 
-class HealthGem(Entity, IExperienceGem):
+class HealthGem(Entity, PoolableEntity, IExperienceGem):
     """Gema que incrementa la vida del jugador"""
 
     def __init__(self, pos_x: float, pos_y: float, amount: int, health_boost: int, duration: int):
@@ -171,6 +217,12 @@ class HealthGem(Entity, IExperienceGem):
         self.__duration = duration
         self.__amount = amount
 
+    def reset(self, pos_x: float, pos_y: float, amount: int, health_boost: int, duration: int):  # pylint: disable=arguments-differ
+        self._reset_position(pos_x, pos_y)
+        self.__health_boost = health_boost
+        self.__duration = duration
+        self.__amount = amount
+
     def json_format(self):
         return {
             'pos_x': self.pos_x,
@@ -199,6 +251,10 @@ class HealthGem(Entity, IExperienceGem):
     def amount(self) -> int:
         return self.__amount
 
+    @property
+    def mergeable(self) -> bool:
+        return False
+
     def __str__(self):
         return (f"DefenceGem(amount={self.amount}, pos=({self.pos_x}, {self.pos_y}), "
                 f"defence_boost={self.__health_boost}, duration={self.__duration})")
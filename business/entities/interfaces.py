@@ -47,6 +47,30 @@ class IUpdatable(ABC):
         """Update the state of the entity."""
 
 
+class IPoolable(ABC):
+    """Interface for entities that can be recycled through the EntityPool."""
+
+    @property
+    @abstractmethod
+    def pool_key(self):
+        """The kind of entity, released entities are only reused for the same kind.
+
+        Returns:
+            Hashable: The key the pool files the entity under.
+        """
+
+    @abstractmethod
+    def reset(self, *args):
+        """Puts a recycled entity back in the state a new one built with these arguments has.
+
+        Each entity takes the arguments of its own constructor, so overrides name them instead
+        of taking *args and disable pylint's arguments-differ check on purpose.
+
+        Args:
+            *args: The arguments of the constructor.
+        """
+
+
 class IHasSprite(ABC):
     """Interface for entities that have a sprite."""
 
@@ -81,6 +105,17 @@ class IHasPosition(IHasSprite):
             float: The y-coordinate of the entity.
         """
 
+    @abstractmethod
+    def interpolated_position(self, alpha: float) -> tuple[float, float]:
+        """The position between the previous and the current simulation step.
+
+        Args:
+            alpha (float): How far into the next step rendering is, from 0 to 1.
+
+        Returns:
+            tuple[float, float]: The interpolated position.
+        """
+
 
 class ICanMove(IHasPosition):
     """Interface for entities that can move."""
@@ -126,6 +161,15 @@ class IMonster(IUpdatable, ICanMove, IDamageable, ICanDealDamage):
             str: The type of the monster.
         """
 
+    @property
+    @abstractmethod
+    def handle(self) -> int | None:
+        """The stable handle the world gave the monster.
+
+        Returns:
+            int | None: The handle, or None if the monster never joined a world.
+        """
+
     @abstractmethod
     def levelup(self, world, levelup_cooldown):
         """ Levels up monster every 10 seconds
@@ -188,6 +232,15 @@ class IExperienceGem(IUpdatable, IHasPosition):
         Returns:
             int: The amount of experience the gem gives.
         """
+
+    @property
+    @abstractmethod
+    def mergeable(self) -> bool:
+        """Whether nearby gems of this kind can be merged into one holding their experience.
+
+        Returns:
+            bool: True for plain experience gems, boost gems keep their effect and never merge.
+        """
     @abstractmethod
     def load_experience_gem_from_json(self, gem_data):
         """Creates an experience gem from JSON data.
@@ -1,41 +1,70 @@
 """This module contains the Monster class, which represents a monster entity in the game."""
 
-import settings
-from typing import List
-
-from business.entities.entity import MovableEntity
-from business.entities.interfaces import IDamageable, IHasPosition, IHasSprite, IMonster
+from business.entities.entity import MovableEntity, PoolableEntity
+from business.entities.interfaces import IMonster
+from business.entities.monster_store import MonsterStore
 from business.handlers.cooldown_handler import CooldownHandler
-from business.handlers.collision_handler import CollisionHandler
 from business.world.interfaces import IGameWorld, IPlayer
+from business.world.simulation_clock import SimulationClock
 from presentation.sprite import Sprite, ZombieSprite, SkeletonSprite, OrcSprite, WerewolfSprite
 
 
-class Monster(MovableEntity, IMonster):
-    """A monster entity in the game."""
+class Monster(MovableEntity, PoolableEntity, IMonster):
+    """A monster entity in the game.
+
+    The monster state lives in a row of a MonsterStore. Once the monster is added to the world
+    it is a view over the world's store, until then it owns a single-row store.
+    """
+
+    ATTACK_COOLDOWN = 1000
 
     def __init__(self, src_x: int, src_y: int, sprite: Sprite, health: int, max_health: int, damage: int, attack_range: int, monster_type: str):
-        self.__level_multiplier = 1
         super().__init__(src_x, src_y, 2, sprite)
-        self.__health: int = health * self.__level_multiplier
-        self.__max_health: int = max_health * self.__level_multiplier
-        self.__damage = damage * self.__level_multiplier
-        self.__attack_range = attack_range
-        self.__attack_cooldown = CooldownHandler(1000)
         self.__monster_type = monster_type
+        self.__store: MonsterStore = None  # type: ignore
+        self.__row: int = 0
+        MonsterStore(capacity=1).append(
+            self,
+            pos_x=src_x,
+            pos_y=src_y,
+            speed=2,
+            health=health,
+            max_health=max_health,
+            damage=damage,
+            attack_range=attack_range,
+            attack_cooldown=Monster.ATTACK_COOLDOWN,
+            last_attack_time=SimulationClock.active().now,
+            level_multiplier=1,
+        )
+
+    def reset(self, src_x: int, src_y: int, health: int, max_health: int, damage: int, attack_range: int):  # pylint: disable=arguments-differ
+        """Puts a recycled monster back in the state of a new monster of its type.
+
+        A monster that left the world keeps its state in a detached single-row store, which is
+        reused here.
+        """
+        self._reset_position(src_x, src_y)
+        store, row = self.__store, self.__row
+        for name, value in (('pos_x', src_x), ('pos_y', src_y), ('prev_x', src_x), ('prev_y', src_y),
+                            ('speed', 2), ('health', health), ('max_health', max_health),
+                            ('damage', damage), ('attack_range', attack_range),
+                            ('attack_cooldown', Monster.ATTACK_COOLDOWN),
+                            ('last_attack_time', SimulationClock.active().now),
+                            ('level_multiplier', 1), ('flashing', False)):
+            getattr(store, name)[row] = value
+
+    def bind_store(self, store: MonsterStore, row: int):
+        """Binds the store row that holds the state of this monster.
+
+        Args:
+            store (MonsterStore): The store holding the monster state.
+            row (int): The row of the monster in the store.
+        """
+        self.__store = store
+        self.__row = row
 
     def json_format(self):
-        return {
-            'level_multiplier': self.__level_multiplier,
-            'health': self.__health,
-            'max_health': self.__max_health,
-            'damage': self.__damage,
-            'attack_range': self.__attack_range,
-            'attack_cooldown': self.__attack_cooldown.json_format(),
-            'pos_x': self.pos_x,
-            'pos_y': self.pos_y,
-            'monster_type': self.__monster_type,
-        }
+        return self.__store.format_row(self.__row, self.__monster_type)
 
     @staticmethod
     def load_monster_from_json(monster_data) -> IMonster:
@@ -59,12 +88,15 @@ class Monster(MovableEntity, IMonster):
 
         return Monster(src_x, src_y, sprite, health, max_health, damage, attack_range, monster_type)
 
-    def attack(self, target: IPlayer, attack_cooldown: CooldownHandler):
-        """Attacks the target."""
+    def attack(self, target: IPlayer):
+        """Attacks the target if the attack is off cooldown and the target is in range."""
+        store, row = self.__store, self.__row
+        now = SimulationClock.active().now
 
-        if attack_cooldown.is_action_ready() and self._get_distance_to(target) < self.__attack_range:
+        if now - store.last_attack_time[row] >= store.attack_cooldown[row] and \
+                self._get_distance_to(target) < store.attack_range[row]:
             target.take_damage(self.damage_amount)
-            attack_cooldown.put_on_cooldown()
+            store.last_attack_time[row] = now
 
     def __get_direction_towards_the_player(self, world: IGameWorld):
         direction_x = world.player.pos_x - self.pos_x
@@ -79,29 +111,54 @@ class Monster(MovableEntity, IMonster):
 
     def levelup(self, world: IGameWorld, levelup_cooldown: CooldownHandler):
         if levelup_cooldown.is_action_ready():
-            self.__level_multiplier += (world.timer // 10)
+            self.__store.level_up(self.__row, world.timer // 10)
+            levelup_cooldown.put_on_cooldown()
 
-            self.__health *= self.__level_multiplier
-            self.__max_health *= self.__level_multiplier
-            self.__damage *= self.__level_multiplier
+    def relocate(self, pos_x: float, pos_y: float):
+        """Moves the monster to a position at once, without interpolating the jump.
 
-            levelup_cooldown.put_on_cooldown()
+        Args:
+            pos_x (float): The new x-coordinate.
+            pos_y (float): The new y-coordinate.
+        """
+        store, row = self.__store, self.__row
+        store.pos_x[row] = store.prev_x[row] = pos_x
+        store.pos_y[row] = store.prev_y[row] = pos_y
 
-    def update(self, world: IGameWorld):
+        if self._spatial_grid is not None:
+            self._spatial_grid.update(self)
+
+    def store_previous_position(self):
+        store, row = self.__store, self.__row
+        store.prev_x[row] = store.pos_x[row]
+        store.prev_y[row] = store.pos_y[row]
 
+    def interpolated_position(self, alpha: float) -> tuple[float, float]:
+        store, row = self.__store, self.__row
+        prev_x, prev_y = store.prev_x[row], store.prev_y[row]
+        return (float(prev_x + (store.pos_x[row] - prev_x) * alpha),
+                float(prev_y + (store.pos_y[row] - prev_y) * alpha))
+
+    def move(self, direction_x: float, direction_y: float):
+        self.__store.move(self.__row, direction_x, direction_y)
+
+        if self._spatial_grid is not None:
+            self._spatial_grid.update(self)
+
+    def update(self, world: IGameWorld):
+        # Single-monster path, the world moves all of its monsters at once through the store
         direction_x, direction_y = self.__get_direction_towards_the_player(
             world)
-        
+
         if (direction_x, direction_y) == (0, 0):
             return
 
         self.move(direction_x, direction_y)
 
-        if self.__health <= 0:
+        if self.health <= 0:
             world.remove_monster(self)
 
-        if self.__attack_cooldown.is_action_ready():
-            self.attack(world.player, self.__attack_cooldown)
+        self.attack(world.player)
 
         super().update(world)
 
@@ -109,21 +166,56 @@ class Monster(MovableEntity, IMonster):
         return f"Monster(hp={self.health}, pos={self.pos_x, self.pos_y})"
 
     def take_damage(self, amount):
-        self.__health = max(0, self.__health - amount)
+        store, row = self.__store, self.__row
+        store.health[row] = max(0, store.health[row] - amount)
+        store.flashing[row] = True
         self.sprite.take_damage()
 
+    @property
+    def store(self) -> MonsterStore:
+        """The store holding the monster state."""
+        return self.__store
+
+    @property
+    def store_row(self) -> int:
+        """The row of the monster in its store."""
+        return self.__row
+
+    @property
+    def pos_x(self) -> float:
+        return float(self.__store.pos_x[self.__row])
+
+    @property
+    def pos_y(self) -> float:
+        return float(self.__store.pos_y[self.__row])
+
+    @property
+    def speed(self) -> float:
+        return float(self.__store.speed[self.__row])
+
+    @property
+    def sprite(self) -> Sprite:
+        # Positions live in the store, so the rect is synced when someone looks at it
+        self._sprite.update_pos(self.pos_x, self.pos_y)
+        return self._sprite
+
     @property
     def damage_amount(self):
-        return self.__damage
+        return int(self.__store.damage[self.__row])
 
     @property
     def health(self) -> int:
-        return self.__health
+        return int(self.__store.health[self.__row])
 
     @property
     def max_health(self) -> int:
-        return self.__max_health
+        return int(self.__store.max_health[self.__row])
 
     @property
     def monster_type(self) -> str:
         return self.__monster_type
+
+    @property
+    def pool_key(self):
+        # Recycled monsters keep their sprite, so they are only reused for the same type
+        return (Monster, self.__monster_type)
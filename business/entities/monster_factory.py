@@ -1,11 +1,26 @@
 """This module contains the MonsterFactory class, which creates Monster instances."""
 
+from business.entities.entity_pool import EntityPool
 from business.entities.monster import Monster
-from presentation.sprite import Sprite
+from presentation.sprite import Sprite, ZombieSprite, SkeletonSprite, OrcSprite, WerewolfSprite
 
 class MonsterFactory:
     """Factory for creating Monster instances with custom configurations."""
 
+    SPRITES = {
+        "zombie": ZombieSprite,
+        "skeleton": SkeletonSprite,
+        "orc": OrcSprite,
+        "werewolf": WerewolfSprite,
+    }
+
+    # Health, max health, damage and attack range of each type, zombies use the factory defaults
+    STATS = {
+        "skeleton": (15, 15, 1, 50),
+        "orc": (20, 20, 2, 60),
+        "werewolf": (25, 25, 2, 60),
+    }
+
     def __init__(self, default_health=10, default_damage=1, default_attack_range=50, default_max_health = 10):
         self.default_health = default_health
         self.default_damage = default_damage
@@ -25,26 +40,50 @@ class MonsterFactory:
         
         return monster
 
+    def acquire_monster(self, src_x: int, src_y: int, monster_type: str) -> Monster:
+        """Gets a monster of a type, recycling one from the EntityPool when there is one free.
+
+        Args:
+            src_x (int): The x-coordinate of the monster.
+            src_y (int): The y-coordinate of the monster.
+            monster_type (str): The type of the monster.
+
+        Returns:
+            Monster: The monster, ready to be added to the world.
+        """
+        monster = EntityPool.acquire((Monster, monster_type))
+        if monster is None:
+            sprite = MonsterFactory.SPRITES[monster_type](src_x, src_y)
+            return self.create_monster(src_x, src_y, sprite, monster_type)
+
+        monster.reset(src_x, src_y, *self.__stats(monster_type))
+        return monster
+
+    def __stats(self, monster_type: str) -> tuple[int, int, int, int]:
+        # New and recycled monsters both read their stats from here, so they can not drift apart
+        return MonsterFactory.STATS.get(monster_type, (self.default_health, self.default_max_health,
+                                                       self.default_damage, self.default_attack_range))
+
     def create_zombie(self, src_x: int, src_y: int, sprite: Sprite, monster_type: str) -> Monster:
         """Creates zombie monster."""
-        monster = Monster(src_x, src_y, sprite, self.default_health, self.default_max_health, self.default_damage, self.default_attack_range, monster_type)
+        monster = Monster(src_x, src_y, sprite, *self.__stats("zombie"), monster_type)
 
         return monster
 
     def create_skeleton(self, src_x: int, src_y: int, sprite: Sprite, monster_type: str) -> Monster:
         """Creates skeleton monster."""
-        monster = Monster(src_x, src_y, sprite, 15, 15, 1, 50, monster_type)
+        monster = Monster(src_x, src_y, sprite, *self.__stats("skeleton"), monster_type)
 
         return monster
 
     def create_orc(self, src_x: int, src_y: int, sprite: Sprite, monster_type: str) -> Monster:
         """Creates orc monster."""
-        monster = Monster(src_x, src_y, sprite, 20, 20, 2, 60, monster_type)
+        monster = Monster(src_x, src_y, sprite, *self.__stats("orc"), monster_type)
 
         return monster
 
     def create_werewolf(self, src_x: int, src_y: int, sprite: Sprite, monster_type: str) -> Monster:
         """Creates werewolf monster."""
-        monster = Monster(src_x, src_y, sprite, 25, 25, 2, 60, monster_type)
+        monster = Monster(src_x, src_y, sprite, *self.__stats("werewolf"), monster_type)
 
         return monster
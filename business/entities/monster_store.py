@@ -0,0 +1,293 @@
+"""This module contains the MonsterStore class, a struct-of-arrays store for monster state."""
+
+import numpy as np
+
+import settings
+
+
+class MonsterStore:
+    """Keeps the state of many monsters as NumPy column arrays.
+
+    Row i of every column belongs to the monster at index i of `monsters`. The Monster objects
+    are thin views over their row, which lets the world update every monster with whole-array
+    operations. Rows are removed by moving the last row into the hole.
+    """
+
+    COLUMNS = {
+        'pos_x': np.float64,
+        'pos_y': np.float64,
+        'prev_x': np.float64,
+        'prev_y': np.float64,
+        'speed': np.float64,
+        'health': np.int64,
+        'max_health': np.int64,
+        'damage': np.int64,
+        'attack_range': np.float64,
+        'attack_cooldown': np.int64,
+        'last_attack_time': np.int64,
+        'level_multiplier': np.int64,
+        'cell_col': np.int64,
+        'cell_row': np.int64,
+        'flashing': np.bool_,
+    }
+    # Keeps level-up scaling from overflowing the int64 columns
+    STAT_LIMIT = 2 ** 53
+
+    pos_x: np.ndarray
+    pos_y: np.ndarray
+    prev_x: np.ndarray
+    prev_y: np.ndarray
+    speed: np.ndarray
+    health: np.ndarray
+    max_health: np.ndarray
+    damage: np.ndarray
+    attack_range: np.ndarray
+    attack_cooldown: np.ndarray
+    last_attack_time: np.ndarray
+    level_multiplier: np.ndarray
+    cell_col: np.ndarray
+    cell_row: np.ndarray
+    flashing: np.ndarray
+
+    def __init__(self, capacity: int = 256):
+        self.__count = 0
+        self.__capacity = 0
+        self.__monsters: list = []
+        self.__resize(max(1, capacity))
+
+    def __resize(self, capacity: int):
+        for name, dtype in MonsterStore.COLUMNS.items():
+            column = np.zeros(capacity, dtype=dtype)
+            if self.__count:
+                column[:self.__count] = getattr(self, name)[:self.__count]
+            setattr(self, name, column)
+        self.__capacity = capacity
+
+    def __next_row(self, monster) -> int:
+        if self.__count == self.__capacity:
+            self.__resize(self.__capacity * 2)
+
+        row = self.__count
+        self.__count += 1
+        self.__monsters.append(monster)
+        return row
+
+    def __update_cell(self, row: int):
+        self.cell_col[row] = self.pos_x[row] // settings.SPATIAL_GRID_CELL_SIZE
+        self.cell_row[row] = self.pos_y[row] // settings.SPATIAL_GRID_CELL_SIZE
+
+    def append(self, monster, **values) -> int:
+        """Adds a row for a monster.
+
+        Args:
+            monster (Monster): The monster view that owns the row.
+            **values: The initial value of each column, missing columns start at zero.
+
+        Returns:
+            int: The row of the monster.
+        """
+        row = self.__next_row(monster)
+        for name in MonsterStore.COLUMNS:
+            getattr(self, name)[row] = values.get(name, 0)
+        self.prev_x[row] = self.pos_x[row]
+        self.prev_y[row] = self.pos_y[row]
+        self.__update_cell(row)
+        monster.bind_store(self, row)
+        return row
+
+    def adopt(self, monster) -> int:
+        """Moves a monster's row from the store it is bound to into this store.
+
+        Args:
+            monster (Monster): The monster to adopt.
+
+        Returns:
+            int: The new row of the monster.
+        """
+        source, source_row = monster.store, monster.store_row
+        row = self.__next_row(monster)
+        for name in MonsterStore.COLUMNS:
+            getattr(self, name)[row] = getattr(source, name)[source_row]
+        self.__update_cell(row)
+        monster.bind_store(self, row)
+        return row
+
+    def remove(self, monster):
+        """Removes a monster in constant time by moving the last row into its place.
+
+        The removed monster keeps its state in a detached single-row store.
+
+        Args:
+            monster (Monster): The monster to remove.
+        """
+        if monster.store is not self:
+            return
+
+        row = monster.store_row
+        MonsterStore(capacity=1).adopt(monster)
+
+        last = self.__count - 1
+        if row != last:
+            for name in MonsterStore.COLUMNS:
+                column = getattr(self, name)
+                column[row] = column[last]
+            moved = self.__monsters[last]
+            self.__monsters[row] = moved
+            moved.bind_store(self, row)
+
+        self.__monsters.pop()
+        self.__count -= 1
+
+    def snapshot(self) -> "MonsterStore":
+        """Copies the columns of every row into a new store.
+
+        The copy has no monster views, it only keeps the state as it was at the time of the
+        call, so it can be read while the simulation keeps changing this store.
+
+        Returns:
+            MonsterStore: The copy.
+        """
+        copy = MonsterStore(capacity=self.__count)
+        for name in MonsterStore.COLUMNS:
+            setattr(copy, name, getattr(self, name)[:self.__count].copy())
+        copy.__count = self.__count
+        return copy
+
+    def format_row(self, row: int, monster_type: str) -> dict:
+        """Formats the monster state in a row as the JSON data of a monster.
+
+        Args:
+            row (int): The row of the monster.
+            monster_type (str): The type of the monster, which the store does not keep.
+
+        Returns:
+            dict: The JSON data of the monster.
+        """
+        return {
+            'level_multiplier': int(self.level_multiplier[row]),
+            'health': int(self.health[row]),
+            'max_health': int(self.max_health[row]),
+            'damage': int(self.damage[row]),
+            'attack_range': int(self.attack_range[row]),
+            'attack_cooldown': {
+                'last_action_time': int(self.last_attack_time[row]),
+                'cooldown_time': int(self.attack_cooldown[row]),
+            },
+            'pos_x': float(self.pos_x[row]),
+            'pos_y': float(self.pos_y[row]),
+            'monster_type': monster_type,
+        }
+
+    def clear(self):
+        """Removes every row."""
+        self.__monsters.clear()
+        self.__count = 0
+
+    def move(self, row: int, direction_x: float, direction_y: float):
+        """Moves a single monster along a direction, normalised and scaled by its speed.
+
+        Args:
+            row (int): The row of the monster.
+            direction_x (float): The direction in x-coordinate.
+            direction_y (float): The direction in y-coordinate.
+        """
+        magnitude = np.hypot(direction_x, direction_y)
+        if magnitude > 0:
+            self.pos_x[row] += direction_x / magnitude * self.speed[row]
+            self.pos_y[row] += direction_y / magnitude * self.speed[row]
+
+    def store_previous_positions(self):
+        """Remembers the current positions as the positions of the previous simulation step."""
+        count = self.__count
+        self.prev_x[:count] = self.pos_x[:count]
+        self.prev_y[:count] = self.pos_y[:count]
+
+    def chase(self, target_x: float, target_y: float) -> np.ndarray:
+        """Moves every monster one step towards a target.
+
+        Each axis moves by the sign of the distance to the target, the direction is then
+        normalised and scaled by the monster's speed.
+
+        Args:
+            target_x (float): The x-coordinate of the target.
+            target_y (float): The y-coordinate of the target.
+
+        Returns:
+            np.ndarray: A mask of the monsters that moved. Monsters already on the target stay idle.
+        """
+        count = self.__count
+        pos_x, pos_y = self.pos_x[:count], self.pos_y[:count]
+
+        direction_x = np.sign(target_x - pos_x)
+        direction_y = np.sign(target_y - pos_y)
+        magnitude = np.hypot(direction_x, direction_y)
+        moving = magnitude > 0
+
+        step = np.divide(self.speed[:count], magnitude, out=np.zeros(count), where=moving)
+        pos_x += direction_x * step
+        pos_y += direction_y * step
+        return moving
+
+    def changed_cells(self) -> np.ndarray:
+        """Updates the grid cell of every monster.
+
+        Returns:
+            np.ndarray: The rows whose grid cell changed since the last call.
+        """
+        count = self.__count
+        cell_col = (self.pos_x[:count] // settings.SPATIAL_GRID_CELL_SIZE).astype(np.int64)
+        cell_row = (self.pos_y[:count] // settings.SPATIAL_GRID_CELL_SIZE).astype(np.int64)
+        changed = np.flatnonzero((cell_col != self.cell_col[:count]) | (cell_row != self.cell_row[:count]))
+        self.cell_col[:count] = cell_col
+        self.cell_row[:count] = cell_row
+        return changed
+
+    def attackers(self, target_x: float, target_y: float, now: int, mask: np.ndarray) -> np.ndarray:
+        """Gets the monsters that can attack the target and puts their attack on cooldown.
+
+        Args:
+            target_x (float): The x-coordinate of the target.
+            target_y (float): The y-coordinate of the target.
+            now (int): The current time in milliseconds.
+            mask (np.ndarray): The monsters allowed to attack.
+
+        Returns:
+            np.ndarray: The rows of the attacking monsters.
+        """
+        count = self.__count
+        ready = now - self.last_attack_time[:count] >= self.attack_cooldown[:count]
+        distance = np.hypot(self.pos_x[:count] - target_x, self.pos_y[:count] - target_y)
+        rows = np.flatnonzero(mask & ready & (distance < self.attack_range[:count]))
+        self.last_attack_time[rows] = now
+        return rows
+
+    def dead(self, mask: np.ndarray) -> np.ndarray:
+        """Gets the monsters without health left.
+
+        Args:
+            mask (np.ndarray): The monsters to check.
+
+        Returns:
+            np.ndarray: The rows of the dead monsters.
+        """
+        return np.flatnonzero(mask & (self.health[:self.__count] <= 0))
+
+    def level_up(self, rows, amount: int):
+        """Raises the level multiplier of some monsters and scales their stats by it.
+
+        Args:
+            rows: The rows to level up, anything NumPy accepts as an index.
+            amount (int): How much the level multiplier grows.
+        """
+        self.level_multiplier[rows] += amount
+        multiplier = self.level_multiplier[rows]
+        for column in (self.health, self.max_health, self.damage):
+            column[rows] = np.minimum(column[rows] * multiplier.astype(np.float64), MonsterStore.STAT_LIMIT)
+
+    @property
+    def monsters(self) -> list:
+        """The monster views, in row order."""
+        return self.__monsters
+
+    def __len__(self):
+        return self.__count
@@ -1,15 +1,16 @@
 """Player entity module."""
 
-import pygame
 import settings
 from business.entities.bullet import Bullet
 from business.entities.entity import MovableEntity
 from business.entities.experience_gem import *
 from business.entities.interfaces import ICanDealDamage, IDamageable, IPlayer
+from business.entities.targeting import TargetingStrategy
 from business.world.interfaces import IGameWorld
 from presentation.sprite import Sprite, PlayerSprite
 from business.entities.weapons import PistolWeapon, ShotgunWeapon, MinigunWeapon
 from business.handlers.cooldown_handler import CooldownHandler
+from business.world.simulation_clock import SimulationClock
 
 
 class Player(MovableEntity, IPlayer, IDamageable, ICanDealDamage):
@@ -28,8 +29,8 @@ class Player(MovableEntity, IPlayer, IDamageable, ICanDealDamage):
         self.__max_health = health
         self.__health = min(health, self.__max_health)
 
-        self.__last_shot_time = pygame.time.get_ticks()
-        self._last_autoheal_time = pygame.time.get_ticks()
+        self.__last_shot_time = SimulationClock.active().now
+        self._last_autoheal_time = SimulationClock.active().now
 
         self.__experience = 0
 
@@ -60,6 +61,7 @@ class Player(MovableEntity, IPlayer, IDamageable, ICanDealDamage):
         ]
         self.__current_weapon_index = 0
         self.__weapon = self.__weapons[self.__current_weapon_index]["weapon"]
+        self.__targeting: TargetingStrategy = TargetingStrategy.create()
 
         self.__damage_boost_cooldown = CooldownHandler(5000)
         self.__speed_boost_cooldown = CooldownHandler(5000)
@@ -222,17 +224,18 @@ class Player(MovableEntity, IPlayer, IDamageable, ICanDealDamage):
             self.__level += 1
             self.__levelup_perks()
 
-    def __shoot_at_nearest_enemy(self, world: IGameWorld):
-        if not world.monsters:
+    def set_targeting(self, targeting: TargetingStrategy):
+        """Cambia la estrategia con la que el jugador elige a qué monstruo disparar."""
+        self.__targeting = targeting
+
+    def __shoot_at_target(self, world: IGameWorld):
+        # The target is only looked up when the weapon can fire
+        if not self.__weapon.is_ready:
             return
 
-        monster = min(
-            world.monsters,
-            key=lambda monster: (
-                (monster.pos_x - self.pos_x) ** 2 +
-                (monster.pos_y - self.pos_y) ** 2
-            ),
-        )
+        monster = self.__targeting.target(world, self.pos_x, self.pos_y)
+        if monster is None:
+            return
 
         self.__weapon.shoot(world, self.pos_x, self.pos_y,
                             monster.pos_x, monster.pos_y)
@@ -262,7 +265,7 @@ class Player(MovableEntity, IPlayer, IDamageable, ICanDealDamage):
     def update(self, world: IGameWorld):
         super().update(world)
 
-        current_time = pygame.time.get_ticks()
+        current_time = world.clock.now
 
         self.update_stats()
 
@@ -271,7 +274,7 @@ class Player(MovableEntity, IPlayer, IDamageable, ICanDealDamage):
             # Actualizar el tiempo del último autoheal
             self._last_autoheal_time = current_time
 
-        self.__shoot_at_nearest_enemy(world)
+        self.__shoot_at_target(world)
         self.__last_shot_time = current_time
 
     def set_max_health(self, max_health: int):
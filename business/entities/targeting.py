@@ -0,0 +1,123 @@
+"""This module contains the strategies the player uses to pick what to shoot at."""
+
+from abc import ABC, abstractmethod
+
+import settings
+from business.entities.interfaces import IMonster
+from business.world.interfaces import IGameWorld
+
+
+class TargetingStrategy(ABC):
+    """Picks the monster to shoot at.
+
+    The chosen target is kept, by handle, while it stays alive and in range, so a new one is
+    only searched for when it is lost. Every strategy searches through the world's spatial
+    index.
+    """
+
+    def __init__(self, max_range: float | None = None):
+        self.__max_range = max_range if max_range is not None else settings.TARGETING_RANGE
+        self.__target_handle: int | None = None
+
+    @staticmethod
+    def create(name: str | None = None) -> "TargetingStrategy":
+        """Creates a targeting strategy by name.
+
+        Args:
+            name (str | None): One of the names in TARGETING_STRATEGIES, the one in the
+                settings if None.
+
+        Returns:
+            TargetingStrategy: A new strategy with no target yet.
+        """
+        name = name if name is not None else settings.TARGETING_STRATEGY
+        if name not in TARGETING_STRATEGIES:
+            raise ValueError(f"Unknown targeting strategy: {name}")
+        return TARGETING_STRATEGIES[name]()
+
+    @property
+    def max_range(self) -> float:
+        """The distance beyond which monsters are not targeted."""
+        return self.__max_range
+
+    def __is_valid(self, target: IMonster, pos_x: float, pos_y: float) -> bool:
+        distance_squared = (target.pos_x - pos_x) ** 2 + (target.pos_y - pos_y) ** 2
+        return target.health > 0 and distance_squared <= self.__max_range ** 2
+
+    def target(self, world: IGameWorld, pos_x: float, pos_y: float) -> IMonster | None:
+        """Gets the target for a shooter, keeping the previous one if it is still valid.
+
+        Args:
+            world (IGameWorld): The game world.
+            pos_x (float): The x-coordinate of the shooter.
+            pos_y (float): The y-coordinate of the shooter.
+
+        Returns:
+            IMonster | None: The target, or None if no monster is in range.
+        """
+        if self.__target_handle is not None:
+            target = world.get_monster(self.__target_handle)
+            if target is not None and self.__is_valid(target, pos_x, pos_y):
+                return target
+
+        target = self.select(world, pos_x, pos_y)
+        self.__target_handle = target.handle if target is not None else None
+        return target
+
+    @abstractmethod
+    def select(self, world: IGameWorld, pos_x: float, pos_y: float) -> IMonster | None:
+        """Searches for a new target.
+
+        Args:
+            world (IGameWorld): The game world.
+            pos_x (float): The x-coordinate of the shooter.
+            pos_y (float): The y-coordinate of the shooter.
+
+        Returns:
+            IMonster | None: The new target, or None if no monster is in range.
+        """
+
+
+class NearestTargeting(TargetingStrategy):
+    """Targets the closest monster."""
+
+    def select(self, world: IGameWorld, pos_x: float, pos_y: float) -> IMonster | None:
+        return world.nearest_monster(pos_x, pos_y, self.max_range)
+
+
+class LowestHealthTargeting(TargetingStrategy):
+    """Targets the monster in range with the least health, the closest one on ties."""
+
+    def select(self, world: IGameWorld, pos_x: float, pos_y: float) -> IMonster | None:
+        monsters = [monster for monster in world.monsters_in_radius(pos_x, pos_y, self.max_range)
+                    if monster.health > 0]
+        if not monsters:
+            return None
+
+        return min(monsters, key=lambda monster: (
+            monster.health, (monster.pos_x - pos_x) ** 2 + (monster.pos_y - pos_y) ** 2))
+
+
+class DensestClusterTargeting(TargetingStrategy):
+    """Targets the monster in range with the most monsters around it."""
+
+    def __init__(self, max_range: float | None = None, cluster_radius: float | None = None):
+        super().__init__(max_range)
+        self.__cluster_radius = cluster_radius if cluster_radius is not None else settings.TARGETING_CLUSTER_RADIUS
+
+    def select(self, world: IGameWorld, pos_x: float, pos_y: float) -> IMonster | None:
+        monsters = [monster for monster in world.monsters_in_radius(pos_x, pos_y, self.max_range)
+                    if monster.health > 0]
+        if not monsters:
+            return None
+
+        return max(monsters, key=lambda monster: (
+            len(world.monsters_in_radius(monster.pos_x, monster.pos_y, self.__cluster_radius)),
+            -((monster.pos_x - pos_x) ** 2 + (monster.pos_y - pos_y) ** 2)))
+
+
+TARGETING_STRATEGIES: dict[str, type[TargetingStrategy]] = {
+    "nearest": NearestTargeting,
+    "lowest_health": LowestHealthTargeting,
+    "densest_cluster": DensestClusterTargeting,
+}
@@ -1,10 +1,10 @@
 """Module of the weapons"""
-import pygame
 import math
 from abc import abstractmethod
 from business.world.interfaces import IGameWorld
 from business.handlers.cooldown_handler import CooldownHandler
 from business.entities.bullet import Bullet
+from presentation.sprite import AssetCache
 
 
 class Weapon():
@@ -16,8 +16,7 @@ class Weapon():
         self.__bullet_speed = bullet_speed
         self.__bullet_damage = bullet_damage
         self.__required_level = required_level
-        self.__image_path = pygame.image.load(
-            image_path).convert_alpha()  # Ruta de la imagen
+        self.__image_path = AssetCache.get(image_path)  # Ruta de la imagen
         self._cooldown_handler = CooldownHandler(shoot_cooldown)
 
     @property
@@ -54,6 +53,11 @@ class Weapon():
     def required_level(self):
         return self.__required_level
 
+    @property
+    def is_ready(self) -> bool:
+        """Returns whether the weapon can shoot now"""
+        return self._cooldown_handler.is_action_ready()
+
     @abstractmethod
     def shoot(self, world: IGameWorld):
         """Abstract method to shoot a bullet"""
@@ -69,8 +73,8 @@ class PistolWeapon(Weapon):
 
     def shoot(self, world: IGameWorld, src_x: float, src_y: float, target_x: float, target_y: float):
         if self._cooldown_handler.is_action_ready():
-            bullet = Bullet(src_x, src_y, target_x,
-                            target_y, self.bullet_speed)
+            bullet = Bullet.acquire(src_x, src_y, target_x,
+                                    target_y, self.bullet_speed)
             world.add_bullet(bullet)
             self.cooldown_handler.put_on_cooldown()
 
@@ -100,10 +104,10 @@ class ShotgunWeapon(Weapon):
                     math.sin(angle_offset) + base_dir_y * \
                     math.cos(angle_offset)
 
-                bullet = Bullet(src_x, src_y,
-                                src_x + offset_dir_x * self.bullet_speed,
-                                src_y + offset_dir_y * self.bullet_speed,
-                                self.bullet_speed)
+                bullet = Bullet.acquire(src_x, src_y,
+                                        src_x + offset_dir_x * self.bullet_speed,
+                                        src_y + offset_dir_y * self.bullet_speed,
+                                        self.bullet_speed)
                 world.add_bullet(bullet)
 
             self.cooldown_handler.put_on_cooldown()
@@ -118,7 +122,7 @@ class MinigunWeapon(Weapon):
 
     def shoot(self, world: IGameWorld, src_x: float, src_y: float, target_x: float, target_y: float):
         if self._cooldown_handler.is_action_ready():
-            bullet = Bullet(src_x, src_y, target_x,
-                            target_y, self.bullet_speed)
+            bullet = Bullet.acquire(src_x, src_y, target_x,
+                                    target_y, self.bullet_speed)
             world.add_bullet(bullet)
             self.cooldown_handler.put_on_cooldown()
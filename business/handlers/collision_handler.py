@@ -2,7 +2,8 @@
 
 from typing import List
 
-from business.entities.interfaces import IBullet, IExperienceGem, IHasSprite, IMonster, IPlayer
+import settings
+from business.entities.interfaces import IBullet, IHasSprite, IMonster, IPlayer
 from business.world.interfaces import IGameWorld
 
 
@@ -14,33 +15,61 @@ class CollisionHandler:
         return an_entity.sprite.rect.colliderect(another_entity.sprite.rect)
 
     @staticmethod
-    def __handle_bullets(bullets: List[IBullet], monsters: List[IMonster]):
+    def __is_alive(monster: IMonster):
+        # Dead monsters stay in the world until the pending removals are applied, meanwhile
+        # they no longer stop bullets or hurt the player
+        return monster.health > 0
+
+    @staticmethod
+    def __hit(bullet: IBullet, monster: IMonster):
+        monster.take_damage(bullet.damage_amount)
+        bullet.take_damage(bullet.damage_amount)
+
+    @staticmethod
+    def __handle_bullets(bullets: List[IBullet], world: IGameWorld):
+        # Broad phase: only test the monsters bucketed in the cells the bullet overlaps
+        for bullet in bullets:
+            for monster in world.monsters_in_rect(bullet.sprite.rect):
+                if CollisionHandler.__is_alive(monster) and CollisionHandler.__collides_with(bullet, monster):
+                    CollisionHandler.__hit(bullet, monster)
+
+    @staticmethod
+    def __handle_bullets_brute_force(bullets: List[IBullet], monsters: List[IMonster]):
+        # Reference path that tests every bullet against every monster
         for bullet in bullets:
             for monster in monsters:
-                if CollisionHandler.__collides_with(bullet, monster):
-                    monster.take_damage(bullet.damage_amount)
-                    bullet.take_damage(bullet.damage_amount)
+                if CollisionHandler.__is_alive(monster) and CollisionHandler.__collides_with(bullet, monster):
+                    CollisionHandler.__hit(bullet, monster)
 
     @staticmethod
-    def __handle_monsters(monsters: List[IMonster], player: IPlayer):
-        for monster in monsters:
-            if CollisionHandler.__collides_with(monster, player):
+    def __handle_monsters(world: IGameWorld, player: IPlayer):
+        for monster in world.monsters_in_rect(player.sprite.rect):
+            if CollisionHandler.__is_alive(monster) and CollisionHandler.__collides_with(monster, player):
                 player.take_damage(monster.damage_amount)
 
     @staticmethod
-    def __handle_gems(gems: List[IExperienceGem], player: IPlayer, world: IGameWorld):
-        for gem in gems:
+    def __handle_gems(world: IGameWorld, player: IPlayer):
+        for gem in world.experience_gems_in_rect(player.sprite.rect):
             if CollisionHandler.__collides_with(gem, player):
                 player.pickup_gem(gem)
                 world.remove_experience_gem(gem)
 
     @staticmethod
-    def handle_collisions(world: IGameWorld):
+    def handle_collisions(world: IGameWorld, broad_phase: bool | None = None):
         """Handles collisions between entities in the game world.
 
         Args:
             world (IGameWorld): The game world.
+            broad_phase (bool | None): Whether bullets are only tested against nearby monsters.
+                The brute-force path is kept as a reference for verification.
+                Defaults to settings.COLLISION_BROAD_PHASE.
         """
-        CollisionHandler.__handle_bullets(world.bullets, world.monsters)
-        CollisionHandler.__handle_monsters(world.monsters, world.player)
-        CollisionHandler.__handle_gems(world.experience_gems, world.player, world)
+        if broad_phase is None:
+            broad_phase = settings.COLLISION_BROAD_PHASE
+
+        if broad_phase:
+            CollisionHandler.__handle_bullets(world.bullets, world)
+        else:
+            CollisionHandler.__handle_bullets_brute_force(world.bullets, world.monsters)
+        CollisionHandler.__handle_monsters(world, world.player)
+        CollisionHandler.__handle_gems(world, world.player)
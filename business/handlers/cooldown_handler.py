@@ -1,15 +1,24 @@
 """This module contains the CooldownHandler class."""
 
-import pygame
+from business.world.simulation_clock import SimulationClock
 
 
 class CooldownHandler:
-    """A handler for cooldowns."""
+    """A handler for cooldowns.
 
-    def __init__(self, cooldown_time: int):
-        self.__last_action_time = pygame.time.get_ticks()
+    The cooldown reads the time from a simulation clock. Without a clock it follows the active
+    clock, which is the clock of the world that is being simulated.
+    """
+
+    def __init__(self, cooldown_time: int, clock: SimulationClock | None = None):
+        self.__clock = clock
+        self.__last_action_time = self.__now()
         self.__cooldown_time = cooldown_time
 
+    def __now(self) -> int:
+        clock = self.__clock if self.__clock is not None else SimulationClock.active()
+        return clock.now
+
     def json_format(self):
         return {
             'last_action_time': self.__last_action_time,
@@ -18,9 +27,9 @@ class CooldownHandler:
 
     def is_action_ready(self):
         """Check if the action is ready to be performed."""
-        current_time = pygame.time.get_ticks()
+        current_time = self.__now()
         return current_time - self.__last_action_time >= self.__cooldown_time
 
     def put_on_cooldown(self):
         """Put the action on cooldown."""
-        self.__last_action_time = pygame.time.get_ticks()
+        self.__last_action_time = self.__now()
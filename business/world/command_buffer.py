@@ -0,0 +1,57 @@
+"""This module contains the CommandBuffer class."""
+
+
+class CommandBuffer:
+    """Queues entity spawns and despawns requested during a tick.
+
+    The commands are applied in the order they were queued when `apply` is called, which the
+    world does at one point of the tick. Until then every collection stays unchanged, so it can
+    be iterated while entities spawn and die.
+    """
+
+    def __init__(self):
+        self.__commands: list = []
+        self.__despawning: set = set()
+
+    def spawn(self, collection, entity):
+        """Queues an entity to be inserted into a collection.
+
+        Args:
+            collection (EntityCollection): The collection the entity joins.
+            entity (Entity): The entity to spawn.
+        """
+        self.__commands.append((collection.insert, entity))
+
+    def despawn(self, collection, entity) -> bool:
+        """Queues an entity to be removed from a collection.
+
+        Args:
+            collection (EntityCollection): The collection the entity leaves.
+            entity (Entity): The entity to despawn.
+
+        Returns:
+            bool: False if the entity was already queued for removal in this tick.
+        """
+        if entity in self.__despawning:
+            return False
+
+        self.__despawning.add(entity)
+        self.__commands.append((collection.discard, entity))
+        return True
+
+    def apply(self):
+        """Applies every queued command in order and empties the buffer."""
+        commands = self.__commands
+        self.__commands = []
+        self.__despawning.clear()
+
+        for command, entity in commands:
+            command(entity)
+
+    def clear(self):
+        """Drops every queued command."""
+        self.__commands.clear()
+        self.__despawning.clear()
+
+    def __len__(self):
+        return len(self.__commands)
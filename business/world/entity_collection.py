@@ -0,0 +1,110 @@
+"""This module contains the EntityCollection class."""
+
+from collections.abc import Iterator
+
+from business.entities.entity_pool import EntityPool
+from business.world.entity_view import EntityView
+from business.world.spatial_grid import SpatialHashGrid
+
+
+class EntityCollection:
+    """Dense storage for the entities of one kind.
+
+    Entities are kept in a packed list. Each inserted entity gets a stable handle, and the
+    collection maps handles to list positions. Removal moves the last entity into the hole,
+    so it takes constant time no matter how many entities there are.
+    """
+
+    def __init__(self, handles: Iterator[int], grid: SpatialHashGrid | None = None, store=None,
+                 recycle: bool = False):
+        """Creates an empty collection.
+
+        Args:
+            handles (Iterator[int]): The source of unique handles for inserted entities.
+            grid (SpatialHashGrid | None): A spatial index kept in sync with the collection.
+            store (MonsterStore | None): Column storage kept in sync with the collection.
+                It must also remove rows by moving the last one into the hole.
+            recycle (bool): Whether discarded entities are released into the EntityPool.
+        """
+        self.__entities: list = []
+        self.__index_by_handle: dict[int, int] = {}
+        self.__handles = handles
+        self.__grid = grid
+        self.__store = store
+        self.__recycle = recycle
+        self.__view = EntityView(self.__entities)
+
+    def insert(self, entity):
+        """Adds an entity and gives it a new handle.
+
+        Args:
+            entity (Entity): The entity to add.
+        """
+        entity.bind_handle(next(self.__handles))
+        self.__index_by_handle[entity.handle] = len(self.__entities)
+        self.__entities.append(entity)
+
+        if self.__store is not None:
+            self.__store.adopt(entity)
+        if self.__grid is not None:
+            self.__grid.insert(entity)
+
+    def discard(self, entity) -> bool:
+        """Removes an entity in constant time.
+
+        Args:
+            entity (Entity): The entity to remove.
+
+        Returns:
+            bool: False if the entity was not in the collection.
+        """
+        index = self.__index_by_handle.get(entity.handle)
+        if index is None or self.__entities[index] is not entity:
+            return False
+
+        del self.__index_by_handle[entity.handle]
+        last = self.__entities.pop()
+        if last is not entity:
+            self.__entities[index] = last
+            self.__index_by_handle[last.handle] = index
+
+        if self.__store is not None:
+            self.__store.remove(entity)
+        if self.__grid is not None:
+            self.__grid.remove(entity)
+        if self.__recycle:
+            EntityPool.release(entity)
+        return True
+
+    def get(self, handle: int):
+        """Gets the entity with a handle.
+
+        Args:
+            handle (int): The handle of the entity.
+
+        Returns:
+            Entity | None: The entity, or None if no entity in the collection has that handle.
+        """
+        index = self.__index_by_handle.get(handle)
+        return None if index is None else self.__entities[index]
+
+    def clear(self):
+        """Removes every entity."""
+        self.__entities.clear()
+        self.__index_by_handle.clear()
+
+        if self.__store is not None:
+            self.__store.clear()
+        if self.__grid is not None:
+            self.__grid.clear()
+
+    @property
+    def view(self) -> EntityView:
+        """A read-only view of the entities that does not copy them."""
+        return self.__view
+
+    def __contains__(self, entity):
+        return self.get(entity.handle) is entity
+
+    def __len__(self):
+        return len(self.__entities)
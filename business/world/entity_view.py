@@ -0,0 +1,29 @@
+"""This module contains the EntityView class."""
+
+from collections.abc import Sequence
+
+
+class EntityView(Sequence):
+    """A read-only view over a list of entities.
+
+    The view reads straight from the world's storage instead of copying it. The world defers
+    additions and removals until `apply_pending_changes`, so the view can be iterated while
+    entities are added or removed.
+    """
+
+    __slots__ = ('__items',)
+
+    def __init__(self, items: list):
+        self.__items = items
+
+    def __len__(self):
+        return len(self.__items)
+
+    def __getitem__(self, index):
+        return self.__items[index]
+
+    def __iter__(self):
+        return iter(self.__items)
+
+    def __repr__(self):
+        return f"EntityView({self.__items!r})"
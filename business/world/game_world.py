@@ -1,10 +1,22 @@
 """This module contains the implementation of the game world."""
+import itertools
 import random
+from collections.abc import Sequence
+import numpy as np
+import pygame
+import settings
 from business.entities.interfaces import IBullet, IExperienceGem, IMonster, IPlayer
 from business.world.interfaces import IGameWorld, IMonsterSpawner, ITileMap
+from business.world.command_buffer import CommandBuffer
+from business.world.entity_collection import EntityCollection
+from business.world.population_manager import PopulationManager
+from business.world.simulation_clock import SimulationClock
+from business.world.world_snapshot import WorldSnapshot
+from business.world.spatial_grid import SpatialHashGrid
 from business.handlers.cooldown_handler import CooldownHandler
 from business.entities.experience_gem import *
 from business.entities.monster import Monster
+from business.entities.monster_store import MonsterStore
 from business.entities.bullet import Bullet
 from business.entities.player import Player
 
@@ -12,14 +24,38 @@ from business.entities.player import Player
 class GameWorld(IGameWorld):
     """Represents the game world."""
 
-    def __init__(self, spawner: IMonsterSpawner, tile_map: ITileMap, player: IPlayer):
-        # Initialize the player and lists for monsters, bullets and gems
+    def __init__(self, spawner: IMonsterSpawner, tile_map: ITileMap, player: IPlayer, clock: SimulationClock | None = None):
+        # The world owns the simulation time, it starts where the previous clock stopped so that
+        # entities created before the world keep consistent cooldowns
+        self.__clock = clock if clock is not None else SimulationClock(SimulationClock.active().now)
+        self.__clock.activate()
+
+        # Initialize the player
         self.__player: IPlayer = player
-        self.__monsters: list[IMonster] = []
-        self.__bullets: list[IBullet] = []
-        self.__experience_gems: list[IExperienceGem] = []
-        self.__spawn_cooldown = CooldownHandler(2500)
-        self.__monster_levelup_cooldown = CooldownHandler(10000)
+        self.__spawn_cooldown = CooldownHandler(2500, self.__clock)
+        self.__gem_coalesce_cooldown = CooldownHandler(settings.GEM_COALESCE_INTERVAL_MS, self.__clock)
+        self.__coalesced_gem_count = 0
+        self.__gem_budget_met = True
+        self.__monster_levelup_cooldown = CooldownHandler(10000, self.__clock)
+
+        # Spatial indexes used to answer position queries without scanning every entity
+        self.__monster_grid = SpatialHashGrid(settings.SPATIAL_GRID_CELL_SIZE)
+        self.__bullet_grid = SpatialHashGrid(settings.SPATIAL_GRID_CELL_SIZE)
+        self.__experience_gem_grid = SpatialHashGrid(settings.SPATIAL_GRID_CELL_SIZE)
+
+        # Dense entity storage, monsters also keep their state in column arrays.
+        # Removed entities are recycled, so spawning reuses them instead of building new ones
+        handles = itertools.count(1)
+        self.__monster_store = MonsterStore()
+        self.__monsters = EntityCollection(handles, self.__monster_grid, self.__monster_store, recycle=True)
+        self.__bullets = EntityCollection(handles, self.__bullet_grid, recycle=True)
+        self.__experience_gems = EntityCollection(handles, self.__experience_gem_grid, recycle=True)
+
+        # Keeps the monster count under the cap and the monsters near the player
+        self.__population = PopulationManager(self.__monster_store, self.__clock)
+
+        # Spawns and despawns wait here until apply_pending_changes so readers can iterate safely
+        self.__commands = CommandBuffer()
 
         # Initialize the tile map
         self.tile_map: ITileMap = tile_map
@@ -29,16 +65,50 @@ class GameWorld(IGameWorld):
 
         # Timer
         self.__timer = 0
-        self.__timer_cooldown = CooldownHandler(1000)
+        self.__timer_cooldown = CooldownHandler(1000, self.__clock)
+
+    def __update_monsters(self):
+        store = self.__monster_store
+        monsters = store.monsters
+        player = self.__player
+
+        # Chase, attack and death checks run over every monster at once
+        moving = store.chase(player.pos_x, player.pos_y)
+        for row in store.changed_cells():
+            self.__monster_grid.update(monsters[row])
+
+        for row in store.attackers(player.pos_x, player.pos_y, self.__clock.now, moving):
+            player.take_damage(int(store.damage[row]))
+
+        for row in np.flatnonzero(store.flashing[:len(store)] & moving):
+            sprite = monsters[row].sprite
+            sprite.update()
+            store.flashing[row] = sprite.is_in_damage_countdown
+
+        for row in store.dead(moving):
+            self.remove_monster(monsters[row])
+
+        # The level-up cooldown is shared, so each time it is ready only the first monster levels up
+        if len(store) and self.__monster_levelup_cooldown.is_action_ready():
+            store.level_up(0, self.__timer // 10)
+            self.__monster_levelup_cooldown.put_on_cooldown()
+
+    def store_previous_positions(self):
+        self.__player.store_previous_position()
+        self.__monster_store.store_previous_positions()
+        for bullet in self.__bullets.view:
+            bullet.store_previous_position()
 
     def update(self):
+        self.__clock.activate()
+        self.__clock.advance(settings.SIMULATION_STEP_MS)
+
         self.player.update(self)
 
-        for monster in self.__monsters:
-            monster.update(self)
-            monster.levelup(self, self.__monster_levelup_cooldown)
+        self.__update_monsters()
+        self.__population.update(self.__player.pos_x, self.__player.pos_y)
 
-        for bullet in self.__bullets:
+        for bullet in self.__bullets.view:
             bullet.update(self)
 
         self.__monster_spawner.update(self)
@@ -47,46 +117,123 @@ class GameWorld(IGameWorld):
             self.__timer += 1
             self.__timer_cooldown.put_on_cooldown()
 
+    def apply_pending_changes(self):
+        self.__commands.apply()
+        self.__coalesce_experience_gems()
+
+    def __merge_experience_gems(self, radius: float) -> int:
+        # Plain experience gems absorb the ones around them, boost gems keep their type
+        merged = set()
+        for gem in list(self.__experience_gems.view):
+            if not gem.mergeable or gem in merged:
+                continue
+
+            for other in self.__experience_gem_grid.query_radius(gem.pos_x, gem.pos_y, radius):
+                if other is not gem and other.mergeable and other not in merged:
+                    gem.absorb(other.amount)
+                    merged.add(other)
+
+        # Nothing is pending after apply, so the merged gems leave the world right away
+        for gem in merged:
+            self.__experience_gems.discard(gem)
+        return len(merged)
+
+    def __coalesce_experience_gems(self):
+        gems = self.__experience_gems
+        cooldown_ready = self.__gem_coalesce_cooldown.is_action_ready()
+        # A budget that could not be met is only retried on the cooldown, not on every drop
+        if not cooldown_ready and (len(gems) == self.__coalesced_gem_count or not self.__gem_budget_met):
+            return
+
+        # Boost gems never merge, so only plain experience gems count against the budget
+        mergeable = sum(1 for gem in gems.view if gem.mergeable)
+        self.__coalesced_gem_count = len(gems)
+        if not cooldown_ready and mergeable <= settings.GEM_BUDGET:
+            return
+
+        radius = settings.GEM_MERGE_RADIUS
+        mergeable -= self.__merge_experience_gems(radius)
+
+        # Over the budget the merge distance doubles, but never past a local limit
+        while mergeable > settings.GEM_BUDGET and radius < settings.GEM_MERGE_MAX_RADIUS:
+            radius = min(radius * 2, settings.GEM_MERGE_MAX_RADIUS)
+            mergeable -= self.__merge_experience_gems(radius)
+
+        self.__gem_budget_met = mergeable <= settings.GEM_BUDGET
+        self.__coalesced_gem_count = len(gems)
+        self.__gem_coalesce_cooldown.put_on_cooldown()
+
     def add_monster(self, monster: IMonster):
         if not self.__spawn_cooldown:
             return
 
-        self.__monsters.append(monster)
+        self.__commands.spawn(self.__monsters, monster)
 
     def remove_monster(self, monster: IMonster):
-        self.__monsters.remove(monster)
+        if not self.__commands.despawn(self.__monsters, monster):
+            return
 
         # Genera un número aleatorio entre 0 y 100
         probability = random.uniform(0, 100)
         if probability <= 20:
             pass  # Esto se puede modificar es un posibilidad de que algunos enemigos no suelten gema al matarlos
         elif 20 < probability <= 75:
-            self.add_experience_gem(ExperienceGem(
+            self.add_experience_gem(ExperienceGem.acquire(
                 monster.pos_x, monster.pos_y, 1))
         elif 75 < probability <= 80:
+            # Boost and duration follow the amount, in the order of the constructor
             self.add_experience_gem(
-                SpeedGem(monster.pos_x, monster.pos_y, 1, speed_boost=10, duration=5))
+                SpeedGem.acquire(monster.pos_x, monster.pos_y, 1, 10, 5))
         elif 80 < probability <= 85:
             self.add_experience_gem(
-                DamageGem(monster.pos_x, monster.pos_y, 1, damage_boost=5, duration=5))
+                DamageGem.acquire(monster.pos_x, monster.pos_y, 1, 5, 5))
         elif 85 < probability <= 90:
-            self.add_experience_gem(DefenceGem(
-                monster.pos_x, monster.pos_y, 1, defence_boost=3, duration=5))
+            self.add_experience_gem(DefenceGem.acquire(
+                monster.pos_x, monster.pos_y, 1, 3, 5))
         else:
             self.add_experience_gem(
-                HealthGem(monster.pos_x, monster.pos_y, 1, health_boost=25, duration=5))
+                HealthGem.acquire(monster.pos_x, monster.pos_y, 1, 25, 5))
 
     def add_experience_gem(self, gem: IExperienceGem):
-        self.__experience_gems.append(gem)
+        self.__commands.spawn(self.__experience_gems, gem)
 
     def remove_experience_gem(self, gem: IExperienceGem):
-        self.__experience_gems.remove(gem)
+        self.__commands.despawn(self.__experience_gems, gem)
 
     def add_bullet(self, bullet: IBullet):
-        self.__bullets.append(bullet)
+        self.__commands.spawn(self.__bullets, bullet)
 
     def remove_bullet(self, bullet: IBullet):
-        self.__bullets.remove(bullet)
+        self.__commands.despawn(self.__bullets, bullet)
+
+    def monsters_in_rect(self, rect: pygame.Rect) -> list[IMonster]:
+        return self.__monster_grid.query_rect(rect)
+
+    def monsters_in_radius(self, pos_x: float, pos_y: float, radius: float) -> list[IMonster]:
+        return self.__monster_grid.query_radius(pos_x, pos_y, radius)
+
+    def nearest_monster(self, pos_x: float, pos_y: float, max_distance: float | None = None) -> IMonster | None:
+        return self.__monster_grid.nearest(pos_x, pos_y, max_distance)
+
+    def get_monster(self, handle: int) -> IMonster | None:
+        return self.__monsters.get(handle)
+
+    def bullets_in_rect(self, rect: pygame.Rect) -> list[IBullet]:
+        return self.__bullet_grid.query_rect(rect)
+
+    def experience_gems_in_rect(self, rect: pygame.Rect) -> list[IExperienceGem]:
+        return self.__experience_gem_grid.query_rect(rect)
+
+    def snapshot(self) -> WorldSnapshot:
+        store = self.__monster_store
+        return WorldSnapshot(
+            self.__player.json_format(),
+            self.__timer,
+            store.snapshot(),
+            [(monster.handle, monster.monster_type) for monster in store.monsters],
+            [(bullet.handle, bullet.__class__.__name__, bullet.json_format()) for bullet in self.__bullets.view],
+            [(gem.handle, gem.__class__.__name__, gem.json_format()) for gem in self.__experience_gems.view],
+        )
 
     def clear_all_entities(self):
         """Clears all entities from the world."""
@@ -94,6 +241,7 @@ class GameWorld(IGameWorld):
         self.__monsters.clear()
         self.__bullets.clear()
         self.__experience_gems.clear()
+        self.__commands.clear()
 
     def load_game_data(self, game_data: dict) -> None:
         """Loads game data into the world."""
@@ -135,22 +283,32 @@ class GameWorld(IGameWorld):
         # Set timer
         self.__timer = game_data['timer']
 
+        self.apply_pending_changes()
+
     @property
     def player(self) -> IPlayer:
         return self.__player
 
     @property
-    def monsters(self) -> list[IMonster]:
-        return self.__monsters[:]
+    def monsters(self) -> Sequence[IMonster]:
+        return self.__monsters.view
 
     @property
-    def bullets(self) -> list[IBullet]:
-        return self.__bullets[:]
+    def bullets(self) -> Sequence[IBullet]:
+        return self.__bullets.view
 
     @property
-    def experience_gems(self) -> list[IExperienceGem]:
-        return self.__experience_gems[:]
+    def experience_gems(self) -> Sequence[IExperienceGem]:
+        return self.__experience_gems.view
 
     @property
     def timer(self) -> int:
         return self.__timer
+
+    @property
+    def clock(self) -> SimulationClock:
+        return self.__clock
+
+    @property
+    def population(self) -> PopulationManager:
+        return self.__population
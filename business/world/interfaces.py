@@ -1,8 +1,56 @@
 """This module contains interfaces for the game world."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+import pygame
 
 from business.entities.interfaces import IBullet, IExperienceGem, IMonster, IPlayer
+from business.world.simulation_clock import SimulationClock
+from business.world.world_snapshot import WorldSnapshot
+
+
+class IPopulationManager(ABC):
+    """Interface for the manager that keeps the monster population bounded."""
+
+    @abstractmethod
+    def relocate_farthest(self, player_x: float, player_y: float) -> bool:
+        """Moves the farthest off-screen monster next to the view.
+
+        Args:
+            player_x (float): The x-coordinate of the player.
+            player_y (float): The y-coordinate of the player.
+
+        Returns:
+            bool: False if every monster is on screen, then nothing moves.
+        """
+
+    @property
+    @abstractmethod
+    def at_capacity(self) -> bool:
+        """Whether the population reached the monster cap.
+
+        Returns:
+            bool: True if spawning must move a monster instead of adding one.
+        """
+
+    @property
+    @abstractmethod
+    def population(self) -> int:
+        """The number of monsters in the world.
+
+        Returns:
+            int: The number of monsters.
+        """
+
+    @property
+    @abstractmethod
+    def metrics(self) -> dict:
+        """The population counters, for logs and benchmarks.
+
+        Returns:
+            dict: The population, the cap and the number of relocations.
+        """
 
 
 class IGameWorld(ABC):
@@ -59,10 +107,95 @@ class IGameWorld(ABC):
             bullet (IBullet): The bullet to remove.
         """
 
+    @abstractmethod
+    def monsters_in_rect(self, rect: pygame.Rect) -> list[IMonster]:
+        """Gets the monsters that may overlap a rectangle, using the spatial index.
+
+        Args:
+            rect (pygame.Rect): The rectangle in world coordinates.
+
+        Returns:
+            list[IMonster]: The candidate monsters. Callers still test the exact sprite rect.
+        """
+
+    @abstractmethod
+    def monsters_in_radius(self, pos_x: float, pos_y: float, radius: float) -> list[IMonster]:
+        """Gets the monsters whose position lies within a radius of a point.
+
+        Args:
+            pos_x (float): The x-coordinate of the centre.
+            pos_y (float): The y-coordinate of the centre.
+            radius (float): The search radius.
+
+        Returns:
+            list[IMonster]: The monsters within the radius.
+        """
+
+    @abstractmethod
+    def nearest_monster(self, pos_x: float, pos_y: float, max_distance: float | None = None) -> IMonster | None:
+        """Gets the monster closest to a point.
+
+        Args:
+            pos_x (float): The x-coordinate of the point.
+            pos_y (float): The y-coordinate of the point.
+            max_distance (float | None): Ignore monsters farther away than this.
+
+        Returns:
+            IMonster | None: The closest monster, or None if there is none.
+        """
+
+    @abstractmethod
+    def get_monster(self, handle: int) -> IMonster | None:
+        """Gets a monster by its handle.
+
+        Args:
+            handle (int): The handle of the monster.
+
+        Returns:
+            IMonster | None: The monster, or None if it is no longer in the world.
+        """
+
+    @abstractmethod
+    def bullets_in_rect(self, rect: pygame.Rect) -> list[IBullet]:
+        """Gets the bullets that may overlap a rectangle, using the spatial index.
+
+        Args:
+            rect (pygame.Rect): The rectangle in world coordinates.
+
+        Returns:
+            list[IBullet]: The candidate bullets.
+        """
+
+    @abstractmethod
+    def experience_gems_in_rect(self, rect: pygame.Rect) -> list[IExperienceGem]:
+        """Gets the experience gems that may overlap a rectangle, using the spatial index.
+
+        Args:
+            rect (pygame.Rect): The rectangle in world coordinates.
+
+        Returns:
+            list[IExperienceGem]: The candidate experience gems.
+        """
+
     @abstractmethod
     def update(self):
         """Updates the state of the world and all updatable entities within it."""
 
+    @abstractmethod
+    def store_previous_positions(self):
+        """Remembers where every moving entity is before a simulation step.
+
+        Rendering interpolates between these positions and the current ones.
+        """
+
+    @abstractmethod
+    def apply_pending_changes(self):
+        """Applies the additions and removals requested since the last call.
+
+        Entities added or removed during a tick only enter or leave the world here, so
+        readers can iterate the entity views while the tick adds and removes entities.
+        """
+
     @property
     @abstractmethod
     def player(self) -> IPlayer:
@@ -74,29 +207,29 @@ class IGameWorld(ABC):
 
     @property
     @abstractmethod
-    def monsters(self) -> list[IMonster]:
-        """Gets the list of monsters in the world.
+    def monsters(self) -> Sequence[IMonster]:
+        """Gets the monsters in the world.
 
         Returns:
-            list[IMonster]: A copy of the list of monsters in the world.
+            Sequence[IMonster]: A read-only view of the monsters in the world.
         """
 
     @property
     @abstractmethod
-    def bullets(self) -> list[IBullet]:
-        """Gets the list of bullets in the world.
+    def bullets(self) -> Sequence[IBullet]:
+        """Gets the bullets in the world.
 
         Returns:
-            list[IBullet]: A copy of the list of bullets in the world.
+            Sequence[IBullet]: A read-only view of the bullets in the world.
         """
 
     @property
     @abstractmethod
-    def experience_gems(self) -> list[IExperienceGem]:
-        """Gets the list of experience gems in the world.
+    def experience_gems(self) -> Sequence[IExperienceGem]:
+        """Gets the experience gems in the world.
 
         Returns:
-            list[IExperienceGem]: A copy of the list of experience gems in the world.
+            Sequence[IExperienceGem]: A read-only view of the experience gems in the world.
         """
 
     @property
@@ -108,6 +241,32 @@ class IGameWorld(ABC):
             int: Number of seconds elapsed in game
         """
 
+    @property
+    @abstractmethod
+    def clock(self) -> SimulationClock:
+        """Gets the simulation clock, advanced once per world update.
+
+        Returns:
+            SimulationClock: The clock that cooldowns and timers read.
+        """
+
+    @property
+    @abstractmethod
+    def population(self) -> IPopulationManager:
+        """Gets the manager that bounds the monster population.
+
+        Returns:
+            IPopulationManager: The population manager, which also keeps the population metrics.
+        """
+
+    @abstractmethod
+    def snapshot(self) -> WorldSnapshot:
+        """Copies the state of the world, to save it without holding up the game.
+
+        Returns:
+            WorldSnapshot: The copy, it does not change when the world does.
+        """
+
     @abstractmethod
     def clear_all_entities(self):
         """Clears all entities from the world."""
@@ -165,3 +324,22 @@ class ITileMap(ABC):
         Returns:
             int: The tile at the specified row and column.
         """
+
+    @abstractmethod
+    def set(self, row, col, tile: int):
+        """Sets the tile at the specified row and column.
+
+        Args:
+            row (int): The row of the tile.
+            col (int): The column of the tile.
+            tile (int): The new tile.
+        """
+
+    @property
+    @abstractmethod
+    def version(self) -> int:
+        """Gets a number that changes every time a tile changes.
+
+        Returns:
+            int: The version of the tile map.
+        """
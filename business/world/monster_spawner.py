@@ -9,7 +9,6 @@ import settings
 from business.entities.monster import Monster
 from business.world.interfaces import IGameWorld, IMonsterSpawner
 from business.handlers.cooldown_handler import CooldownHandler
-from presentation.sprite import ZombieSprite, SkeletonSprite, OrcSprite, WerewolfSprite
 from business.entities.monster_factory import MonsterFactory
 
 BASE_COOLDOWN = 800
@@ -30,25 +29,15 @@ class MonsterSpawner(IMonsterSpawner):
         self.__spawn_cooldown.put_on_cooldown()
 
     def spawn_monster(self, world: IGameWorld):
+        # At the cap a far away monster comes back instead of a new one joining
+        if world.population.at_capacity:
+            world.population.relocate_farthest(world.player.pos_x, world.player.pos_y)
+            return
+
         pos_x = random.randint(0, settings.WORLD_WIDTH)
         pos_y = random.randint(0, settings.WORLD_HEIGHT)
-        monster_type = random.randint(0, 3)
-
-        if monster_type == 0:
-            mob_type = "zombie"
-            sprite = ZombieSprite(pos_x, pos_y)
-            monster = self.__monster_factory.create_monster(pos_x, pos_y, sprite, mob_type)
-        if monster_type == 1:
-            mob_type = "skeleton"
-            sprite = SkeletonSprite(pos_x, pos_y)
-            monster = self.__monster_factory.create_monster(pos_x, pos_y, sprite, mob_type)
-        if monster_type == 2:
-            mob_type = "orc"
-            sprite = OrcSprite(pos_x, pos_y)
-            monster = self.__monster_factory.create_monster(pos_x, pos_y, sprite, mob_type)
-        if monster_type == 3:
-            mob_type = "werewolf"
-            sprite = WerewolfSprite(pos_x, pos_y)
-            monster = self.__monster_factory.create_monster(pos_x, pos_y, sprite, mob_type)
+        mob_type = ("zombie", "skeleton", "orc", "werewolf")[random.randint(0, 3)]
 
+        # Monsters killed earlier are reused instead of building a new monster and sprite
+        monster = self.__monster_factory.acquire_monster(pos_x, pos_y, mob_type)
         world.add_monster(monster)
@@ -0,0 +1,137 @@
+"""This module contains the PopulationManager class."""
+
+import random
+
+import numpy as np
+
+import settings
+from business.entities.monster_store import MonsterStore
+from business.handlers.cooldown_handler import CooldownHandler
+from business.world.interfaces import IPopulationManager
+from business.world.simulation_clock import SimulationClock
+
+
+class PopulationManager(IPopulationManager):
+    """Keeps the monster population bounded and around the player.
+
+    Once `settings.MONSTER_CAP` monsters are alive, a spawn moves the farthest off-screen
+    monster next to the view instead of adding a new one. Off-screen monsters that wander
+    farther than `settings.MONSTER_RELOCATE_DISTANCE` from the player are moved back the same
+    way, so every monster keeps chasing the player from close by.
+    """
+
+    def __init__(self, store: MonsterStore, clock: SimulationClock | None = None):
+        self.__store = store
+        self.__check_cooldown = CooldownHandler(settings.POPULATION_CHECK_INTERVAL_MS, clock)
+        self.__relocated = 0
+
+    @staticmethod
+    def __view(player_x: float, player_y: float) -> tuple[int, int, int, int]:
+        # The area the camera shows, clamped to the world the same way the camera is
+        left = max(0, min(int(player_x) - settings.SCREEN_WIDTH // 2, settings.WORLD_WIDTH - settings.SCREEN_WIDTH))
+        top = max(0, min(int(player_y) - settings.SCREEN_HEIGHT // 2, settings.WORLD_HEIGHT - settings.SCREEN_HEIGHT))
+        return left, top, left + settings.SCREEN_WIDTH, top + settings.SCREEN_HEIGHT
+
+    @staticmethod
+    def spawn_position(player_x: float, player_y: float) -> tuple[float, float]:
+        """Gets a random position just outside the view, inside the world when possible.
+
+        Args:
+            player_x (float): The x-coordinate of the player.
+            player_y (float): The y-coordinate of the player.
+
+        Returns:
+            tuple[float, float]: The position.
+        """
+        left, top, right, bottom = PopulationManager.__view(player_x, player_y)
+        margin = settings.MONSTER_RELOCATE_MARGIN
+        left, top, right, bottom = left - margin, top - margin, right + margin, bottom + margin
+
+        sides = [
+            (left, random.uniform(top, bottom)),
+            (right, random.uniform(top, bottom)),
+            (random.uniform(left, right), top),
+            (random.uniform(left, right), bottom),
+        ]
+        random.shuffle(sides)
+        for pos_x, pos_y in sides:
+            if 0 <= pos_x <= settings.WORLD_WIDTH and 0 <= pos_y <= settings.WORLD_HEIGHT:
+                return pos_x, pos_y
+
+        # The view covers the whole world, the closest spot on its border will do
+        pos_x, pos_y = sides[0]
+        return min(max(pos_x, 0), settings.WORLD_WIDTH), min(max(pos_y, 0), settings.WORLD_HEIGHT)
+
+    def __offscreen_distances(self, player_x: float, player_y: float) -> np.ndarray:
+        # Distance of every monster to the player, monsters on screen get -1
+        store = self.__store
+        count = len(store)
+        pos_x, pos_y = store.pos_x[:count], store.pos_y[:count]
+        left, top, right, bottom = PopulationManager.__view(player_x, player_y)
+
+        offscreen = (pos_x < left) | (pos_x > right) | (pos_y < top) | (pos_y > bottom)
+        return np.where(offscreen, np.hypot(pos_x - player_x, pos_y - player_y), -1.0)
+
+    def __relocate(self, row: int, player_x: float, player_y: float):
+        self.__store.monsters[row].relocate(*PopulationManager.spawn_position(player_x, player_y))
+        self.__relocated += 1
+
+    def relocate_farthest(self, player_x: float, player_y: float) -> bool:
+        """Moves the farthest off-screen monster next to the view.
+
+        Args:
+            player_x (float): The x-coordinate of the player.
+            player_y (float): The y-coordinate of the player.
+
+        Returns:
+            bool: False if every monster is on screen, then nothing moves.
+        """
+        if len(self.__store) == 0:
+            return False
+
+        distances = self.__offscreen_distances(player_x, player_y)
+        row = int(np.argmax(distances))
+        if distances[row] < 0:
+            return False
+
+        self.__relocate(row, player_x, player_y)
+        return True
+
+    def update(self, player_x: float, player_y: float):
+        """Moves the off-screen monsters that strayed too far from the player back next to the view.
+
+        Args:
+            player_x (float): The x-coordinate of the player.
+            player_y (float): The y-coordinate of the player.
+        """
+        if not self.__check_cooldown.is_action_ready():
+            return
+
+        distances = self.__offscreen_distances(player_x, player_y)
+        for row in np.flatnonzero(distances > settings.MONSTER_RELOCATE_DISTANCE):
+            self.__relocate(int(row), player_x, player_y)
+        self.__check_cooldown.put_on_cooldown()
+
+    @property
+    def at_capacity(self) -> bool:
+        """Whether the population reached the monster cap."""
+        return len(self.__store) >= settings.MONSTER_CAP
+
+    @property
+    def population(self) -> int:
+        """The number of monsters in the world."""
+        return len(self.__store)
+
+    @property
+    def relocated(self) -> int:
+        """The number of times a monster was moved back next to the view."""
+        return self.__relocated
+
+    @property
+    def metrics(self) -> dict:
+        """The population counters, for logs and benchmarks."""
+        return {
+            'population': self.population,
+            'capacity': settings.MONSTER_CAP,
+            'relocated': self.__relocated,
+        }
@@ -0,0 +1,22 @@
+"""This module contains the Simulation class."""
+
+from business.handlers.collision_handler import CollisionHandler
+from business.handlers.death_handler import DeathHandler
+from business.world.interfaces import IGameWorld
+
+
+class Simulation:
+    """Advances a game world by fixed simulation steps."""
+
+    @staticmethod
+    def step(world: IGameWorld):
+        """Runs one simulation step: updates the world, resolves collisions and deaths and
+        applies the spawns and despawns they requested.
+
+        Args:
+            world (IGameWorld): The game world to advance.
+        """
+        world.update()
+        CollisionHandler.handle_collisions(world)
+        DeathHandler.check_deaths(world)
+        world.apply_pending_changes()
@@ -0,0 +1,46 @@
+"""This module contains the SimulationClock class."""
+
+
+class SimulationClock:
+    """The time of the simulation, in milliseconds.
+
+    The clock only moves when the world advances it, once per simulation step, so cooldowns and
+    timers follow the simulation instead of the wall clock. This lets the game run faster than
+    realtime and makes runs reproducible.
+
+    Objects that can not be handed a clock, like the ones created before the world that owns
+    it, read the active clock instead.
+    """
+
+    __active: "SimulationClock | None" = None
+
+    def __init__(self, start: float = 0):
+        self.__now = start
+
+    @staticmethod
+    def active() -> "SimulationClock":
+        """Gets the clock that is currently driving the simulation.
+
+        Returns:
+            SimulationClock: The active clock, a new one is activated if there is none yet.
+        """
+        if SimulationClock.__active is None:
+            SimulationClock.__active = SimulationClock()
+        return SimulationClock.__active
+
+    def activate(self):
+        """Makes this clock the active clock."""
+        SimulationClock.__active = self
+
+    def advance(self, milliseconds: float):
+        """Moves the clock forward.
+
+        Args:
+            milliseconds (float): The time that passed in the simulation.
+        """
+        self.__now += milliseconds
+
+    @property
+    def now(self) -> int:
+        """The current simulation time in whole milliseconds."""
+        return int(self.__now)
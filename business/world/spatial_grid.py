@@ -0,0 +1,206 @@
+"""This module contains the SpatialHashGrid class."""
+
+import math
+
+import pygame
+
+
+class SpatialHashGrid:
+    """A uniform spatial hash grid that buckets entities by the cell containing their position.
+
+    Entities are bucketed by their centre. Rect queries are widened by the largest sprite
+    half extent seen so far, so entities whose sprite crosses a cell border are still found.
+    """
+
+    def __init__(self, cell_size: int):
+        self.__cell_size = cell_size
+        self.__buckets: dict[tuple[int, int], set] = {}
+        self.__cells: dict = {}
+        self.__max_half_extent = 0
+
+        # Bounds of the cells that have been occupied, used to stop the nearest-neighbour search
+        self.__min_col = self.__min_row = math.inf
+        self.__max_col = self.__max_row = -math.inf
+
+    def cell_of(self, pos_x: float, pos_y: float) -> tuple[int, int]:
+        """Gets the cell containing a position.
+
+        Args:
+            pos_x (float): The x-coordinate.
+            pos_y (float): The y-coordinate.
+
+        Returns:
+            tuple[int, int]: The (column, row) of the cell.
+        """
+        return int(pos_x // self.__cell_size), int(pos_y // self.__cell_size)
+
+    def __expand_bounds(self, cell: tuple[int, int]):
+        col, row = cell
+        self.__min_col = min(self.__min_col, col)
+        self.__max_col = max(self.__max_col, col)
+        self.__min_row = min(self.__min_row, row)
+        self.__max_row = max(self.__max_row, row)
+
+    def __add_to_bucket(self, entity, cell: tuple[int, int]):
+        bucket = self.__buckets.get(cell)
+        if bucket is None:
+            bucket = self.__buckets[cell] = set()
+            self.__expand_bounds(cell)
+        bucket.add(entity)
+        self.__cells[entity] = cell
+
+    def __remove_from_bucket(self, entity, cell: tuple[int, int]):
+        bucket = self.__buckets[cell]
+        bucket.discard(entity)
+        if not bucket:
+            del self.__buckets[cell]
+
+    def insert(self, entity):
+        """Adds an entity to the grid and binds the grid to it so it is kept up to date as it moves.
+
+        Args:
+            entity (Entity): The entity to add.
+        """
+        rect = entity.sprite.rect
+        self.__max_half_extent = max(self.__max_half_extent, rect.width // 2 + 1, rect.height // 2 + 1)
+        self.__add_to_bucket(entity, self.cell_of(entity.pos_x, entity.pos_y))
+        entity.bind_spatial_grid(self)
+
+    def remove(self, entity):
+        """Removes an entity from the grid.
+
+        Args:
+            entity (Entity): The entity to remove.
+        """
+        cell = self.__cells.pop(entity, None)
+        if cell is None:
+            return
+        self.__remove_from_bucket(entity, cell)
+        entity.bind_spatial_grid(None)
+
+    def update(self, entity):
+        """Moves an entity to the cell matching its current position.
+
+        Args:
+            entity (Entity): The entity that moved.
+        """
+        old_cell = self.__cells.get(entity)
+        if old_cell is None:
+            return
+
+        new_cell = self.cell_of(entity.pos_x, entity.pos_y)
+        if new_cell != old_cell:
+            self.__remove_from_bucket(entity, old_cell)
+            self.__add_to_bucket(entity, new_cell)
+
+    def clear(self):
+        """Removes every entity from the grid."""
+        for entity in self.__cells:
+            entity.bind_spatial_grid(None)
+        self.__cells.clear()
+        self.__buckets.clear()
+
+    def __len__(self):
+        return len(self.__cells)
+
+    def query_rect(self, rect: pygame.Rect) -> list:
+        """Gets the entities whose cell may overlap a rectangle.
+
+        This is a broad-phase query: callers still need an exact test against the sprite rect.
+
+        Args:
+            rect (pygame.Rect): The rectangle to query.
+
+        Returns:
+            list: The candidate entities.
+        """
+        margin = self.__max_half_extent
+        min_col, min_row = self.cell_of(rect.left - margin, rect.top - margin)
+        max_col, max_row = self.cell_of(rect.right + margin, rect.bottom + margin)
+
+        candidates = []
+        buckets = self.__buckets
+        if (max_col - min_col + 1) * (max_row - min_row + 1) > len(buckets):
+            # The query covers more cells than are occupied, walk the occupied ones instead
+            for (col, row), bucket in buckets.items():
+                if min_col <= col <= max_col and min_row <= row <= max_row:
+                    candidates.extend(bucket)
+            return candidates
+
+        for col in range(min_col, max_col + 1):
+            for row in range(min_row, max_row + 1):
+                bucket = buckets.get((col, row))
+                if bucket:
+                    candidates.extend(bucket)
+        return candidates
+
+    def query_radius(self, pos_x: float, pos_y: float, radius: float) -> list:
+        """Gets the entities whose position lies within a radius of a point.
+
+        Args:
+            pos_x (float): The x-coordinate of the centre.
+            pos_y (float): The y-coordinate of the centre.
+            radius (float): The search radius.
+
+        Returns:
+            list: The entities within the radius.
+        """
+        min_col, min_row = self.cell_of(pos_x - radius, pos_y - radius)
+        max_col, max_row = self.cell_of(pos_x + radius, pos_y + radius)
+        radius_squared = radius * radius
+
+        found = []
+        for col in range(min_col, max_col + 1):
+            for row in range(min_row, max_row + 1):
+                for entity in self.__buckets.get((col, row), ()):
+                    if (entity.pos_x - pos_x) ** 2 + (entity.pos_y - pos_y) ** 2 <= radius_squared:
+                        found.append(entity)
+        return found
+
+    def __ring(self, col: int, row: int, ring: int):
+        if ring == 0:
+            yield col, row
+            return
+
+        for ring_col in range(col - ring, col + ring + 1):
+            yield ring_col, row - ring
+            yield ring_col, row + ring
+        for ring_row in range(row - ring + 1, row + ring):
+            yield col - ring, ring_row
+            yield col + ring, ring_row
+
+    def nearest(self, pos_x: float, pos_y: float, max_distance: float | None = None):
+        """Gets the entity closest to a point using a ring search around its cell.
+
+        Args:
+            pos_x (float): The x-coordinate of the point.
+            pos_y (float): The y-coordinate of the point.
+            max_distance (float | None): Ignore entities farther away than this.
+
+        Returns:
+            Entity | None: The closest entity, or None if there is none in range.
+        """
+        if not self.__cells:
+            return None
+
+        col, row = self.cell_of(pos_x, pos_y)
+        last_ring = max(col - self.__min_col, self.__max_col - col,
+                        row - self.__min_row, self.__max_row - row)
+        best_distance_squared = math.inf
+        if max_distance is not None:
+            last_ring = min(last_ring, int(max_distance // self.__cell_size) + 1)
+            best_distance_squared = max_distance * max_distance
+
+        best = None
+        for ring in range(int(last_ring) + 1):
+            for cell in self.__ring(col, row, ring):
+                for entity in self.__buckets.get(cell, ()):
+                    distance_squared = (entity.pos_x - pos_x) ** 2 + (entity.pos_y - pos_y) ** 2
+                    if distance_squared < best_distance_squared:
+                        best, best_distance_squared = entity, distance_squared
+
+            # Anything in the next ring is at least `ring` cells away
+            if best is not None and best_distance_squared <= (ring * self.__cell_size) ** 2:
+                break
+
+        return best
@@ -0,0 +1,83 @@
+"""This module contains the WorldSnapshot class."""
+
+from business.entities.monster_store import MonsterStore
+
+
+class WorldSnapshot:
+    """A copy of the world state taken between simulation steps.
+
+    Taking the snapshot only copies what it needs on the game thread: the monster columns are
+    copied in bulk and the few other entities are formatted right away. Nothing in it is shared
+    with the world, so it can be turned into game data on another thread while the game goes on.
+
+    Every entity keeps its world handle, so saves can tell which entities changed since the
+    previous snapshot.
+    """
+
+    def __init__(self, player: dict, timer: int, monsters: MonsterStore, monster_keys: list[tuple[int, str]],
+                 bullets: list[tuple[int, str, dict]], gems: list[tuple[int, str, dict]]):
+        """Initializes the snapshot.
+
+        Args:
+            player (dict): The JSON data of the player.
+            timer (int): The in-game seconds elapsed.
+            monsters (MonsterStore): A copy of the monster store, see `MonsterStore.snapshot`.
+            monster_keys (list[tuple[int, str]]): The handle and type of the monster in each row.
+            bullets (list[tuple[int, str, dict]]): The handle, class name and JSON data of each bullet.
+            gems (list[tuple[int, str, dict]]): The handle, class name and JSON data of each gem.
+        """
+        self.__player = player
+        self.__timer = timer
+        self.__monsters = monsters
+        self.__monster_keys = monster_keys
+        self.__bullets = bullets
+        self.__gems = gems
+
+    def __monster_records(self) -> list[tuple[int, str, dict]]:
+        # Every monster is a Monster, whatever its type
+        return [(handle, 'Monster', self.__monsters.format_row(row, monster_type))
+                for row, (handle, monster_type) in enumerate(self.__monster_keys)]
+
+    @staticmethod
+    def __group(records: list[tuple[int, str, dict]]) -> dict:
+        groups: dict = {}
+        for _, class_name, record in records:
+            groups.setdefault(class_name, []).append(record)
+        return groups
+
+    def to_game_data(self) -> dict:
+        """Formats the snapshot as the game data the DAOs save.
+
+        Returns:
+            dict: The game data, in the same shape `IGameDAO.save_game` writes.
+        """
+        return {
+            'monsters': WorldSnapshot.__group(self.__monster_records()),
+            'bullets': WorldSnapshot.__group(self.__bullets),
+            'gems': WorldSnapshot.__group(self.__gems),
+            'player': self.__player,
+            'timer': self.__timer,
+        }
+
+    def entities(self) -> dict[int, tuple[str, str, dict]]:
+        """Formats every entity in the snapshot, keyed by its world handle.
+
+        Returns:
+            dict[int, tuple[str, str, dict]]: The save section, class name and JSON data of each entity.
+        """
+        entities = {}
+        for section, records in (('monsters', self.__monster_records()), ('bullets', self.__bullets),
+                                 ('gems', self.__gems)):
+            for handle, class_name, record in records:
+                entities[handle] = (section, class_name, record)
+        return entities
+
+    @property
+    def player(self) -> dict:
+        """The JSON data of the player."""
+        return self.__player
+
+    @property
+    def timer(self) -> int:
+        """The in-game seconds elapsed when the snapshot was taken."""
+        return self.__timer
@@ -3,16 +3,16 @@
 import pygame
 import settings
 from business.exceptions import DeadPlayerException
-from business.handlers.collision_handler import CollisionHandler
-from business.handlers.death_handler import DeathHandler
 from business.world.interfaces import IGameWorld
+from business.world.simulation import Simulation
 from presentation.interfaces import IDisplay, IInputHandler
 from presentation.pause_menu import PauseMenu
 from presentation.level_menu import NivelMenu
 from presentation.game_over_screen import GameOverScreen
 from presentation.player_stats import PlayerStatsContainer
 from business.entities.items import DictionaryClass
-from persistence.gamejsondao import GameWorldJsonDAO
+from persistence.autosaver import AutoSaver
+from persistence.dao_factory import GameDAOFactory
 
 
 class Game:
@@ -37,35 +37,87 @@ class Game:
         self.__is_game_over = False
         self.__is_paused = False
         self.__is_level_up_menu_active = False
-        self.start_ticks = pygame.time.get_ticks()  # Tiempo de inicio
+        # Menus are static, they are drawn and presented once until something changes
+        self.__menu_needs_redraw = True
+        self.start_ticks = self.__world.clock.now  # Tiempo de inicio
         self.elapsed_time = 0  # Tiempo transcurrido en segundos
         self.previous_level = self.__world.player.level
-        self.__dao = GameWorldJsonDAO()
+        self.__dao = GameDAOFactory.create()
+        self.__autosaver = AutoSaver(self.__dao, self.__world.clock)
         self.__loaded: bool = False
+        self.__accumulator: float = 0
         self.__restart_game_func = restart_game_func
 
+    def __is_in_menu(self) -> bool:
+        return self.__is_paused or self.__is_level_up_menu_active or self.__is_game_over
+
+    def __get_events(self) -> list:
+        if not self.__is_in_menu():
+            return pygame.event.get()
+
+        # Menus only change on input, so sleep until an event arrives instead of spinning
+        event = pygame.event.wait(settings.MENU_EVENT_TIMEOUT_MS)
+        events = [event] if event.type != pygame.NOEVENT else []  # pylint: disable=E1101
+        events.extend(pygame.event.get())
+
+        # Keep the frame clock running so the game does not try to catch up once the menu closes
+        self.__clock.tick()
+        return events
+
     def __process_game_events(self):
-        for event in pygame.event.get():
+        for event in self.__get_events():
             if event.type == pygame.QUIT:  # pylint: disable=E1101
                 self.__running = False
             elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                 self.__is_paused = not self.__is_paused
+                self.__menu_needs_redraw = True
             elif event.type == pygame.KEYDOWN and event.key == pygame.K_q:
                 self.__world.player.change_weapon('next')
             elif event.type == pygame.KEYDOWN and event.key == pygame.K_e:
                 self.__world.player.change_weapon('previous')
 
+    def __simulation_step(self):
+        self.__world.store_previous_positions()
+        self.__input_handler.process_input()
+        Simulation.step(self.__world)
+
+    def __advance_simulation(self) -> float:
+        """Runs the fixed simulation steps that fit in the time since the last frame.
+
+        Returns:
+            float: How far into the next step the simulation is, used to interpolate rendering.
+        """
+        step = settings.SIMULATION_STEP_MS
+        frame_time = min(self.__clock.tick(settings.FPS), settings.MAX_FRAME_TIME_MS)
+        self.__accumulator += frame_time * settings.TIME_SCALE
+
+        steps = 0
+        while self.__accumulator >= step and steps < settings.MAX_SIMULATION_STEPS_PER_FRAME:
+            self.__simulation_step()
+            self.__accumulator -= step
+            steps += 1
+
+        if self.__accumulator >= step:
+            # The simulation fell behind, drop the backlog instead of spiralling further
+            self.__accumulator %= step
+
+        return self.__accumulator / step
+
     def save_game(self):
         """Saves the current game state using the DAO."""
+        self.__autosaver.wait()
         self.__dao.save_game(self.__world)
 
     def load_game(self):
         """Loads the game state using the DAO."""
+        self.__autosaver.wait()
         self.__dao.load_game(self.__world)
 
     def __handle_game_over_screen(self):
-        self.__game_over.draw()
-        pygame.display.flip()
+        if self.__menu_needs_redraw:
+            self.__game_over.draw()
+            self.__display.present_screen()
+            self.__menu_needs_redraw = False
 
         if pygame.mouse.get_pressed()[0]:
             action = self.__game_over.check_click(
@@ -76,17 +128,19 @@ class Game:
                 self.__running = False
 
     def __handle_pause_menu(self, display: IDisplay):
-        self.__player_stats = PlayerStatsContainer(
-            display.screen, self.__world.player.mostrar_estadisticas())
-        self.__pause_menu.draw()
-        self.__player_stats.draw()
-        pygame.display.flip()
+        if self.__menu_needs_redraw:
+            self.__player_stats.update_stats(self.__world.player.mostrar_estadisticas())
+            self.__pause_menu.draw()
+            self.__player_stats.draw()
+            display.present_screen()
+            self.__menu_needs_redraw = False
 
         if pygame.mouse.get_pressed()[0]:
             keys = pygame.key.get_pressed()
             action = self.__pause_menu.check_click(pygame.mouse.get_pos())
             if action == "r":
                 self.__is_paused = False
+                self.__menu_needs_redraw = True
 
             elif action == "q":
                 self.__running = False
@@ -96,6 +150,7 @@ class Game:
 
             elif keys[pygame.K_ESCAPE]:
                 self.__is_paused = False
+                self.__menu_needs_redraw = True
 
     def __handle_level_up_menu(self):
         if not self.__items_inicializados:
@@ -132,8 +187,9 @@ class Game:
         diccionario_items = Diccionario_Clases.select_random_items()
         item_cards = self.__level_menu.colocar_items(diccionario_items)
         self.__level_menu.draw(item_cards)
+        self.__player_stats.update_stats(self.__world.player.mostrar_estadisticas())
         self.__player_stats.draw()
-        pygame.display.flip()
+        self.__display.present_screen()
         self.__items_inicializados = True  # Marcar como inicializado
         return diccionario_items
 
@@ -145,10 +201,14 @@ class Game:
 
     def run(self):
         """Starts the game loop."""
-        while self.__running:
-            if self.__dao.has_saved_game_data() and not self.__loaded:
-                self.__loaded = True
+        # The save is only looked for when the session starts. Autosaves create it later on,
+        # and the running session must not be rolled back to them
+        if not self.__loaded:
+            self.__loaded = True
+            if self.__dao.has_saved_game_data():
                 self.__dao.load_game(self.__world)
+
+        while self.__running:
             try:
                 self.__process_game_events()
 
@@ -164,22 +224,22 @@ class Game:
                 if self.__is_level_up_menu_active:
                     self.__handle_level_up_menu()
                     continue
-                if self.__world.player.health <= 0:
+                if self.__world.player.health <= 0 and not self.__is_game_over:
                     self.__is_game_over = True
+                    self.__menu_needs_redraw = True
 
                 if self.__is_game_over:
                     self.__handle_game_over_screen()
+                    self.__autosaver.wait()
                     self.__dao.clear_save()
                     continue
 
                 self.elapsed_time = (
-                    pygame.time.get_ticks() - self.start_ticks) / 1000
-                self.__input_handler.process_input()
-                self.__world.update()
-                CollisionHandler.handle_collisions(self.__world)
-                DeathHandler.check_deaths(self.__world)
-                self.__display.render_frame()
-
-                self.__clock.tick(settings.FPS)
+                    self.__world.clock.now - self.start_ticks) / 1000
+                alpha = self.__advance_simulation()
+                self.__display.render_frame(alpha)
+                self.__autosaver.update(self.__world)
             except DeadPlayerException:
                 self.__running = False
+
+        self.__autosaver.close()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Runs the game simulation without a window, as fast as the CPU allows.
+
+Used for balance sweeps and regression timing. Nothing is rendered, the simulation clock is
+advanced by the fixed simulation step on every tick.
+"""
+import argparse
+import os
+import random
+import time
+
+# The dummy drivers must be selected before pygame is imported
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # pylint: disable=wrong-import-position
+
+import settings  # pylint: disable=wrong-import-position
+from business.world.game_world import GameWorld  # pylint: disable=wrong-import-position
+from business.world.monster_spawner import MonsterSpawner  # pylint: disable=wrong-import-position
+from business.world.simulation import Simulation  # pylint: disable=wrong-import-position
+from business.world.tile_map import TileMap  # pylint: disable=wrong-import-position
+from runner import initialize_player  # pylint: disable=wrong-import-position
+
+
+def parse_arguments():
+    """Parses the command line arguments"""
+    parser = argparse.ArgumentParser(description="Runs the game simulation without a window.")
+    length = parser.add_mutually_exclusive_group()
+    length.add_argument("--ticks", type=int, help="number of simulation ticks to run")
+    length.add_argument("--seconds", type=float, help="simulated seconds to run")
+    parser.add_argument("--seed", type=int, help="seed for the random generator")
+    return parser.parse_args()
+
+
+def initialize_game_world():
+    """Initializes the game world without a display"""
+    return GameWorld(MonsterSpawner(), TileMap(), initialize_player())
+
+
+def main():
+    """Main function to run the simulation"""
+    arguments = parse_arguments()
+    if arguments.ticks is not None:
+        ticks = arguments.ticks
+    else:
+        seconds = arguments.seconds if arguments.seconds is not None else 60
+        ticks = round(seconds * settings.SIMULATION_TICK_RATE)
+
+    if arguments.seed is not None:
+        random.seed(arguments.seed)
+
+    pygame.init()  # pylint: disable=E1101
+    # Sprites convert their images to the display format, which needs a display mode
+    pygame.display.set_mode((1, 1))
+
+    world = initialize_game_world()
+
+    tick = 0
+    start = time.perf_counter()
+    while tick < ticks and world.player.health > 0:
+        Simulation.step(world)
+        tick += 1
+    elapsed = time.perf_counter() - start
+
+    print(f"ticks: {tick} ({tick / settings.SIMULATION_TICK_RATE:.1f} sim-seconds)")
+    print(f"time: {elapsed:.3f} s, {tick / elapsed if elapsed else 0:.0f} ticks/sec")
+    print(f"monsters: {len(world.monsters)}, bullets: {len(world.bullets)}, "
+          f"gems: {len(world.experience_gems)}")
+    print(f"population: {world.population.metrics}")
+    print(f"player: health {world.player.health}, level {world.player.level}")
+
+    pygame.quit()  # pylint: disable=E1101
+
+
+if __name__ == "__main__":
+    main()
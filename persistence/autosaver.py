@@ -0,0 +1,122 @@
+""" Module that contains the background autosaver """
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+import settings
+from business.handlers.cooldown_handler import CooldownHandler
+from business.world.interfaces import IGameWorld
+from business.world.simulation_clock import SimulationClock
+from business.world.world_snapshot import WorldSnapshot
+from persistence.gamedao import IGameDAO
+
+
+class AutoSaver:
+    """Saves the game periodically without holding up the game loop.
+
+    The game thread only takes a snapshot of the world. Formatting, encoding and writing the
+    save happen on a worker thread, through `IGameDAO.save_snapshot`, so a crash mid-write never
+    leaves a broken save. If the previous save is still being
+    written when the next one is due, the new one is skipped instead of waiting for the disk.
+    """
+
+    def __init__(self, dao: IGameDAO, clock: SimulationClock | None = None,
+                 interval_ms: int = settings.AUTOSAVE_INTERVAL_MS):
+        self.__dao = dao
+        self.__enabled = interval_ms > 0
+        self.__cooldown = CooldownHandler(interval_ms, clock)
+        self.__executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autosave")
+        self.__pending: Future | None = None
+
+        self.__last_duration_ms: float | None = None
+        self.__last_success_time: float | None = None
+        self.__last_error: Exception | None = None
+        self.__save_count = 0
+        self.__skipped_count = 0
+
+    def __write(self, snapshot: WorldSnapshot):
+        start = time.perf_counter()
+        try:
+            self.__dao.save_snapshot(snapshot)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            # A failed autosave must not stop the worker, the next one tries again
+            self.__last_error = error
+            return
+
+        self.__last_duration_ms = (time.perf_counter() - start) * 1000
+        self.__last_success_time = time.time()
+        self.__last_error = None
+        self.__save_count += 1
+
+    def update(self, world: IGameWorld) -> bool:
+        """Starts a background save of the world when the autosave interval has passed.
+
+        Args:
+            world (IGameWorld): The world to save.
+
+        Returns:
+            bool: True if a save was started.
+        """
+        if not self.__enabled or not self.__cooldown.is_action_ready():
+            return False
+
+        self.__cooldown.put_on_cooldown()
+        return self.save(world)
+
+    def save(self, world: IGameWorld) -> bool:
+        """Snapshots the world and saves the snapshot in the background.
+
+        Args:
+            world (IGameWorld): The world to save.
+
+        Returns:
+            bool: False if the previous save is still being written, then nothing is saved.
+        """
+        if self.is_saving:
+            self.__skipped_count += 1
+            return False
+
+        self.__pending = self.__executor.submit(self.__write, world.snapshot())
+        return True
+
+    def wait(self):
+        """Blocks until the save being written, if any, is done.
+
+        Call it before writing or clearing the save file from the game thread, so an older
+        snapshot can not replace the file afterwards.
+        """
+        if self.__pending is not None:
+            self.__pending.result()
+
+    def close(self):
+        """Waits for the save being written and stops the worker thread."""
+        self.__executor.shutdown(wait=True)
+
+    @property
+    def is_saving(self) -> bool:
+        """Whether a save is being written."""
+        return self.__pending is not None and not self.__pending.done()
+
+    @property
+    def last_duration_ms(self) -> float | None:
+        """How long the worker took to write the last successful save, None if there was none."""
+        return self.__last_duration_ms
+
+    @property
+    def last_success_time(self) -> float | None:
+        """When the last successful save finished, in seconds since the epoch."""
+        return self.__last_success_time
+
+    @property
+    def last_error(self) -> Exception | None:
+        """The error of the last save, None if it succeeded."""
+        return self.__last_error
+
+    @property
+    def metrics(self) -> dict:
+        """The autosave counters and timings, for logs and benchmarks."""
+        return {
+            'saves': self.__save_count,
+            'skipped': self.__skipped_count,
+            'last_duration_ms': self.__last_duration_ms,
+            'last_success_time': self.__last_success_time,
+            'last_error': repr(self.__last_error) if self.__last_error is not None else None,
+        }
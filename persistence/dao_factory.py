@@ -0,0 +1,34 @@
+""" Module that selects the gameworld DAO for the configured save format """
+import settings
+from persistence.gamedao import IGameDAO
+from persistence.gamebinarydao import GameWorldBinaryDAO
+from persistence.gamejournaldao import GameWorldJournalDAO
+from persistence.gamejsondao import GameWorldJsonDAO
+
+
+class GameDAOFactory:
+    """Creates the gameworld DAO for a save format."""
+
+    DAOS = {
+        "json": GameWorldJsonDAO,
+        "binary": GameWorldBinaryDAO,
+        "journal": GameWorldJournalDAO,
+    }
+
+    @staticmethod
+    def create(save_format: str | None = None) -> IGameDAO:
+        """Creates a DAO that saves in a format.
+
+        Args:
+            save_format (str | None): "json", "binary" or "journal", defaults to `settings.SAVE_FORMAT`.
+
+        Returns:
+            IGameDAO: The DAO, using its default save path.
+
+        Raises:
+            ValueError: If the format is unknown.
+        """
+        save_format = save_format if save_format is not None else settings.SAVE_FORMAT
+        if save_format not in GameDAOFactory.DAOS:
+            raise ValueError(f"Unknown save format {save_format!r}, expected one of {sorted(GameDAOFactory.DAOS)}")
+        return GameDAOFactory.DAOS[save_format]()
@@ -0,0 +1,267 @@
+""" Module that contains the binary gameworld DAO """
+import json
+import os
+import struct
+from persistence.gamedao import IGameDAO
+from business.world.interfaces import IGameWorld
+
+
+class RecordLayout:
+    """Fixed-width binary layout of the records of one entity class.
+
+    Each field maps a key of the entity's `json_format` dict, or a path of keys for nested
+    dicts, to a `struct` format character.
+    """
+
+    def __init__(self, *fields: tuple[str | tuple[str, ...], str]):
+        self.__fields = [(key if isinstance(key, tuple) else (key,), code) for key, code in fields]
+        self.__struct = struct.Struct("<" + "".join(code for _, code in self.__fields))
+
+    def pack(self, record: dict) -> bytes:
+        """Packs a record.
+
+        Args:
+            record (dict): The record as `json_format` returns it.
+
+        Returns:
+            bytes: The packed record.
+        """
+        values = []
+        for path, code in self.__fields:
+            value = record
+            for key in path:
+                value = value[key]
+            values.append(value.encode("utf-8") if code.endswith("s") else value)
+        return self.__struct.pack(*values)
+
+    def unpack_from(self, buffer: bytes, offset: int) -> dict:
+        """Unpacks a record.
+
+        Args:
+            buffer (bytes): The packed data.
+            offset (int): Where the record starts in the buffer.
+
+        Returns:
+            dict: The record, in the shape `json_format` returns it.
+        """
+        record: dict = {}
+        for (path, code), value in zip(self.__fields, self.__struct.unpack_from(buffer, offset)):
+            if code.endswith("s"):
+                value = value.rstrip(b"\0").decode("utf-8")
+            parent = record
+            for key in path[:-1]:
+                parent = parent.setdefault(key, {})
+            parent[path[-1]] = value
+        return record
+
+    @property
+    def size(self) -> int:
+        """The size of a packed record in bytes."""
+        return self.__struct.size
+
+
+class GameWorldBinaryDAO(IGameDAO):
+    """Binary DAO that handles the saving and loading of GameWorld data.
+
+    The file starts with a header holding a magic number, the format version and the in-game
+    timer. The player follows as a length-prefixed JSON record, since there is only one and its
+    fields change as the game grows. Then come the monsters, bullets and gems, grouped by class,
+    each group being the class name, the record count and the fixed-width records.
+
+    The data read and written is the same dict the JSON DAO uses, so saves convert freely
+    between the two formats. An empty file means there is no saved game.
+    """
+
+    MAGIC = b"VSAV"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHq")
+    LENGTH = struct.Struct("<I")
+    SECTIONS = ('monsters', 'bullets', 'gems')
+
+    __GEM = (('pos_x', 'd'), ('pos_y', 'd'), ('amount', 'q'))
+    __BOOST_GEM = __GEM + (('boost', 'q'), ('duration', 'q'))
+    LAYOUTS = {
+        'Monster': RecordLayout(
+            ('pos_x', 'd'), ('pos_y', 'd'), ('health', 'q'), ('max_health', 'q'), ('damage', 'q'),
+            ('attack_range', 'q'), ('level_multiplier', 'q'),
+            (('attack_cooldown', 'last_action_time'), 'q'), (('attack_cooldown', 'cooldown_time'), 'q'),
+            ('monster_type', '16s')),
+        'Bullet': RecordLayout(
+            ('pos_x', 'd'), ('pos_y', 'd'), ('dir_x', 'd'), ('dir_y', 'd'),
+            ('damage_amount', 'q'), ('health', 'q'), ('speed', 'd')),
+        'ExperienceGem': RecordLayout(*__GEM),
+        'SpeedGem': RecordLayout(*__BOOST_GEM),
+        'DamageGem': RecordLayout(*__BOOST_GEM),
+        'DefenceGem': RecordLayout(*__BOOST_GEM),
+        'HealthGem': RecordLayout(*__BOOST_GEM),
+    }
+
+    def __init__(self, save_path="persistence/data/game_world.sav") -> None:
+        """Initializes the DAO and creates an empty save file if it does not exist."""
+        self.__save_path = save_path
+        # Unknown until the file is first checked, then kept in step with every save and clear
+        self.__has_saved_game: bool | None = None
+        if not os.path.exists(self.__save_path):
+            self.__save_bytes(b"")
+
+    @staticmethod
+    def __encode_string(text: str) -> bytes:
+        encoded = text.encode("utf-8")
+        return GameWorldBinaryDAO.LENGTH.pack(len(encoded)) + encoded
+
+    @staticmethod
+    def __decode_string(buffer: bytes, offset: int) -> tuple[str, int]:
+        (length,) = GameWorldBinaryDAO.LENGTH.unpack_from(buffer, offset)
+        start = offset + GameWorldBinaryDAO.LENGTH.size
+        return buffer[start:start + length].decode("utf-8"), start + length
+
+    @staticmethod
+    def encode(data: dict) -> bytes:
+        """Packs game data in the binary format.
+
+        Args:
+            data (dict): The game data, as the JSON DAO stores it.
+
+        Returns:
+            bytes: The packed game data, or no bytes for empty game data.
+
+        Raises:
+            ValueError: If an entity class has no binary layout.
+        """
+        if not data:
+            return b""
+
+        chunks = [GameWorldBinaryDAO.HEADER.pack(GameWorldBinaryDAO.MAGIC, GameWorldBinaryDAO.VERSION,
+                                                 data.get('timer', 0)),
+                  GameWorldBinaryDAO.__encode_string(json.dumps(data.get('player', {})))]
+
+        for section in GameWorldBinaryDAO.SECTIONS:
+            groups = data.get(section, {})
+            chunks.append(GameWorldBinaryDAO.LENGTH.pack(len(groups)))
+            for class_name, records in groups.items():
+                layout = GameWorldBinaryDAO.LAYOUTS.get(class_name)
+                if layout is None:
+                    raise ValueError(f"No binary layout for {class_name} records")
+
+                chunks.append(GameWorldBinaryDAO.__encode_string(class_name))
+                chunks.append(GameWorldBinaryDAO.LENGTH.pack(len(records)))
+                chunks.extend(layout.pack(record) for record in records)
+
+        return b"".join(chunks)
+
+    @staticmethod
+    def decode(buffer: bytes) -> dict:
+        """Unpacks game data from the binary format.
+
+        Args:
+            buffer (bytes): The packed game data.
+
+        Returns:
+            dict: The game data, as the JSON DAO stores it. Empty if there is no saved game.
+
+        Raises:
+            ValueError: If the data is not a save in a known version of the format.
+        """
+        if not buffer:
+            return {}
+
+        header = GameWorldBinaryDAO.HEADER
+        if len(buffer) < header.size:
+            raise ValueError("Truncated save file")
+        magic, version, timer = header.unpack_from(buffer, 0)
+        if magic != GameWorldBinaryDAO.MAGIC:
+            raise ValueError("Not a binary save file")
+        if version != GameWorldBinaryDAO.VERSION:
+            raise ValueError(f"Unsupported save format version {version}")
+
+        player, offset = GameWorldBinaryDAO.__decode_string(buffer, header.size)
+        data: dict = {'player': json.loads(player), 'timer': timer}
+
+        for section in GameWorldBinaryDAO.SECTIONS:
+            groups: dict = {}
+            (group_count,) = GameWorldBinaryDAO.LENGTH.unpack_from(buffer, offset)
+            offset += GameWorldBinaryDAO.LENGTH.size
+            for _ in range(group_count):
+                class_name, offset = GameWorldBinaryDAO.__decode_string(buffer, offset)
+                (record_count,) = GameWorldBinaryDAO.LENGTH.unpack_from(buffer, offset)
+                offset += GameWorldBinaryDAO.LENGTH.size
+
+                layout = GameWorldBinaryDAO.LAYOUTS.get(class_name)
+                if layout is None:
+                    raise ValueError(f"No binary layout for {class_name} records")
+                records = []
+                for _ in range(record_count):
+                    records.append(layout.unpack_from(buffer, offset))
+                    offset += layout.size
+                groups[class_name] = records
+            data[section] = groups
+
+        return data
+
+    def __read_bytes(self) -> bytes:
+        """Reads the save file."""
+        with open(self.__save_path, 'rb') as file:
+            return file.read()
+
+    def __save_bytes(self, buffer: bytes) -> None:
+        """Saves the save file."""
+        with open(self.__save_path, 'wb') as file:
+            file.write(buffer)
+
+    def save_game(self, game_world: IGameWorld) -> None:
+        """Serializes and saves the current state of GameWorld."""
+        data: dict = {'monsters': {}, 'bullets': {}, 'gems': {}}
+        for section, entities in (('monsters', game_world.monsters), ('bullets', game_world.bullets),
+                                  ('gems', game_world.experience_gems)):
+            for entity in entities:
+                data[section].setdefault(entity.__class__.__name__, []).append(entity.json_format())
+
+        data['player'] = game_world.player.json_format()
+        data['timer'] = game_world.timer
+
+        self.__save_bytes(GameWorldBinaryDAO.encode(data))
+        self.__has_saved_game = True
+
+    def load_game(self, game_world: IGameWorld) -> None:
+        """Loads the saved GameWorld state and populates the provided GameWorld instance."""
+        data = GameWorldBinaryDAO.decode(self.__read_bytes())
+
+        game_world.clear_all_entities()
+
+        game_world.load_game_data(data)
+
+    def encode_game_data(self, game_data: dict) -> bytes:
+        """Encodes game data in the binary format."""
+        return GameWorldBinaryDAO.encode(game_data)
+
+    def save_encoded(self, payload: bytes) -> None:
+        """Replaces the save file with encoded game data in one atomic step."""
+        IGameDAO.write_atomically(self.__save_path, payload)
+        self.__has_saved_game = bool(payload)
+
+    @property
+    def save_path(self) -> str:
+        return self.__save_path
+
+    def has_saved_game_data(self) -> bool:
+        """Checks if there is saved game data available to load."""
+        if self.__has_saved_game is None:
+            self.__has_saved_game = self.__read_save_state()
+        return self.__has_saved_game
+
+    def __read_save_state(self) -> bool:
+        """Reads from the save file header whether it holds saved game data."""
+        if not os.path.isfile(self.__save_path):
+            return False
+
+        with open(self.__save_path, 'rb') as file:
+            header = file.read(GameWorldBinaryDAO.HEADER.size)
+        return len(header) == GameWorldBinaryDAO.HEADER.size and header.startswith(GameWorldBinaryDAO.MAGIC)
+
+    def clear_save(self) -> None:
+        """Clears the saved game data."""
+        if self.__has_saved_game is False:
+            return
+
+        self.__save_bytes(b"")
+        self.__has_saved_game = False
@@ -1,9 +1,30 @@
 """ Module that contains interface for gameworld DAO """
+import os
 from abc import abstractmethod, ABC
 from business.world.interfaces import IGameWorld
+from business.world.world_snapshot import WorldSnapshot
 
 class IGameDAO(ABC):
-    """ Interface for gameworld DAO """
+    """ Interface for gameworld DAO
+
+    DAOs remember whether they hold a saved game once they have checked or changed the save
+    file, so asking again or clearing an empty save does not touch the disk.
+    """
+
+    @staticmethod
+    def write_atomically(path: str, payload: bytes):
+        """Writes a file so that it holds either its old or its new contents, never a mix.
+
+        Args:
+            path (str): The file to write.
+            payload (bytes): The new contents.
+        """
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, 'wb') as file:
+            file.write(payload)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, path)
 
     @abstractmethod
     def save_game(self, game_world):
@@ -21,14 +42,57 @@ class IGameDAO(ABC):
             IGameWorld: An instance of the game world with the saved data.
         """
 
+    @abstractmethod
+    def encode_game_data(self, game_data: dict) -> bytes:
+        """Encodes game data the way this DAO stores it.
+
+        Args:
+            game_data (dict): The game data, as `IGameWorld.load_game_data` reads it.
+
+        Returns:
+            bytes: The contents of a save file holding the game data.
+        """
+
+    @abstractmethod
+    def save_encoded(self, payload: bytes) -> None:
+        """Replaces the save file with encoded game data in one atomic step.
+
+        Safe to call from a worker thread while the game keeps running.
+
+        Args:
+            payload (bytes): Game data encoded with `encode_game_data`.
+        """
+
+    def save_snapshot(self, snapshot: WorldSnapshot) -> None:
+        """Saves a snapshot of the world.
+
+        Safe to call from a worker thread while the game keeps running. By default the snapshot
+        is encoded as game data and replaces the save file.
+
+        Args:
+            snapshot (WorldSnapshot): The world state to save.
+        """
+        self.save_encoded(self.encode_game_data(snapshot.to_game_data()))
+
+    @property
+    @abstractmethod
+    def save_path(self) -> str:
+        """The path of the save file.
+
+        Returns:
+            str: The path of the save file.
+        """
+
     @abstractmethod
     def has_saved_game_data(self) -> bool:
         """Checks if there is saved game data.
 
+        Only the first call reads the save file.
+
         Returns:
             bool: If there is saved game data.
         """
 
     @abstractmethod
     def clear_save(self) -> None:
-        """Clears the saved game data."""
+        """Clears the saved game data, the file is only written if it held a saved game."""
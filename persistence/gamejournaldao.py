@@ -0,0 +1,308 @@
+""" Module that contains the journaled gameworld DAO """
+import json
+import os
+import threading
+import time
+import settings
+from persistence.gamedao import IGameDAO
+from business.world.interfaces import IGameWorld
+from business.world.world_snapshot import WorldSnapshot
+
+
+class GameWorldJournalDAO(IGameDAO):
+    """Journaled DAO that makes frequent saves cheap.
+
+    A save appends one line to the journal with what changed since the previous save: the
+    entities that spawned, the new positions of the entities that moved, the other fields that
+    changed, the entities that were removed and the player fields that changed. Entities are
+    told apart by their world handles.
+
+    When the journal grows past `settings.JOURNAL_COMPACT_BYTES` it is set aside as a segment
+    and a full snapshot is written in the background, then the segment is deleted. Loading
+    reads the snapshot and replays the journal written after it. A line cut short by a crash
+    is ignored, so loading gets the last complete save.
+
+    The snapshot and the journal entries carry a generation, which changes every time the world
+    is saved from scratch, and a sequence number. Entries from another generation or already in
+    the snapshot are skipped, so what an interrupted compaction leaves behind is harmless.
+    """
+
+    VERSION = 1
+    SECTIONS = ('monsters', 'bullets', 'gems')
+
+    def __init__(self, base_path="persistence/data/game_world") -> None:
+        """Initializes the DAO, the snapshot and journal files are created by the first save."""
+        self.__snapshot_path = f"{base_path}.snapshot"
+        self.__journal_path = f"{base_path}.journal"
+
+        # What the files hold, None until this DAO writes a snapshot of its own
+        self.__entities: dict[int, tuple[str, str, dict]] | None = None
+        self.__player: dict = {}
+        self.__timer = 0
+        self.__generation = 0
+        self.__sequence = 0
+
+        self.__compaction: threading.Thread | None = None
+        # Unknown until the files are first checked, then kept in step with every save and clear
+        self.__has_saved_game: bool | None = None
+
+    @staticmethod
+    def __encode_line(entry: dict) -> bytes:
+        return (json.dumps(entry, separators=(',', ':')) + "\n").encode("utf-8")
+
+    @staticmethod
+    def __capture(game_world: IGameWorld) -> dict[int, tuple[str, str, dict]]:
+        entities = {}
+        for section, collection in (('monsters', game_world.monsters), ('bullets', game_world.bullets),
+                                    ('gems', game_world.experience_gems)):
+            for entity in collection:
+                entities[entity.handle] = (section, entity.__class__.__name__, entity.json_format())
+        return entities
+
+    @staticmethod
+    def __snapshot_payload(generation: int, sequence: int, entities: dict, player: dict, timer: int) -> bytes:
+        return GameWorldJournalDAO.__encode_line({
+            'version': GameWorldJournalDAO.VERSION,
+            'generation': generation,
+            'sequence': sequence,
+            'timer': timer,
+            'player': player,
+            'entities': [[handle, *entity] for handle, entity in entities.items()],
+        })
+
+    @staticmethod
+    def __changes(previous: dict, current: dict) -> dict:
+        return {key: value for key, value in current.items() if previous.get(key) != value}
+
+    def __segments(self) -> list[tuple[int, str]]:
+        """Gets the journal segments set aside for compaction, oldest first."""
+        directory = os.path.dirname(self.__journal_path) or "."
+        prefix = os.path.basename(self.__journal_path) + "."
+        segments = []
+        for name in os.listdir(directory):
+            if name.startswith(prefix) and name[len(prefix):].isdigit():
+                segments.append((int(name[len(prefix):]), os.path.join(directory, name)))
+        return sorted(segments)
+
+    def __remove_journal(self, up_to_sequence: int | None = None):
+        """Deletes the segments up to a sequence number, or every segment and the journal."""
+        for sequence, path in self.__segments():
+            if up_to_sequence is None or sequence <= up_to_sequence:
+                os.remove(path)
+        if up_to_sequence is None and os.path.exists(self.__journal_path):
+            os.remove(self.__journal_path)
+
+    def __wait_for_compaction(self):
+        if self.__compaction is not None:
+            self.__compaction.join()
+            self.__compaction = None
+
+    def __write_snapshot(self, entities: dict, player: dict, timer: int):
+        """Saves the world from scratch, in a new generation without any journal."""
+        self.__wait_for_compaction()
+        self.__generation = time.time_ns()
+        self.__sequence = 0
+        payload = GameWorldJournalDAO.__snapshot_payload(self.__generation, 0, entities, player, timer)
+        IGameDAO.write_atomically(self.__snapshot_path, payload)
+        self.__remove_journal()
+
+    def __append(self, entities: dict, player: dict, timer: int):
+        """Appends the changes since the previous save to the journal."""
+        previous = self.__entities
+        self.__sequence += 1
+        entry: dict = {'generation': self.__generation, 'sequence': self.__sequence, 'timer': timer}
+
+        spawned, moved, changed = [], [], []
+        for handle, entity in entities.items():
+            known = previous.get(handle)
+            if known is None:
+                spawned.append([handle, *entity])
+                continue
+
+            record, known_record = entity[2], known[2]
+            if known_record == record:
+                continue
+
+            # Most entities only move between saves, their positions are summarized on their own
+            pos_x, pos_y = record['pos_x'], record['pos_y']
+            if pos_x != known_record['pos_x'] or pos_y != known_record['pos_y']:
+                moved.append([handle, pos_x, pos_y])
+                if {**known_record, 'pos_x': pos_x, 'pos_y': pos_y} == record:
+                    continue
+
+            changes = GameWorldJournalDAO.__changes(known_record, record)
+            changes.pop('pos_x', None)
+            changes.pop('pos_y', None)
+            changed.append([handle, changes])
+        removed = [handle for handle in previous if handle not in entities]
+        player_changes = GameWorldJournalDAO.__changes(self.__player, player)
+
+        for key, value in (('spawn', spawned), ('move', moved), ('change', changed), ('remove', removed),
+                           ('player', player_changes)):
+            if value:
+                entry[key] = value
+
+        with open(self.__journal_path, 'ab') as file:
+            file.write(GameWorldJournalDAO.__encode_line(entry))
+            file.flush()
+            os.fsync(file.fileno())
+
+    def __compact(self, generation: int, sequence: int, entities: dict, player: dict, timer: int):
+        payload = GameWorldJournalDAO.__snapshot_payload(generation, sequence, entities, player, timer)
+        try:
+            IGameDAO.write_atomically(self.__snapshot_path, payload)
+            self.__remove_journal(up_to_sequence=sequence)
+        except OSError:
+            # The segments stay and are replayed, the next compaction tries again
+            return
+
+    def __start_compaction(self):
+        if self.__compaction is not None and self.__compaction.is_alive():
+            return
+
+        # New saves go to a fresh journal while the segment is folded into the snapshot. The
+        # saved state is never changed in place, so the worker can read it as it is now.
+        os.replace(self.__journal_path, f"{self.__journal_path}.{self.__sequence}")
+        self.__compaction = threading.Thread(
+            target=self.__compact, name="journal-compaction",
+            args=(self.__generation, self.__sequence, self.__entities, self.__player, self.__timer))
+        self.__compaction.start()
+
+    def __save(self, entities: dict, player: dict, timer: int):
+        if self.__entities is None:
+            self.__write_snapshot(entities, player, timer)
+        else:
+            self.__append(entities, player, timer)
+        self.__entities, self.__player, self.__timer = entities, player, timer
+        self.__has_saved_game = True
+
+        if os.path.exists(self.__journal_path) and \
+                os.path.getsize(self.__journal_path) > settings.JOURNAL_COMPACT_BYTES:
+            self.__start_compaction()
+
+    def save_game(self, game_world: IGameWorld) -> None:
+        """Appends the changes since the previous save, or saves the world from scratch."""
+        self.__save(GameWorldJournalDAO.__capture(game_world), game_world.player.json_format(), game_world.timer)
+
+    def save_snapshot(self, snapshot: WorldSnapshot) -> None:
+        """Appends the changes since the previous save, or saves the world from scratch.
+
+        The autosaver calls it on its worker thread, so frequent checkpoints only append to the
+        journal without holding up the game.
+        """
+        self.__save(snapshot.entities(), snapshot.player, snapshot.timer)
+
+    def __read_lines(self, path: str):
+        with open(path, 'rb') as file:
+            for line in file:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # Cut short by a crash while it was appended, nothing valid follows it
+                    return
+
+    def read_game_data(self) -> dict:
+        """Rebuilds the saved game data from the snapshot and the journal.
+
+        Returns:
+            dict: The game data, in the shape the other DAOs save. Empty if there is no saved game.
+
+        Raises:
+            ValueError: If the snapshot is from an unknown version of the format.
+        """
+        self.__wait_for_compaction()
+        if not os.path.isfile(self.__snapshot_path):
+            return {}
+        snapshot = next(self.__read_lines(self.__snapshot_path), None)
+        if snapshot is None:
+            return {}
+        if snapshot['version'] != GameWorldJournalDAO.VERSION:
+            raise ValueError(f"Unsupported journal snapshot version {snapshot['version']}")
+
+        generation, sequence = snapshot['generation'], snapshot['sequence']
+        player, timer = snapshot['player'], snapshot['timer']
+        entities = {handle: (section, class_name, record)
+                    for handle, section, class_name, record in snapshot['entities']}
+
+        journals = [path for _, path in self.__segments()]
+        if os.path.isfile(self.__journal_path):
+            journals.append(self.__journal_path)
+        for path in journals:
+            for entry in self.__read_lines(path):
+                if entry['generation'] != generation or entry['sequence'] <= sequence:
+                    continue
+
+                for handle, section, class_name, record in entry.get('spawn', ()):
+                    entities[handle] = (section, class_name, record)
+                for handle, pos_x, pos_y in entry.get('move', ()):
+                    if handle in entities:
+                        record = entities[handle][2]
+                        record['pos_x'], record['pos_y'] = pos_x, pos_y
+                for handle, changes in entry.get('change', ()):
+                    if handle in entities:
+                        entities[handle][2].update(changes)
+                for handle in entry.get('remove', ()):
+                    entities.pop(handle, None)
+                player = {**player, **entry.get('player', {})}
+                timer = entry['timer']
+                sequence = entry['sequence']
+
+        data: dict = {section: {} for section in GameWorldJournalDAO.SECTIONS}
+        for section, class_name, record in entities.values():
+            data[section].setdefault(class_name, []).append(record)
+        data['player'] = player
+        data['timer'] = timer
+        return data
+
+    def load_game(self, game_world: IGameWorld) -> None:
+        """Loads the saved GameWorld state and populates the provided GameWorld instance."""
+        data = self.read_game_data()
+
+        game_world.clear_all_entities()
+
+        game_world.load_game_data(data)
+
+        # The loaded entities get new handles, so the next save starts from scratch
+        self.__entities = None
+
+    def encode_game_data(self, game_data: dict) -> bytes:
+        """Encodes game data as a snapshot in a new generation."""
+        entities = {}
+        for section in GameWorldJournalDAO.SECTIONS:
+            for class_name, records in game_data.get(section, {}).items():
+                for record in records:
+                    entities[len(entities) + 1] = (section, class_name, record)
+        return GameWorldJournalDAO.__snapshot_payload(
+            time.time_ns(), 0, entities, game_data.get('player', {}), game_data.get('timer', 0))
+
+    def save_encoded(self, payload: bytes) -> None:
+        """Replaces the snapshot with an encoded one and drops the journal."""
+        self.__wait_for_compaction()
+        IGameDAO.write_atomically(self.__snapshot_path, payload)
+        self.__remove_journal()
+        # The snapshot does not know the world handles, the next save starts from scratch
+        self.__entities = None
+        self.__has_saved_game = True
+
+    @property
+    def save_path(self) -> str:
+        return self.__snapshot_path
+
+    def has_saved_game_data(self) -> bool:
+        """Checks if there is saved game data available to load."""
+        if self.__has_saved_game is None:
+            self.__has_saved_game = os.path.isfile(self.__snapshot_path) and \
+                os.path.getsize(self.__snapshot_path) > 0
+        return self.__has_saved_game
+
+    def clear_save(self) -> None:
+        """Clears the saved game data."""
+        if self.__has_saved_game is False:
+            return
+
+        self.__wait_for_compaction()
+        if os.path.exists(self.__snapshot_path):
+            os.remove(self.__snapshot_path)
+        self.__remove_journal()
+        self.__entities = None
+        self.__has_saved_game = False
@@ -13,6 +13,8 @@ class GameWorldJsonDAO(IGameDAO):
     def __init__(self, json_path="persistence/data/game_world.json") -> None:
         """Initializes the DAO and creates a JSON file if it does not exist."""
         self.__json_path = json_path
+        # Unknown until the file is first checked, then kept in step with every save and clear
+        self.__has_saved_game: bool | None = None
         if not os.path.exists(self.__json_path):
             with open(self.__json_path, 'w', encoding="utf-8") as file:
                 json.dump(self.BASE_GAME_DATA, file, indent=4)
@@ -53,6 +55,7 @@ class GameWorldJsonDAO(IGameDAO):
         data['timer'] = timer
 
         self.__save_data(data)
+        self.__has_saved_game = True
 
     def load_game(self, game_world: IGameWorld) -> None:
         """Loads the saved GameWorld state and populates the provided GameWorld instance."""
@@ -62,8 +65,27 @@ class GameWorldJsonDAO(IGameDAO):
 
         game_world.load_game_data(data)
 
+    def encode_game_data(self, game_data: dict) -> bytes:
+        """Encodes game data as the JSON file stores it."""
+        return json.dumps(game_data, indent=4).encode("utf-8")
+
+    def save_encoded(self, payload: bytes) -> None:
+        """Replaces the JSON file with encoded game data in one atomic step."""
+        IGameDAO.write_atomically(self.__json_path, payload)
+        self.__has_saved_game = True
+
+    @property
+    def save_path(self) -> str:
+        return self.__json_path
+
     def has_saved_game_data(self) -> bool:
         """Checks if there is saved game data available to load."""
+        if self.__has_saved_game is None:
+            self.__has_saved_game = self.__read_save_state()
+        return self.__has_saved_game
+
+    def __read_save_state(self) -> bool:
+        """Reads from the JSON file whether it holds saved game data."""
         if os.path.isfile(self.__json_path) and os.path.getsize(self.__json_path) > 10:
             try:
                 with open(self.__json_path, 'r') as file:
@@ -75,4 +97,8 @@ class GameWorldJsonDAO(IGameDAO):
 
     def clear_save(self) -> None:
         """Clears the saved game data."""
+        if self.__has_saved_game is False:
+            return
+
         self.__save_data({})
+        self.__has_saved_game = False
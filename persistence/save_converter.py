@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+""" Converts saved games between the JSON and the binary format """
+import argparse
+import json
+from persistence.gamebinarydao import GameWorldBinaryDAO
+
+
+class SaveConverter:
+    """Converts save files between the JSON and the binary DAO formats."""
+
+    @staticmethod
+    def json_to_binary(json_path: str, binary_path: str) -> None:
+        """Converts a JSON save into a binary save.
+
+        Args:
+            json_path (str): The JSON save to read.
+            binary_path (str): The binary save to write.
+        """
+        with open(json_path, 'r', encoding="utf-8") as file:
+            data = json.load(file)
+        with open(binary_path, 'wb') as file:
+            file.write(GameWorldBinaryDAO.encode(data))
+
+    @staticmethod
+    def binary_to_json(binary_path: str, json_path: str) -> None:
+        """Converts a binary save into a JSON save.
+
+        Args:
+            binary_path (str): The binary save to read.
+            json_path (str): The JSON save to write.
+        """
+        with open(binary_path, 'rb') as file:
+            data = GameWorldBinaryDAO.decode(file.read())
+        with open(json_path, 'w', encoding="utf-8") as file:
+            json.dump(data, file, indent=4)
+
+
+def main():
+    """Converts the save given on the command line, the format follows the file extension"""
+    parser = argparse.ArgumentParser(description="Converts saved games between JSON and binary.")
+    parser.add_argument("source", help="save to convert, .json saves become binary and the rest JSON")
+    parser.add_argument("destination", help="converted save to write")
+    arguments = parser.parse_args()
+
+    if arguments.source.endswith(".json"):
+        SaveConverter.json_to_binary(arguments.source, arguments.destination)
+    else:
+        SaveConverter.binary_to_json(arguments.source, arguments.destination)
+
+
+if __name__ == "__main__":
+    main()
@@ -35,9 +35,18 @@ class Camera:
         Args:
             target_rect (pygame.Rect): The target rectangle to follow.
         """
+        self.center_on(target_rect.centerx, target_rect.centery)
+
+    def center_on(self, pos_x: float, pos_y: float):
+        """Update the camera position to center it on a point.
+
+        Args:
+            pos_x (float): The x-coordinate to follow.
+            pos_y (float): The y-coordinate to follow.
+        """
         # Center the camera on the target
-        x = target_rect.centerx - settings.SCREEN_WIDTH // 2
-        y = target_rect.centery - settings.SCREEN_HEIGHT // 2
+        x = int(pos_x) - settings.SCREEN_WIDTH // 2
+        y = int(pos_y) - settings.SCREEN_HEIGHT // 2
 
         # Limit scrolling to world boundaries
         x = max(0, min(x, self.world_width - settings.SCREEN_WIDTH))
@@ -1,6 +1,7 @@
 """ Module that contains representation of buttons in the pause menu. """
 import pygame
 import settings
+from presentation.text_cache import TextCache
 
 
 class Button():
@@ -11,12 +12,12 @@ class Button():
         self.text = text
         self.color = color
         self.text_color = text_color
-        self.font = pygame.font.Font(None, 36)
+        self.font_size = 36
 
     def draw(self, screen):
         """Draws the button on the given screen."""
         pygame.draw.rect(screen, self.color, self.rect)
-        text_surface = self.font.render(self.text, True, self.text_color)
+        text_surface = TextCache.render(self.text, self.font_size, self.text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
 
@@ -33,11 +34,11 @@ class Title:
         self.x = x
         self.y = y
         self.color = color
-        self.font = pygame.font.Font(None, font_size)
+        self.font_size = font_size
 
     def draw(self, screen):
         """Dibuja el título en la pantalla en la posición especificada."""
-        text_surface = self.font.render(self.text, True, self.color)
+        text_surface = TextCache.render(self.text, self.font_size, self.color)
         text_rect = text_surface.get_rect(center=(self.x, self.y))
         screen.blit(text_surface, text_rect)
 
@@ -77,9 +78,9 @@ class ItemCard:
         self.image = pygame.transform.scale(self.image, (50, 50))
 
         # Definir las fuentes
-        self.font_name = pygame.font.Font(None, 36)
-        self.font_description = pygame.font.Font(None, 24)
-        self.font_new = pygame.font.Font(None, 24)
+        self.font_name_size = 36
+        self.font_description_size = 24
+        self.font_new_size = 24
 
         # Definir colores
         self.background_color = (150, 150, 150)  # Gris claro
@@ -101,18 +102,18 @@ class ItemCard:
         screen.blit(self.image, (self.x + 10, self.y + 10))
 
         # Dibujar el nombre del ítem
-        name_surface = self.font_name.render(
-            self.item_name, True, self.text_color)
+        name_surface = TextCache.render(
+            self.item_name, self.font_name_size, self.text_color)
         screen.blit(name_surface, (self.x + 70, self.y + 10))
 
         # Dibujar la descripción
-        description_surface = self.font_description.render(
-            self.description, True, self.text_color)
+        description_surface = TextCache.render(
+            self.description, self.font_description_size, self.text_color)
         screen.blit(description_surface, (self.x + 10, self.y + 70))
 
         # Dibujar el texto "New!" si es un ítem nuevo
         if self.is_new:
-            new_surface = self.font_new.render("New!", True, self.new_color)
+            new_surface = TextCache.render("New!", self.font_new_size, self.new_color)
             screen.blit(new_surface, (self.x + self.width - 45, self.y + 10))
 
     def is_clicked(self, mouse_pos):
@@ -4,7 +4,10 @@ import pygame
 import settings
 from business.world.game_world import GameWorld
 from presentation.camera import Camera
+from presentation.ground_layer import GroundLayer
+from presentation.hud import HudLayer
 from presentation.interfaces import IDisplay
+from presentation.screen_presenter import ScreenPresenter
 from presentation.tileset import Tileset
 from business.entities.interfaces import IMonster
 from business.entities.weapons import PistolWeapon, ShotgunWeapon, MinigunWeapon
@@ -23,10 +26,14 @@ class Display(IDisplay):
 
         # Initialize the camera
         self.camera = Camera()
+        self.__presented_camera_rect: pygame.Rect | None = None
 
-        self.__ground_tileset = self.__load_ground_tileset()
+        self.__presenter = ScreenPresenter(settings.DIRTY_RECT_UPDATES)
+
+        self.__ground_layer = GroundLayer(self.__load_ground_tileset())
         self.__world: GameWorld = None  # type: ignore
         self.weapons = self.__initialize_weapons()
+        self.__hud = HudLayer(self.weapons)
 
     def __initialize_weapons(self):
         """Load and return the available weapons."""
@@ -42,181 +49,97 @@ class Display(IDisplay):
         )
 
     def __render_ground_tiles(self):
-        # Calculate the range of tiles to render based on the camera position
-        start_col = max(0, self.camera.camera_rect.left // settings.TILE_WIDTH)
-        end_col = min(
-            settings.WORLD_COLUMNS, (self.camera.camera_rect.right //
-                                     settings.TILE_WIDTH) + 1
-        )
-        start_row = max(0, self.camera.camera_rect.top // settings.TILE_HEIGHT)
-        end_row = min(
-            settings.WORLD_ROWS, (self.camera.camera_rect.bottom //
-                                  settings.TILE_HEIGHT) + 1
-        )
-
-        for row in range(start_row, end_row):
-            for col in range(start_col, end_col):
-                # Get the tile index from the tile map
-                tile_index = self.__world.tile_map.get(row, col)
-                tile_image = self.__ground_tileset.get_tile(tile_index)
-
-                # Calculate the position on the screen
-                x = col * settings.TILE_WIDTH - self.camera.camera_rect.left
-                y = row * settings.TILE_HEIGHT - self.camera.camera_rect.top
-
-                self.__screen.blit(tile_image, (x, y))
-
-    def __draw_player_health_bar(self):
-        # Get the player's health
-        player = self.__world.player
-
-        # Define the health bar dimensions
-        bar_width = settings.SCREEN_WIDTH // 4
-        bar_height = 15
-        bar_x = settings.SCREEN_WIDTH // 2 - bar_width // 2
-        bar_y = settings.SCREEN_HEIGHT - 25
-
-        # Draw the background bar (gray)
-        bg_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
-        pygame.draw.rect(self.__screen, (45, 45, 45), bg_rect)
-
-        # Draw the health bar (green)
-        health_percentage = player.health / player.max_health
-        health_width = int(bar_width * health_percentage)
-        health_rect = pygame.Rect(bar_x, bar_y, health_width, bar_height)
-        pygame.draw.rect(self.__screen, (0, 255, 0), health_rect)
-
-    def __draw_inventory_slots(self, player_level):
-        # Define el tamaño y la posición de los slots de inventario
-        slot_width = 64
-        slot_height = 64
-        padding = 10
-        start_x = (settings.SCREEN_WIDTH - (3 * slot_width + 2 * padding)) // 2
-        y_position = settings.SCREEN_HEIGHT - slot_height - 100
-
-        # Cargar el icono de bloqueo una vez y escalarlo
-        lock_icon_path = "assets/items/gun/candado.png"
-        lock_icon = pygame.image.load(lock_icon_path).convert_alpha()
-        lock_icon = pygame.transform.scale(
-            lock_icon, (slot_width, slot_height))
-
-        for i in range(len(self.weapons)):  # Iterar según la cantidad de armas
-            x_position = start_x + i * (slot_width + padding)
-            slot_rect = pygame.Rect(x_position, y_position,
-                                    slot_width, slot_height)
-
-            pygame.draw.rect(self.__screen, (100, 100, 100), slot_rect)
-            pygame.draw.rect(self.__screen, (0, 0, 0), slot_rect, 2)
-
-            # Verificar si el arma tiene el atributo 'required_level
-            if player_level >= self.weapons[i].required_level:
-                # Escalar la imagen del arma para ajustarse al tamaño del slot
-                image = pygame.transform.scale(
-                    self.weapons[i].image_path, (slot_width, slot_height))
-                # Dibujar la imagen del arma en el slot
-                self.__screen.blit(image, slot_rect.topleft)
-            else:
-                # Dibujar el icono de bloqueo si el nivel del jugador es insuficiente
-                self.__screen.blit(lock_icon, slot_rect.topleft)
-
-    def __draw_monster_health_bar(self, monster: IMonster):
+        # The ground is baked once per tile map version, a frame only copies the visible area
+        self.__ground_layer.draw(self.__screen, self.__world.tile_map, self.camera.camera_rect)
+
+    def __blit_sequence(self, entities, alpha: float) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        # The sprites at their interpolated positions, moved to screen coordinates without
+        # building a Rect per entity
+        offset_x, offset_y = self.camera.camera_rect.topleft
+        blits = []
+        for entity in entities:
+            sprite = entity.sprite
+            width, height = sprite.rect.size
+            pos_x, pos_y = entity.interpolated_position(alpha)
+            blits.append((sprite.image, (int(pos_x) - width // 2 - offset_x,
+                                         int(pos_y) - height // 2 - offset_y)))
+        return blits
+
+    def __blit_layer(self, blits: list[tuple[pygame.Surface, tuple[int, int]]]):
+        if self.__presenter.dirty_rects:
+            self.__presenter.mark_dirty(self.__screen.blits(blits))
+        else:
+            self.__screen.blits(blits, doreturn=False)
+
+    def __draw_monster_health_bar(self, monster: IMonster, image: pygame.Surface, dest: tuple[int, int]):
         # Get the monster's health
         if monster.health < monster.max_health:
             # Define the health bar dimensions
             bar_width = settings.TILE_WIDTH
             bar_height = 5
-            bar_x = monster.sprite.rect.centerx - \
-                bar_width // 2 - self.camera.camera_rect.left
-            bar_y = monster.sprite.rect.bottom + 5 - self.camera.camera_rect.top
+            bar_x = dest[0] + image.get_width() // 2 - bar_width // 2
+            bar_y = dest[1] + image.get_height() + 5
 
             # Draw the background bar (red)
-            bg_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
-            pygame.draw.rect(self.__screen, (255, 0, 0), bg_rect)
+            bar_rect = pygame.draw.rect(self.__screen, (255, 0, 0), (bar_x, bar_y, bar_width, bar_height))
+            self.__presenter.mark_dirty((bar_rect,))
 
             # Draw the health bar (green)
             health_percentage = monster.health / monster.max_health
             health_width = int(bar_width * health_percentage)
-            health_rect = pygame.Rect(bar_x, bar_y, health_width, bar_height)
-            pygame.draw.rect(self.__screen, (0, 255, 0), health_rect)
-
-    def __draw_player(self):
-        adjusted_rect = self.camera.apply(self.__world.player.sprite.rect)
-        self.__screen.blit(self.__world.player.sprite.image, adjusted_rect)
-
-        self.__draw_player_health_bar()
-
-        # Draw the experience text
-        font = pygame.font.SysFont(None, 30)
-        experience_text = font.render(
-            f"LEVEL: {self.__world.player.level}",
-            True,
-            (255, 209, 92),
-        )
-
-        # Esto agregue Prueba, Se borra o modifica
-        bar_width = settings.SCREEN_WIDTH//2
-        bar_height = 10
-        xp_ratio = self.__world.player.experience / \
-            self.__world.player.experience_to_next_level
-        current_xp_width = int(bar_width * xp_ratio)
+            pygame.draw.rect(self.__screen, (0, 255, 0), (bar_x, bar_y, health_width, bar_height))
 
-        pygame.draw.rect(self.__screen, (161, 157, 155), (settings.SCREEN_WIDTH //
-                         4, settings.SCREEN_HEIGHT - 50, bar_width, bar_height))
-        pygame.draw.rect(self.__screen, (255, 209, 92), (settings.SCREEN_WIDTH //
-                         4, settings.SCREEN_HEIGHT - 50, current_xp_width, bar_height))
-
-        self.__screen.blit(
-            experience_text, (settings.SCREEN_WIDTH//2-45, settings.SCREEN_HEIGHT-80))
-
-    def __draw_timer(self):
-        minutes = self.__world.timer // 60
-        seconds = self.__world.timer % 60
-
-        timer_text = f"{minutes:02}:{seconds:02}"
-
-        font = pygame.font.SysFont(None, 40, True)
-        timer_surface = font.render(timer_text, True, (255, 255, 255))
-        self.__screen.blit(
-            timer_surface, (settings.SCREEN_WIDTH // 2 - 35, 20))
+    def __draw_player(self, alpha: float):
+        self.__blit_layer(self.__blit_sequence((self.__world.player,), alpha))
 
     def load_world(self, world: GameWorld):
         self.__world = world
 
-    def render_frame(self):
+    def render_frame(self, alpha: float = 1.0):
         # Update the camera to follow the player
-        self.camera.update(self.__world.player.sprite.rect)
+        self.camera.center_on(*self.__world.player.interpolated_position(alpha))
+
+        # When the camera moves the whole ground scrolls
+        if self.camera.camera_rect != self.__presented_camera_rect:
+            self.__presenter.mark_all_dirty()
+            self.__presented_camera_rect = self.camera.camera_rect
 
         # Render the ground tiles
         self.__render_ground_tiles()
 
+        # Each layer is submitted in a single blits call, sprites outside the screen are clipped
+        camera_rect = self.camera.camera_rect
+
         # Draw all the experience gems
-        for gem in self.__world.experience_gems:
-            if self.camera.camera_rect.colliderect(gem.sprite.rect):
-                adjusted_rect = self.camera.apply(gem.sprite.rect)
-                self.__screen.blit(gem.sprite.image, adjusted_rect)
+        gems = self.__world.experience_gems_in_rect(camera_rect)
+        self.__blit_layer(self.__blit_sequence(gems, alpha))
 
         # Draw all monsters
-        for monster in self.__world.monsters:
-            if self.camera.camera_rect.colliderect(monster.sprite.rect):
-                self.__draw_monster_health_bar(monster)
-                adjusted_rect = self.camera.apply(monster.sprite.rect)
-                self.__screen.blit(monster.sprite.image, adjusted_rect)
+        monsters = self.__world.monsters_in_rect(camera_rect)
+        monster_blits = self.__blit_sequence(monsters, alpha)
+        for monster, (image, dest) in zip(monsters, monster_blits):
+            self.__draw_monster_health_bar(monster, image, dest)
+        self.__blit_layer(monster_blits)
 
         # Draw the bullets
-        for bullet in self.__world.bullets:
-            if self.camera.camera_rect.colliderect(bullet.sprite.rect):
-                adjusted_rect = self.camera.apply(bullet.sprite.rect)
-                self.__screen.blit(bullet.sprite.image, adjusted_rect)
+        bullets = self.__world.bullets_in_rect(camera_rect)
+        self.__blit_layer(self.__blit_sequence(bullets, alpha))
 
         # Draw the player
-        self.__draw_player()
+        self.__draw_player(alpha)
 
-        # Draw timer
-        self.__draw_timer()
+        # Draw the HUD, only redrawn when the values it shows change
+        self.__presenter.mark_dirty(self.__hud.draw(self.__screen, self.__world.player, self.__world.timer))
 
-        self.__draw_inventory_slots(self.__world.player.level)
         # Update the display
-        pygame.display.flip()
+        self.__presenter.present()
+
+    def present_screen(self):
+        self.__presenter.mark_all_dirty()
+        self.__presenter.present()
+
+        # Whatever was drawn over the game is replaced by the next frame as a whole
+        self.__presented_camera_rect = None
 
     @property
     def screen(self):
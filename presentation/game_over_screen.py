@@ -1,6 +1,6 @@
 import settings
-import pygame
 from presentation.design_elements import Title, Button
+from presentation.text_cache import TextCache
 
 
 class GameOverScreen:
@@ -39,8 +39,8 @@ class GameOverScreen:
 
     def draw_title(self):
         """Dibuja el título 'Game Over' con un efecto de resplandor."""
-        glow_surface = self.title.font.render(
-            self.title.text, True, (200, 0, 0))
+        glow_surface = TextCache.render(
+            self.title.text, self.title.font_size, (200, 0, 0))
         glow_rect = glow_surface.get_rect(
             center=(self.title.x, self.title.y))
         self.screen.blit(glow_surface, glow_rect.move(2, 2))  # Resplandor
@@ -56,7 +56,6 @@ class GameOverScreen:
         self.screen.fill((62, 62, 62))  # Fondo oscuro
         self.draw_title()
         self.draw_buttons()
-        pygame.display.flip()
 
     def check_click(self, mouse_pos):
         """Verifica si los botones han sido clickeados."""
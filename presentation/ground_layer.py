@@ -0,0 +1,50 @@
+"""This module contains the GroundLayer class."""
+
+import pygame
+
+import settings
+from business.world.interfaces import ITileMap
+from presentation.tileset import Tileset
+
+
+class GroundLayer:
+    """The ground tiles of the whole world baked into a single surface.
+
+    The surface is rebuilt only when the tile map changes, so drawing the ground costs one
+    blit of the area the camera sees.
+    """
+
+    def __init__(self, tileset: Tileset):
+        self.__tileset = tileset
+        self.__surface: pygame.Surface | None = None
+        self.__tile_map: ITileMap | None = None
+        self.__version = -1
+
+    def __bake(self, tile_map: ITileMap):
+        surface = pygame.Surface(settings.WORLD_DIMENSION).convert()
+        surface.blits(
+            [
+                (self.__tileset.get_tile(tile_map.get(row, col)),
+                 (col * settings.TILE_WIDTH, row * settings.TILE_HEIGHT))
+                for row in range(settings.WORLD_ROWS)
+                for col in range(settings.WORLD_COLUMNS)
+            ],
+            doreturn=False,
+        )
+
+        self.__surface = surface
+        self.__tile_map = tile_map
+        self.__version = tile_map.version
+
+    def draw(self, screen: pygame.Surface, tile_map: ITileMap, camera_rect: pygame.Rect):
+        """Draws the ground seen by the camera.
+
+        Args:
+            screen (pygame.Surface): The surface to draw on.
+            tile_map (ITileMap): The tile map of the world.
+            camera_rect (pygame.Rect): The area of the world the camera sees.
+        """
+        if self.__surface is None or tile_map is not self.__tile_map or tile_map.version != self.__version:
+            self.__bake(tile_map)
+
+        screen.blit(self.__surface, (0, 0), camera_rect)
@@ -0,0 +1,138 @@
+"""This module contains the HudLayer class."""
+
+import pygame
+
+import settings
+from business.entities.interfaces import IPlayer
+from presentation.sprite import AssetCache
+from presentation.text_cache import TextCache
+
+
+class HudLayer:
+    """The heads-up display drawn on its own surface.
+
+    The health bar, experience bar and inventory slots are drawn on an opaque surface that is
+    only redrawn when one of the values it shows changes, the parts of it the HUD does not cover
+    are made transparent with a color key. The level and timer text are antialiased, so they are
+    blitted straight on the screen from the text cache, the same way as before the HUD was
+    cached. Every frame the HUD costs three blits and looks exactly like drawing it directly.
+    """
+
+    # Never drawn by the HUD, so every pixel of this color is left out of the blit
+    COLOR_KEY = (255, 0, 255)
+
+    LOCK_ICON = "assets/items/gun/candado.png"
+    SLOT_WIDTH = 64
+    SLOT_HEIGHT = 64
+    SLOT_PADDING = 10
+
+    def __init__(self, weapons: list):
+        self.__surface = pygame.Surface(settings.SCREEN_DIMENSION)
+        self.__surface.set_colorkey(HudLayer.COLOR_KEY)
+        self.__bounds = pygame.Rect(0, 0, 0, 0)
+        self.__state: tuple | None = None
+        self.__texts: list[tuple[pygame.Surface, tuple[int, int]]] = []
+
+        # Icons are scaled to the slot size once
+        slot_size = (HudLayer.SLOT_WIDTH, HudLayer.SLOT_HEIGHT)
+        self.__lock_icon = AssetCache.get(HudLayer.LOCK_ICON, slot_size)
+        self.__weapon_slots = [
+            (weapon.required_level, pygame.transform.scale(weapon.image_path, slot_size))
+            for weapon in weapons
+        ]
+
+    def __draw_health_bar(self, player: IPlayer) -> pygame.Rect:
+        # Define the health bar dimensions
+        bar_width = settings.SCREEN_WIDTH // 4
+        bar_height = 15
+        bar_x = settings.SCREEN_WIDTH // 2 - bar_width // 2
+        bar_y = settings.SCREEN_HEIGHT - 25
+
+        # Draw the background bar (gray)
+        pygame.draw.rect(self.__surface, (45, 45, 45), (bar_x, bar_y, bar_width, bar_height))
+
+        # Draw the health bar (green)
+        health_percentage = player.health / player.max_health
+        health_width = int(bar_width * health_percentage)
+        pygame.draw.rect(self.__surface, (0, 255, 0), (bar_x, bar_y, health_width, bar_height))
+        return pygame.Rect(bar_x, bar_y, bar_width, bar_height)
+
+    def __draw_experience(self, player: IPlayer) -> pygame.Rect:
+        bar_width = settings.SCREEN_WIDTH // 2
+        bar_height = 10
+        xp_ratio = player.experience / player.experience_to_next_level
+        current_xp_width = int(bar_width * xp_ratio)
+
+        pygame.draw.rect(self.__surface, (161, 157, 155), (settings.SCREEN_WIDTH //
+                         4, settings.SCREEN_HEIGHT - 50, bar_width, bar_height))
+        pygame.draw.rect(self.__surface, (255, 209, 92), (settings.SCREEN_WIDTH //
+                         4, settings.SCREEN_HEIGHT - 50, current_xp_width, bar_height))
+
+        return pygame.Rect(settings.SCREEN_WIDTH // 4, settings.SCREEN_HEIGHT - 50, bar_width, bar_height)
+
+    @staticmethod
+    def __texts_for(player: IPlayer, timer: int) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        experience_text = TextCache.render(f"LEVEL: {player.level}", 30, (255, 209, 92))
+
+        minutes = timer // 60
+        seconds = timer % 60
+        timer_surface = TextCache.render(f"{minutes:02}:{seconds:02}", 40, (255, 255, 255), bold=True)
+
+        return [(experience_text, (settings.SCREEN_WIDTH//2-45, settings.SCREEN_HEIGHT-80)),
+                (timer_surface, (settings.SCREEN_WIDTH // 2 - 35, 20))]
+
+    def __draw_inventory_slots(self, player_level: int) -> pygame.Rect:
+        slot_width = HudLayer.SLOT_WIDTH
+        slot_height = HudLayer.SLOT_HEIGHT
+        padding = HudLayer.SLOT_PADDING
+        start_x = (settings.SCREEN_WIDTH - (3 * slot_width + 2 * padding)) // 2
+        y_position = settings.SCREEN_HEIGHT - slot_height - 100
+
+        bounds = pygame.Rect(start_x, y_position, 0, slot_height)
+        for i, (required_level, image) in enumerate(self.__weapon_slots):
+            slot_rect = pygame.Rect(start_x + i * (slot_width + padding), y_position,
+                                    slot_width, slot_height)
+
+            pygame.draw.rect(self.__surface, (100, 100, 100), slot_rect)
+            pygame.draw.rect(self.__surface, (0, 0, 0), slot_rect, 2)
+
+            # Locked weapons show the lock icon until the player reaches their level
+            if player_level >= required_level:
+                self.__surface.blit(image, slot_rect.topleft)
+            else:
+                self.__surface.blit(self.__lock_icon, slot_rect.topleft)
+            bounds.union_ip(slot_rect)
+        return bounds
+
+    def __redraw(self, player: IPlayer, timer: int):
+        self.__surface.fill(HudLayer.COLOR_KEY)
+        self.__bounds = self.__draw_health_bar(player).unionall(
+            [self.__draw_experience(player), self.__draw_inventory_slots(player.level)])
+        self.__texts = HudLayer.__texts_for(player, timer)
+
+    def draw(self, screen: pygame.Surface, player: IPlayer, timer: int) -> list[pygame.Rect]:
+        """Draws the HUD, redrawing it first if any value it shows changed.
+
+        Args:
+            screen (pygame.Surface): The surface to draw on.
+            player (IPlayer): The player whose stats are shown.
+            timer (int): The seconds elapsed in game.
+
+        Returns:
+            list[pygame.Rect]: The screen regions whose HUD content changed.
+        """
+        changed = []
+        state = (player.level, player.health, player.max_health,
+                 player.experience, player.experience_to_next_level, timer)
+        if state != self.__state:
+            previous_regions = self.__regions()
+            self.__redraw(player, timer)
+            self.__state = state
+            changed = previous_regions + self.__regions()
+
+        screen.blit(self.__surface, self.__bounds.topleft, self.__bounds)
+        screen.blits(self.__texts, doreturn=False)
+        return changed
+
+    def __regions(self) -> list[pygame.Rect]:
+        return [self.__bounds] + [text.get_rect(topleft=dest) for text, dest in self.__texts]
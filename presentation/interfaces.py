@@ -17,8 +17,17 @@ class IDisplay(ABC):
         """
 
     @abstractmethod
-    def render_frame(self):
-        """Render the current frame."""
+    def render_frame(self, alpha: float = 1.0):
+        """Render the current frame.
+
+        Args:
+            alpha (float): How far rendering is between the previous and the current
+                simulation step, from 0 to 1. Entity positions are interpolated by it.
+        """
+
+    @abstractmethod
+    def present_screen(self):
+        """Present the whole screen, for frames drawn outside `render_frame` such as menus."""
 
     @property
     def screen(self):
@@ -1,6 +1,6 @@
-import pygame
 import settings
 from presentation.design_elements import Title, Container
+from presentation.text_cache import TextCache
 
 
 class PlayerStatsContainer:
@@ -24,6 +24,10 @@ class PlayerStatsContainer:
         # Cargar estadísticas del jugador
         self.stats = estadisticas
 
+    def update_stats(self, estadisticas):
+        """Reemplaza las estadísticas que se muestran."""
+        self.stats = estadisticas
+
     def draw_container(self):
         self.container.draw(self.screen)
 
@@ -34,11 +38,10 @@ class PlayerStatsContainer:
     def draw_stats(self):
         """Dibuja las estadísticas del jugador en pantalla."""
         y_offset = self.start_y
-        font = pygame.font.SysFont(None, 30)
 
         for stat_name, stat_value in self.stats.items():
-            text_surface = font.render(f"{stat_name.capitalize()}: {
-                                       stat_value}", True, self.text_color)
+            text_surface = TextCache.render(f"{stat_name.capitalize()}: {
+                                            stat_value}", 30, self.text_color)
             self.screen.blit(text_surface, (self.start_x, y_offset))
             y_offset += self.line_spacing
 
@@ -47,4 +50,3 @@ class PlayerStatsContainer:
         self.draw_container()
         self.draw_title()
         self.draw_stats()
-        pygame.display.flip()
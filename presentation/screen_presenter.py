@@ -0,0 +1,53 @@
+"""This module contains the ScreenPresenter class."""
+
+from collections.abc import Iterable
+
+import pygame
+
+
+class ScreenPresenter:
+    """Presents the drawn frames on the window.
+
+    By default every frame flips the whole screen. In dirty rectangle mode only the regions
+    drawn in this frame and in the previous one are updated, which is cheaper when little of
+    the screen changes. Anything that changes the whole screen must call `mark_all_dirty`.
+    """
+
+    def __init__(self, dirty_rects: bool):
+        self.__dirty_rects = dirty_rects
+        self.__previous: list[pygame.Rect] = []
+        self.__current: list[pygame.Rect] = []
+        self.__full = True
+
+    @property
+    def dirty_rects(self) -> bool:
+        """Whether only the changed regions are presented."""
+        return self.__dirty_rects
+
+    def mark_dirty(self, rects: Iterable[pygame.Rect]):
+        """Marks regions of the screen that were drawn in this frame.
+
+        Args:
+            rects (Iterable[pygame.Rect]): The regions that were drawn.
+        """
+        if self.__dirty_rects:
+            self.__current.extend(rects)
+
+    def mark_all_dirty(self):
+        """Marks the whole screen to be presented on the next `present`."""
+        self.__full = True
+
+    def present(self):
+        """Presents the frame on the window."""
+        if not self.__dirty_rects:
+            pygame.display.flip()
+            return
+
+        if self.__full:
+            pygame.display.update()
+        else:
+            # The previous regions show where sprites were, they must be cleared too
+            pygame.display.update(self.__previous + self.__current)
+
+        self.__previous, self.__current = self.__current, []
+        self.__full = False
@@ -6,14 +6,89 @@ import settings
 from presentation.tileset import Tileset
 
 
-class Sprite(pygame.sprite.Sprite):
-    """A class representing a sprite."""
+class AssetCache:
+    """Shares the surfaces of the sprite assets.
 
-    def __init__(self, image: pygame.Surface, image_path, rect: pygame.Rect, *groups):
+    Each asset is decoded and scaled once per size, every sprite showing it points at the same
+    surface and only keeps its own rect. The shared surfaces must not be drawn on.
+    """
+
+    __surfaces: dict[tuple, pygame.Surface] = {}
+
+    @staticmethod
+    def get_or_create(key: tuple, factory) -> pygame.Surface:
+        """Gets a shared surface, building it the first time it is requested.
+
+        Args:
+            key (tuple): The key that identifies the surface.
+            factory (Callable[[], pygame.Surface]): Builds the surface when it is not cached.
+
+        Returns:
+            pygame.Surface: The shared surface.
+        """
+        surface = AssetCache.__surfaces.get(key)
+        if surface is None:
+            surface = factory()
+            AssetCache.__surfaces[key] = surface
+        return surface
+
+    @staticmethod
+    def get(path: str, size: tuple[float, float] | None = None) -> pygame.Surface:
+        """Gets an image asset, decoded and scaled once.
+
+        Args:
+            path (str): The path of the image.
+            size (tuple[float, float] | None): The size to scale the image to, None keeps the
+                original size.
+
+        Returns:
+            pygame.Surface: The shared surface of the image.
+        """
+        if size is None:
+            return AssetCache.get_or_create((path, None), lambda: pygame.image.load(path).convert_alpha())
+
+        size = (int(size[0]), int(size[1]))
+        return AssetCache.get_or_create(
+            (path, size), lambda: pygame.transform.scale(AssetCache.get(path), size))
+
+    @staticmethod
+    def tinted(surface: pygame.Surface, color: tuple[int, int, int]) -> pygame.Surface:
+        """Gets a shared copy of a surface multiplied by a color.
+
+        Args:
+            surface (pygame.Surface): The shared surface to tint.
+            color (tuple[int, int, int]): The color to multiply the surface by.
+
+        Returns:
+            pygame.Surface: The shared tinted surface, built once per surface and color.
+        """
+        def create_tinted() -> pygame.Surface:
+            image = surface.copy()
+            image.fill(color, special_flags=pygame.BLEND_MULT)  # pylint: disable=E1101
+            image.set_colorkey((0, 0, 0))  # Set transparency if necessary
+            return image
+
+        return AssetCache.get_or_create(('tint', surface, color), create_tinted)
+
+    @staticmethod
+    def clear():
+        """Drops every cached surface."""
+        AssetCache.__surfaces.clear()
+
+
+class Sprite:
+    """A class representing a sprite.
+
+    Sprites are light render handles: a rect, the shared surface they show and the damage
+    flash state. They do not take part in pygame sprite groups.
+    """
+
+    __slots__ = ('_image', '_image_path', '_rect', '__is_in_damage_countdown', '__original_image')
+
+    def __init__(self, image: pygame.Surface, image_path, rect: pygame.Rect):
         self._image: pygame.Surface = image
         self._image_path = image_path
         self._rect: pygame.Rect = rect
-        super().__init__(*groups)
         self.__is_in_damage_countdown = 0
         self.__original_image: pygame.Surface = image
 
@@ -36,6 +111,15 @@ class Sprite(pygame.sprite.Sprite):
         """
         return self._rect
 
+    @property
+    def is_in_damage_countdown(self) -> bool:
+        """Whether the sprite is still showing the damage color.
+
+        Returns:
+            bool: True while the damage countdown is running.
+        """
+        return self.__is_in_damage_countdown > 0
+
     def update_pos(self, pos_x: float, pos_y: float):
         """Update the position of the sprite.
 
@@ -45,14 +129,23 @@ class Sprite(pygame.sprite.Sprite):
         """
         self._rect.center = (int(pos_x), int(pos_y))
 
+    def reset(self, pos_x: float, pos_y: float):
+        """Moves a recycled sprite and clears its damage flash.
+
+        Args:
+            pos_x (float): The x-coordinate of the sprite.
+            pos_y (float): The y-coordinate of the sprite.
+        """
+        self.update_pos(pos_x, pos_y)
+        self.__is_in_damage_countdown = 0
+        self.__restore_image()
+
     def __restore_image(self):
-        self._image = self.__original_image.copy()
+        self._image = self.__original_image
 
     def __change_color(self, color: tuple[int, int, int]):
-        self._image = self.__original_image.copy()  # Make a copy of the original image
-        # Change color pylint: disable=E1101
-        self._image.fill(color, special_flags=pygame.BLEND_MULT)
-        self._image.set_colorkey((0, 0, 0))  # Set transparency if necessary
+        # The tinted variant is shared, so a hit only swaps which surface is shown
+        self._image = AssetCache.tinted(self.__original_image, color)
 
     def __decrease_damage_countdown(self):
         self.__is_in_damage_countdown -= 1
@@ -65,9 +158,8 @@ class Sprite(pygame.sprite.Sprite):
         self.__change_color((255, 0, 0))
         self.__is_in_damage_countdown = 30
 
-    def update(self, *args, **kwargs):
+    def update(self):
         """Update the sprite behavior"""
-        super().__init__(*args, **kwargs)
         if self.__is_in_damage_countdown > 0:
             self.__decrease_damage_countdown()
 
@@ -91,6 +183,8 @@ class Sprite(pygame.sprite.Sprite):
 class PlayerSprite(Sprite):
     """A class representing the player sprite."""
 
+    __slots__ = ()
+
     ASSET_IDLE = "./assets/entities/player/player.png"
 
     TILE_WIDTH = 64
@@ -99,9 +193,8 @@ class PlayerSprite(Sprite):
     RUN_COLUMNS = 6
 
     def __init__(self, pos_x: float, pos_y: float):
-        image: pygame.Surface = pygame.image.load(
-            PlayerSprite.ASSET_IDLE).convert_alpha()
-        image = pygame.transform.scale(image, settings.TILE_DIMENSION)
+        image: pygame.Surface = AssetCache.get(
+            PlayerSprite.ASSET_IDLE, settings.TILE_DIMENSION)
         rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
 
         super().__init__(image, PlayerSprite.ASSET_IDLE, rect)
@@ -110,16 +203,16 @@ class PlayerSprite(Sprite):
 class ZombieSprite(Sprite):
     """A class representing the zombie sprite."""
 
+    __slots__ = ()
+
     ASSET = "./assets/entities/monsters/zombie/zombie.png"
     TILE_WIDTH = 20
     TILE_HEIGHT = 26
     SIZE_MULTIPLIER = 4
 
     def __init__(self, pos_x: float, pos_y: float):
-        image: pygame.Surface = pygame.image.load(
-            ZombieSprite.ASSET).convert_alpha()
-        image = pygame.transform.scale(
-            image, (ZombieSprite.TILE_WIDTH * ZombieSprite.SIZE_MULTIPLIER, ZombieSprite.TILE_HEIGHT * ZombieSprite.SIZE_MULTIPLIER))
+        image: pygame.Surface = AssetCache.get(
+            ZombieSprite.ASSET, (ZombieSprite.TILE_WIDTH * ZombieSprite.SIZE_MULTIPLIER, ZombieSprite.TILE_HEIGHT * ZombieSprite.SIZE_MULTIPLIER))
         rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
 
         super().__init__(image, ZombieSprite.ASSET, rect)
@@ -128,16 +221,16 @@ class ZombieSprite(Sprite):
 class SkeletonSprite(Sprite):
     """A class representing the skeleton sprite."""
 
+    __slots__ = ()
+
     ASSET = "./assets/entities/monsters/skeleton/skeleton.png"
     TILE_WIDTH = 22
     TILE_HEIGHT = 32
     SIZE_MULTIPLIER = 4
 
     def __init__(self, pos_x: float, pos_y: float):
-        image: pygame.Surface = pygame.image.load(
-            SkeletonSprite.ASSET).convert_alpha()
-        image = pygame.transform.scale(image, (SkeletonSprite.TILE_WIDTH * SkeletonSprite.SIZE_MULTIPLIER,
-                                       SkeletonSprite.TILE_HEIGHT * SkeletonSprite.SIZE_MULTIPLIER))
+        image: pygame.Surface = AssetCache.get(SkeletonSprite.ASSET, (SkeletonSprite.TILE_WIDTH * SkeletonSprite.SIZE_MULTIPLIER,
+                                                                      SkeletonSprite.TILE_HEIGHT * SkeletonSprite.SIZE_MULTIPLIER))
         rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
         super().__init__(image, SkeletonSprite.ASSET, rect)
 
@@ -145,16 +238,16 @@ class SkeletonSprite(Sprite):
 class OrcSprite(Sprite):
     """A class representing the orc sprite."""
 
+    __slots__ = ()
+
     ASSET = "./assets/entities/monsters/orc/orc.png"
     TILE_WIDTH = 22
     TILE_HEIGHT = 16
     SIZE_MULTIPLIER = 5
 
     def __init__(self, pos_x: float, pos_y: float):
-        image: pygame.Surface = pygame.image.load(
-            OrcSprite.ASSET).convert_alpha()
-        image = pygame.transform.scale(
-            image, (OrcSprite.TILE_WIDTH * OrcSprite.SIZE_MULTIPLIER, OrcSprite.TILE_HEIGHT * OrcSprite.SIZE_MULTIPLIER))
+        image: pygame.Surface = AssetCache.get(
+            OrcSprite.ASSET, (OrcSprite.TILE_WIDTH * OrcSprite.SIZE_MULTIPLIER, OrcSprite.TILE_HEIGHT * OrcSprite.SIZE_MULTIPLIER))
         rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
         super().__init__(image, OrcSprite.ASSET, rect)
 
@@ -162,16 +255,16 @@ class OrcSprite(Sprite):
 class WerewolfSprite(Sprite):
     """A class representing the werewolf sprite."""
 
+    __slots__ = ()
+
     ASSET = "./assets/entities/monsters/werewolf/werewolf.png"
     TILE_WIDTH = 36
     TILE_HEIGHT = 32
     SIZE_MULTIPLIER = 3
 
     def __init__(self, pos_x: float, pos_y: float):
-        image: pygame.Surface = pygame.image.load(
-            WerewolfSprite.ASSET).convert_alpha()
-        image = pygame.transform.scale(image, (WerewolfSprite.TILE_WIDTH * WerewolfSprite.SIZE_MULTIPLIER,
-                                       WerewolfSprite.TILE_HEIGHT * WerewolfSprite.SIZE_MULTIPLIER))
+        image: pygame.Surface = AssetCache.get(WerewolfSprite.ASSET, (WerewolfSprite.TILE_WIDTH * WerewolfSprite.SIZE_MULTIPLIER,
+                                                                      WerewolfSprite.TILE_HEIGHT * WerewolfSprite.SIZE_MULTIPLIER))
         rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
         super().__init__(image, WerewolfSprite.ASSET, rect)
 
@@ -179,28 +272,35 @@ class WerewolfSprite(Sprite):
 class BulletSprite(Sprite):
     """A class representing the bullet sprite."""
 
+    __slots__ = ()
+
     def __init__(self, pos_x: float, pos_y: float):
-        image = pygame.Surface(
-            (5, 5), pygame.SRCALPHA)  # pylint: disable=E1101
-        pygame.draw.circle(image, (255, 255, 0), (2, 2), 5)
+        image = AssetCache.get_or_create(('bullet', (5, 5)), BulletSprite.__create_image)
         rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
 
         super().__init__(image, None, rect)
 
+    @staticmethod
+    def __create_image() -> pygame.Surface:
+        image = pygame.Surface(
+            (5, 5), pygame.SRCALPHA)  # pylint: disable=E1101
+        pygame.draw.circle(image, (255, 255, 0), (2, 2), 5)
+        return image
+
 
 class ExperienceGemSprite(Sprite):
     """A class representing the experience gem sprite."""
 
+    __slots__ = ()
+
     ASSET = "./assets/items/gems/experience_gem.png"
     TILE_WIDTH = 64
     TILE_HEIGHT = 64
     SIZE_MULTIPLIER = 0.75
 
     def __init__(self, pos_x: float, pos_y: float):
-        image: pygame.Surface = pygame.image.load(
-            ExperienceGemSprite.ASSET).convert_alpha()
-        image = pygame.transform.scale(image, (ExperienceGemSprite.TILE_WIDTH * ExperienceGemSprite.SIZE_MULTIPLIER,
-                                       ExperienceGemSprite.TILE_HEIGHT * ExperienceGemSprite.SIZE_MULTIPLIER))
+        image: pygame.Surface = AssetCache.get(ExperienceGemSprite.ASSET, (ExperienceGemSprite.TILE_WIDTH * ExperienceGemSprite.SIZE_MULTIPLIER,
+                                                                           ExperienceGemSprite.TILE_HEIGHT * ExperienceGemSprite.SIZE_MULTIPLIER))
         rect: pygame.Rect = image.get_rect(center=(int(pos_x), int(pos_y)))
         super().__init__(image, ExperienceGemSprite.ASSET, rect)
 
@@ -208,16 +308,16 @@ class ExperienceGemSprite(Sprite):
 class HealthGemSprite(Sprite):
     """A class representing the health gem sprite."""
 
+    __slots__ = ()
+
     ASSET = "./assets/items/gems/health_gem.png"
     TILE_WIDTH = 64
     TILE_HEIGHT = 64
     SIZE_MULTIPLIER = 0.75
 
     def __init__(self, pos_x: float, pos_y: float):
-        image: pygame.Surface = pygame.image.load(
-            HealthGemSprite.ASSET).convert_alpha()
-        image = pygame.transform.scale(
-            image,
+        image: pygame.Surface = AssetCache.get(
+            HealthGemSprite.ASSET,
             (
                 int(HealthGemSprite.TILE_WIDTH *
                     HealthGemSprite.SIZE_MULTIPLIER),
@@ -232,16 +332,16 @@ class HealthGemSprite(Sprite):
 class SpeedGemSprite(Sprite):
     """A class representing the speed gem sprite."""
 
+    __slots__ = ()
+
     ASSET = "./assets/items/gems/speed_gem.png"
     TILE_WIDTH = 64
     TILE_HEIGHT = 64
     SIZE_MULTIPLIER = 0.75
 
     def __init__(self, pos_x: float, pos_y: float):
-        image: pygame.Surface = pygame.image.load(
-            SpeedGemSprite.ASSET).convert_alpha()
-        image = pygame.transform.scale(
-            image,
+        image: pygame.Surface = AssetCache.get(
+            SpeedGemSprite.ASSET,
             (
                 int(SpeedGemSprite.TILE_WIDTH * SpeedGemSprite.SIZE_MULTIPLIER),
                 int(SpeedGemSprite.TILE_HEIGHT * SpeedGemSprite.SIZE_MULTIPLIER)
@@ -254,16 +354,16 @@ class SpeedGemSprite(Sprite):
 class DamageGemSprite(Sprite):
     """A class representing the damage gem sprite."""
 
+    __slots__ = ()
+
     ASSET = "./assets/items/gems/damage_gem.png"
     TILE_WIDTH = 64
     TILE_HEIGHT = 64
     SIZE_MULTIPLIER = 0.75
 
     def __init__(self, pos_x: float, pos_y: float):
-        image: pygame.Surface = pygame.image.load(
-            DamageGemSprite.ASSET).convert_alpha()
-        image = pygame.transform.scale(
-            image,
+        image: pygame.Surface = AssetCache.get(
+            DamageGemSprite.ASSET,
             (
                 int(DamageGemSprite.TILE_WIDTH *
                     DamageGemSprite.SIZE_MULTIPLIER),
@@ -278,16 +378,16 @@ class DamageGemSprite(Sprite):
 class DefenceGemSprite(Sprite):
     """A class representing the defence gem sprite."""
 
+    __slots__ = ()
+
     ASSET = "./assets/items/gems/defence_gem.png"
     TILE_WIDTH = 64
     TILE_HEIGHT = 64
     SIZE_MULTIPLIER = 0.75
 
     def __init__(self, pos_x: float, pos_y: float):
-        image: pygame.Surface = pygame.image.load(
-            DefenceGemSprite.ASSET).convert_alpha()
-        image = pygame.transform.scale(
-            image,
+        image: pygame.Surface = AssetCache.get(
+            DefenceGemSprite.ASSET,
             (
                 int(DefenceGemSprite.TILE_WIDTH *
                     DefenceGemSprite.SIZE_MULTIPLIER),
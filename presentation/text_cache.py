@@ -0,0 +1,83 @@
+"""This module contains the FontRegistry and TextCache classes."""
+
+from collections import OrderedDict
+
+import pygame
+
+import settings
+
+
+class FontRegistry:
+    """Shares the fonts used by the presentation.
+
+    Each font is opened once per name, size and weight. Passing no name gives pygame's default
+    font, which is what `pygame.font.SysFont(None, ...)` falls back to, without scanning the
+    system fonts.
+    """
+
+    __fonts: dict[tuple, pygame.font.Font] = {}
+
+    @staticmethod
+    def get(size: int, bold: bool = False, name: str | None = None) -> pygame.font.Font:
+        """Gets a shared font.
+
+        Args:
+            size (int): The size of the font.
+            bold (bool): Whether the font is bold.
+            name (str | None): The path of the font file, None for the default font.
+
+        Returns:
+            pygame.font.Font: The shared font.
+        """
+        key = (name, size, bold)
+        font = FontRegistry.__fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(name, size)
+            font.set_bold(bold)
+            FontRegistry.__fonts[key] = font
+        return font
+
+
+class TextCache:
+    """Keeps the most recently rendered text surfaces.
+
+    Labels that do not change between frames are rendered once and reused. The cache holds at
+    most `settings.TEXT_CACHE_SIZE` surfaces, the least recently used ones are dropped.
+    The cached surfaces are shared and must not be drawn on.
+    """
+
+    __surfaces: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+    @staticmethod
+    def render(text: str, size: int, color: tuple[int, int, int], bold: bool = False,
+               name: str | None = None) -> pygame.Surface:
+        """Gets the antialiased surface of a text.
+
+        Args:
+            text (str): The text to render.
+            size (int): The size of the font.
+            color (tuple[int, int, int]): The color of the text.
+            bold (bool): Whether the font is bold.
+            name (str | None): The path of the font file, None for the default font.
+
+        Returns:
+            pygame.Surface: The shared surface of the text.
+        """
+        key = (name, size, bold, text, tuple(color))
+        surfaces = TextCache.__surfaces
+
+        surface = surfaces.get(key)
+        if surface is not None:
+            surfaces.move_to_end(key)
+            return surface
+
+        surface = FontRegistry.get(size, bold, name).render(text, True, color)
+        surfaces[key] = surface
+        if len(surfaces) > settings.TEXT_CACHE_SIZE:
+            surfaces.popitem(last=False)
+        return surface
+
+    @staticmethod
+    def clear():
+        """Drops every cached surface."""
+        TextCache.__surfaces.clear()
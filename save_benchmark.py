@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Compares the save formats on a busy world, without a window.
+
+Each format saves the same simulated run at a fixed interval, from world snapshots the way the
+autosaver does. The time of every save, the size of the save files and the time to load the
+last save are printed per format.
+"""
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+
+# The dummy drivers must be selected before pygame is imported
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # pylint: disable=wrong-import-position
+
+import settings  # pylint: disable=wrong-import-position
+from business.entities.experience_gem import ExperienceGem  # pylint: disable=wrong-import-position
+from business.entities.monster_factory import MonsterFactory  # pylint: disable=wrong-import-position
+from business.world.simulation import Simulation  # pylint: disable=wrong-import-position
+from headless_runner import initialize_game_world  # pylint: disable=wrong-import-position
+from persistence.gamebinarydao import GameWorldBinaryDAO  # pylint: disable=wrong-import-position
+from persistence.gamejournaldao import GameWorldJournalDAO  # pylint: disable=wrong-import-position
+from persistence.gamejsondao import GameWorldJsonDAO  # pylint: disable=wrong-import-position
+
+FORMATS = {
+    "json": lambda directory: GameWorldJsonDAO(os.path.join(directory, "game_world.json")),
+    "binary": lambda directory: GameWorldBinaryDAO(os.path.join(directory, "game_world.sav")),
+    "journal": lambda directory: GameWorldJournalDAO(os.path.join(directory, "game_world")),
+}
+
+
+def parse_arguments():
+    """Parses the command line arguments"""
+    parser = argparse.ArgumentParser(description="Compares the save formats on a busy world.")
+    parser.add_argument("--monsters", type=int, default=2000, help="monsters in the world")
+    parser.add_argument("--gems", type=int, default=200, help="experience gems in the world")
+    parser.add_argument("--saves", type=int, default=30, help="number of saves per format")
+    parser.add_argument("--ticks", type=int, default=10, help="simulation ticks between saves")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the random generator")
+    return parser.parse_args()
+
+
+def populate_world(arguments):
+    """Creates a world crowded with monsters and gems"""
+    world = initialize_game_world()
+    factory = MonsterFactory()
+    for _ in range(arguments.monsters):
+        world.add_monster(factory.acquire_monster(random.uniform(0, settings.WORLD_WIDTH),
+                                                  random.uniform(0, settings.WORLD_HEIGHT),
+                                                  random.choice(list(MonsterFactory.SPRITES))))
+    for _ in range(arguments.gems):
+        world.add_experience_gem(ExperienceGem(random.uniform(0, settings.WORLD_WIDTH),
+                                               random.uniform(0, settings.WORLD_HEIGHT), 1))
+    world.apply_pending_changes()
+    return world
+
+
+def directory_size(directory: str) -> int:
+    """Gets the size of the files in a directory"""
+    return sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+
+def benchmark(save_format: str, arguments) -> dict:
+    """Saves a simulated run in a format and loads it back"""
+    random.seed(arguments.seed)
+    world = populate_world(arguments)
+    directory = tempfile.mkdtemp(prefix=f"save_benchmark_{save_format}_")
+    try:
+        dao = FORMATS[save_format](directory)
+        save_times = []
+        for _ in range(arguments.saves):
+            for _ in range(arguments.ticks):
+                Simulation.step(world)
+            start = time.perf_counter()
+            dao.save_snapshot(world.snapshot())
+            save_times.append(time.perf_counter() - start)
+
+        # Compaction runs in the background, loading waits for it
+        start = time.perf_counter()
+        FORMATS[save_format](directory).load_game(initialize_game_world())
+        load_time = time.perf_counter() - start
+
+        return {
+            'first_save_ms': save_times[0] * 1000,
+            'mean_save_ms': sum(save_times[1:] or save_times) / len(save_times[1:] or save_times) * 1000,
+            'max_save_ms': max(save_times) * 1000,
+            'size_kb': directory_size(directory) / 1024,
+            'load_ms': load_time * 1000,
+        }
+    finally:
+        shutil.rmtree(directory)
+
+
+def main():
+    """Main function to run the benchmark"""
+    arguments = parse_arguments()
+    pygame.init()  # pylint: disable=E1101
+    # Sprites convert their images to the display format, which needs a display mode
+    pygame.display.set_mode((1, 1))
+
+    print(f"{arguments.monsters} monsters, {arguments.gems} gems, {arguments.saves} saves "
+          f"every {arguments.ticks} ticks")
+    print(f"{'format':<8} {'first save':>11} {'mean save':>10} {'max save':>9} {'on disk':>10} {'load':>9}")
+    for save_format in FORMATS:
+        result = benchmark(save_format, arguments)
+        print(f"{save_format:<8} {result['first_save_ms']:>8.1f} ms {result['mean_save_ms']:>7.1f} ms "
+              f"{result['max_save_ms']:>6.1f} ms {result['size_kb']:>7.0f} KB {result['load_ms']:>6.1f} ms")
+
+    pygame.quit()  # pylint: disable=E1101
+
+
+if __name__ == "__main__":
+    main()
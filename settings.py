@@ -1,7 +1,14 @@
 # pylint: skip-file
 # Display
 GAME_TITLE = "VA Game"
-FPS = 60
+FPS = 60  # Render rate cap
+
+# Simulation
+SIMULATION_TICK_RATE = 60  # Fixed simulation steps per second
+SIMULATION_STEP_MS = 1000 / SIMULATION_TICK_RATE
+MAX_SIMULATION_STEPS_PER_FRAME = 5  # Catch-up cap, the backlog beyond it is dropped
+MAX_FRAME_TIME_MS = 250  # Longer frames (window drags, menus) count as this long
+TIME_SCALE = 1  # Simulated time per real time, above 1 fast-forwards the game
 
 # Tile dimensions
 TILE_HEIGHT = 100  # 32
@@ -30,3 +37,41 @@ MONSTER_BG_COLOR = (255, 0, 0)  # Red
 
 # Game state
 PAUSE = False
+
+# Spatial index
+SPATIAL_GRID_CELL_SIZE = TILE_WIDTH
+
+# Targeting
+TARGETING_STRATEGY = "nearest"  # nearest, lowest_health or densest_cluster
+TARGETING_RANGE = SCREEN_WIDTH  # Monsters farther from the player are not targeted
+TARGETING_CLUSTER_RADIUS = TILE_WIDTH  # Neighbourhood counted by the densest cluster strategy
+
+# Collisions
+COLLISION_BROAD_PHASE = True  # False tests every bullet against every monster
+
+# Text rendering
+TEXT_CACHE_SIZE = 256  # Rendered text surfaces kept, least recently used are dropped
+
+# Presentation
+DIRTY_RECT_UPDATES = False  # Update only the changed screen regions instead of flipping the whole screen
+MENU_EVENT_TIMEOUT_MS = 1000  # Longest a menu sleeps waiting for input before checking its state again
+
+# Monster population
+MONSTER_CAP = 300  # At this many monsters, spawning moves the farthest off-screen one instead
+MONSTER_RELOCATE_DISTANCE = SCREEN_WIDTH * 1.5  # Off-screen monsters farther from the player are moved back
+MONSTER_RELOCATE_MARGIN = TILE_WIDTH  # How far outside the view moved monsters appear
+POPULATION_CHECK_INTERVAL_MS = 500  # Time between checks for monsters that strayed too far
+
+# Experience gems
+GEM_BUDGET = 200  # Above this many plain experience gems, they merge over growing distances
+GEM_MERGE_RADIUS = 48  # Plain experience gems closer than this merge into one
+GEM_MERGE_MAX_RADIUS = GEM_MERGE_RADIUS * 8  # The merge distance never grows past this
+GEM_COALESCE_INTERVAL_MS = 1000  # Time between merges of clustered gems while under the budget
+
+# Saved games
+SAVE_FORMAT = "json"  # json, binary for smaller saves that are faster to write, or journal for frequent saves
+JOURNAL_COMPACT_BYTES = 256 * 1024  # Journal size past which it is folded into a new snapshot in the background
+AUTOSAVE_INTERVAL_MS = 30000  # Game time between background saves, 0 turns autosave off
+
+# Entity pools
+ENTITY_POOL_CAPACITY = 1024  # Free entities kept per kind for reuse
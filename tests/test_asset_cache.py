@@ -0,0 +1,55 @@
+import os
+import unittest
+
+import pygame
+
+from presentation.sprite import AssetCache, ZombieSprite
+
+
+class TestAssetCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+    @classmethod
+    def tearDownClass(cls):
+        AssetCache.clear()
+        pygame.display.quit()
+
+    def test_sprites_share_the_surface_but_not_the_rect(self):
+        first = ZombieSprite(10, 10)
+        second = ZombieSprite(500, 500)
+
+        self.assertIs(first.image, second.image)
+        self.assertIsNot(first.rect, second.rect)
+        self.assertEqual(first.image.get_size(), (ZombieSprite.TILE_WIDTH * ZombieSprite.SIZE_MULTIPLIER,
+                                                  ZombieSprite.TILE_HEIGHT * ZombieSprite.SIZE_MULTIPLIER))
+
+    def test_sizes_are_cached_separately(self):
+        small = AssetCache.get(ZombieSprite.ASSET, (10, 10))
+        self.assertIs(AssetCache.get(ZombieSprite.ASSET, (10.0, 10.0)), small)
+        self.assertIsNot(AssetCache.get(ZombieSprite.ASSET, (20, 20)), small)
+
+    def test_damage_flash_swaps_to_a_shared_tint(self):
+        first = ZombieSprite(10, 10)
+        second = ZombieSprite(500, 500)
+        original = first.image
+
+        first.take_damage()
+        second.take_damage()
+        self.assertIsNot(first.image, original)
+        self.assertIs(first.image, second.image)
+
+        while first.is_in_damage_countdown:
+            first.update()
+        self.assertIs(first.image, original)
+
+    def test_sprites_have_no_instance_dict(self):
+        sprite = ZombieSprite(10, 10)
+        self.assertFalse(hasattr(sprite, '__dict__'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from business.entities.monster_store import MonsterStore
+from business.world.simulation_clock import SimulationClock
+from business.world.world_snapshot import WorldSnapshot
+from persistence.autosaver import AutoSaver
+from persistence.gamejournaldao import GameWorldJournalDAO
+from persistence.gamejsondao import GameWorldJsonDAO
+
+
+class FakeWorld:
+    def __init__(self, timer=0, gems=()):
+        self.timer = timer
+        self.gems = list(gems)
+
+    def snapshot(self):
+        return WorldSnapshot({'health': 100}, self.timer, MonsterStore().snapshot(), [], [], self.gems)
+
+
+class BlockingDAO(GameWorldJsonDAO):
+    def __init__(self, json_path):
+        super().__init__(json_path)
+        self.release = threading.Event()
+
+    def encode_game_data(self, game_data):
+        self.release.wait(5)
+        return super().encode_game_data(game_data)
+
+
+class FailingDAO(GameWorldJsonDAO):
+    def encode_game_data(self, game_data):
+        raise OSError("disk full")
+
+
+class TestAutoSaver(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.save_path = os.path.join(self.directory.name, "game_world.json")
+        self.clock = SimulationClock()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def create(self, dao_class=GameWorldJsonDAO, interval_ms=1000):
+        dao = dao_class(self.save_path)
+        autosaver = AutoSaver(dao, self.clock, interval_ms)
+        self.addCleanup(autosaver.close)
+        return dao, autosaver
+
+    def test_save_writes_the_snapshot_in_the_background(self):
+        _, autosaver = self.create()
+
+        self.assertTrue(autosaver.save(FakeWorld(timer=42)))
+        autosaver.wait()
+
+        with open(self.save_path, 'r', encoding="utf-8") as file:
+            data = json.load(file)
+        self.assertEqual(data['timer'], 42)
+        self.assertEqual(data['monsters'], {})
+        self.assertFalse(os.path.exists(self.save_path + ".tmp"))
+        self.assertEqual(autosaver.metrics['saves'], 1)
+        self.assertIsNotNone(autosaver.last_duration_ms)
+        self.assertIsNotNone(autosaver.last_success_time)
+
+    def test_saves_are_skipped_while_the_disk_is_busy(self):
+        dao, autosaver = self.create(BlockingDAO)
+
+        self.assertTrue(autosaver.save(FakeWorld(timer=1)))
+        self.assertFalse(autosaver.save(FakeWorld(timer=2)))
+        dao.release.set()
+        autosaver.wait()
+
+        self.assertEqual(autosaver.metrics['skipped'], 1)
+        with open(self.save_path, 'r', encoding="utf-8") as file:
+            self.assertEqual(json.load(file)['timer'], 1)
+
+    def test_failures_are_reported_without_touching_the_save(self):
+        _, autosaver = self.create(FailingDAO)
+
+        autosaver.save(FakeWorld())
+        autosaver.wait()
+
+        self.assertIsInstance(autosaver.last_error, OSError)
+        self.assertIsNone(autosaver.last_success_time)
+        with open(self.save_path, 'r', encoding="utf-8") as file:
+            self.assertEqual(json.load(file), {})
+
+    def test_update_waits_for_the_interval(self):
+        _, autosaver = self.create(interval_ms=1000)
+
+        self.assertFalse(autosaver.update(FakeWorld()))
+        self.clock.advance(1000)
+        self.assertTrue(autosaver.update(FakeWorld()))
+
+    def test_zero_interval_turns_autosave_off(self):
+        _, autosaver = self.create(interval_ms=0)
+
+        self.clock.advance(1000)
+        self.assertFalse(autosaver.update(FakeWorld()))
+
+    def test_journal_autosaves_only_append_the_changes(self):
+        base_path = os.path.join(self.directory.name, "game_world")
+        autosaver = AutoSaver(GameWorldJournalDAO(base_path), self.clock, 1000)
+        self.addCleanup(autosaver.close)
+
+        for timer, pos_x, amount in ((1, 5.0, 1), (2, 9.0, 3)):
+            gems = [(7, 'ExperienceGem', {'pos_x': pos_x, 'pos_y': 5.0, 'amount': amount})]
+            autosaver.save(FakeWorld(timer, gems))
+            autosaver.wait()
+
+        with open(base_path + ".journal", 'r', encoding="utf-8") as file:
+            (entry,) = [json.loads(line) for line in file]
+        self.assertEqual(entry['move'], [[7, 9.0, 5.0]])
+        self.assertEqual(entry['change'], [[7, {'amount': 3}]])
+        self.assertNotIn('spawn', entry)
+        self.assertEqual(GameWorldJournalDAO(base_path).read_game_data()['timer'], 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import random
+import unittest
+
+import pygame
+
+from business.handlers.collision_handler import CollisionHandler
+from business.world.spatial_grid import SpatialHashGrid
+
+
+class FakeSprite:
+    def __init__(self, pos_x, pos_y, width, height):
+        self.rect = pygame.Rect(0, 0, width, height)
+        self.rect.center = (int(pos_x), int(pos_y))
+
+    def take_damage(self):
+        pass
+
+
+class FakeEntity:
+    def __init__(self, pos_x, pos_y, width, height, damage_amount=0, health=1000):
+        self.pos_x = pos_x
+        self.pos_y = pos_y
+        self.sprite = FakeSprite(pos_x, pos_y, width, height)
+        self.damage_amount = damage_amount
+        self.damage_taken = 0
+        self.health = health
+
+    def bind_spatial_grid(self, grid):
+        pass
+
+    def take_damage(self, amount):
+        self.damage_taken += amount
+        self.health -= amount
+
+
+class FakeWorld:
+    def __init__(self, bullets, monsters):
+        self.bullets = bullets
+        self.monsters = monsters
+        self.player = FakeEntity(-10000, -10000, 10, 10)
+        self.__grid = SpatialHashGrid(100)
+        for monster in monsters:
+            self.__grid.insert(monster)
+
+    def monsters_in_rect(self, rect):
+        return self.__grid.query_rect(rect)
+
+    def experience_gems_in_rect(self, rect):
+        return []
+
+
+class TestCollisionHandler(unittest.TestCase):
+    def __build_world(self, seed):
+        rng = random.Random(seed)
+        monsters = [FakeEntity(rng.uniform(0, 1500), rng.uniform(0, 1500),
+                               rng.choice([80, 110]), rng.choice([80, 128])) for _ in range(200)]
+        bullets = [FakeEntity(rng.uniform(0, 1500), rng.uniform(0, 1500), 5, 5, damage_amount=5)
+                   for _ in range(300)]
+        return FakeWorld(bullets, monsters)
+
+    def test_broad_phase_matches_brute_force(self):
+        broad_world = self.__build_world(3)
+        brute_world = self.__build_world(3)
+
+        CollisionHandler.handle_collisions(broad_world, broad_phase=True)
+        CollisionHandler.handle_collisions(brute_world, broad_phase=False)
+
+        self.assertGreater(sum(m.damage_taken for m in brute_world.monsters), 0)
+        self.assertEqual([m.damage_taken for m in broad_world.monsters],
+                         [m.damage_taken for m in brute_world.monsters])
+        self.assertEqual([b.damage_taken for b in broad_world.bullets],
+                         [b.damage_taken for b in brute_world.bullets])
+
+    def test_dead_monsters_waiting_for_removal_are_ignored(self):
+        dead = FakeEntity(50, 50, 40, 40, damage_amount=3, health=0)
+        alive = FakeEntity(50, 50, 40, 40, damage_amount=2)
+        bullet = FakeEntity(50, 50, 5, 5, damage_amount=5)
+        world = FakeWorld([bullet], [dead, alive])
+        world.player = FakeEntity(50, 50, 10, 10)
+
+        for broad_phase in (True, False):
+            CollisionHandler.handle_collisions(world, broad_phase=broad_phase)
+
+        self.assertEqual(dead.damage_taken, 0)
+        self.assertEqual(alive.damage_taken, 10)
+        self.assertEqual(world.player.damage_taken, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
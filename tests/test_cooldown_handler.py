@@ -0,0 +1,35 @@
+import unittest
+
+from business.handlers.cooldown_handler import CooldownHandler
+from business.world.simulation_clock import SimulationClock
+
+
+class TestCooldownHandler(unittest.TestCase):
+    def test_cooldown_follows_simulation_clock(self):
+        clock = SimulationClock(500)
+        cooldown = CooldownHandler(1000, clock)
+        self.assertFalse(cooldown.is_action_ready())
+
+        clock.advance(999)
+        self.assertFalse(cooldown.is_action_ready())
+
+        clock.advance(1)
+        self.assertTrue(cooldown.is_action_ready())
+
+        cooldown.put_on_cooldown()
+        self.assertFalse(cooldown.is_action_ready())
+
+    def test_cooldown_without_clock_follows_active_clock(self):
+        previous = SimulationClock.active()
+        clock = SimulationClock()
+        clock.activate()
+        try:
+            cooldown = CooldownHandler(100)
+            clock.advance(100)
+            self.assertTrue(cooldown.is_action_ready())
+        finally:
+            previous.activate()
+
+
+if __name__ == '__main__':
+    unittest.main()
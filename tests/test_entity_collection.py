@@ -0,0 +1,72 @@
+import itertools
+import unittest
+
+from business.world.command_buffer import CommandBuffer
+from business.world.entity_collection import EntityCollection
+
+
+class FakeEntity:
+    def __init__(self, name):
+        self.name = name
+        self.handle = None
+
+    def bind_handle(self, handle):
+        self.handle = handle
+
+
+class TestEntityCollection(unittest.TestCase):
+    def setUp(self):
+        self.collection = EntityCollection(itertools.count(1))
+        self.entities = [FakeEntity(name) for name in "abcde"]
+        for entity in self.entities:
+            self.collection.insert(entity)
+
+    def test_insert_assigns_unique_handles(self):
+        handles = [entity.handle for entity in self.entities]
+        self.assertEqual(len(set(handles)), len(handles))
+        for entity in self.entities:
+            self.assertIs(self.collection.get(entity.handle), entity)
+
+    def test_discard_swaps_last_entity_into_hole(self):
+        a, b, c, d, e = self.entities
+        self.assertTrue(self.collection.discard(b))
+        self.assertEqual(list(self.collection.view), [a, e, c, d])
+        self.assertIs(self.collection.get(e.handle), e)
+        self.assertIsNone(self.collection.get(b.handle))
+        self.assertNotIn(b, self.collection)
+
+    def test_discard_unknown_entity_is_ignored(self):
+        self.assertFalse(self.collection.discard(FakeEntity("x")))
+        self.collection.discard(self.entities[0])
+        self.assertFalse(self.collection.discard(self.entities[0]))
+        self.assertEqual(len(self.collection), 4)
+
+    def test_view_does_not_copy(self):
+        view = self.collection.view
+        self.collection.insert(FakeEntity("f"))
+        self.assertEqual(len(view), 6)
+        with self.assertRaises(AttributeError):
+            view.append(FakeEntity("g"))  # pylint: disable=no-member
+
+
+class TestCommandBuffer(unittest.TestCase):
+    def test_commands_apply_in_order_at_apply(self):
+        collection = EntityCollection(itertools.count(1))
+        commands = CommandBuffer()
+        entity = FakeEntity("a")
+
+        commands.spawn(collection, entity)
+        self.assertEqual(len(collection), 0)
+
+        commands.apply()
+        self.assertIn(entity, collection)
+
+        self.assertTrue(commands.despawn(collection, entity))
+        self.assertFalse(commands.despawn(collection, entity))
+        commands.apply()
+        self.assertEqual(len(collection), 0)
+        self.assertEqual(len(commands), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
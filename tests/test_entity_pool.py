@@ -0,0 +1,107 @@
+import itertools
+import os
+import unittest
+from unittest import mock
+
+import pygame
+
+from business.entities.bullet import Bullet
+from business.entities.entity_pool import EntityPool
+from business.entities.experience_gem import ExperienceGem, SpeedGem
+from business.entities.monster import Monster
+from business.entities.monster_factory import MonsterFactory
+from business.entities.player import Player
+from business.world.entity_collection import EntityCollection
+
+
+class TestEntityPool(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.display.quit()
+
+    def setUp(self):
+        EntityPool.clear()
+
+    def tearDown(self):
+        EntityPool.clear()
+
+    def test_discarded_bullet_is_reused_with_a_fresh_state(self):
+        bullets = EntityCollection(itertools.count(1), recycle=True)
+        bullet = Bullet(0, 0, 10, 0, 5)
+        bullets.insert(bullet)
+        bullet.take_damage(1)
+        bullets.discard(bullet)
+
+        recycled = Bullet.acquire(100, 200, 100, 300, 3)
+
+        self.assertIs(recycled, bullet)
+        self.assertIsNone(recycled.handle)
+        self.assertEqual((recycled.pos_x, recycled.pos_y), (100, 200))
+        self.assertEqual(recycled.health, 1)
+        self.assertEqual(recycled.speed, 3)
+        self.assertEqual(recycled.sprite.rect.center, (100, 200))
+
+    def test_entities_are_only_reused_for_the_same_kind(self):
+        EntityPool.release(SpeedGem(0, 0, 1, 10, 5))
+
+        self.assertIsNone(EntityPool.acquire(ExperienceGem))
+        gem = SpeedGem.acquire(5, 5, 2, 20, 3)
+        self.assertEqual(gem.json_format()['boost'], 20)
+        self.assertEqual(gem.amount, 2)
+        self.assertEqual(EntityPool.free_count(SpeedGem), 0)
+
+    def test_collections_without_recycling_keep_entities_out_of_the_pool(self):
+        gems = EntityCollection(itertools.count(1))
+        gem = ExperienceGem(0, 0, 1)
+        gems.insert(gem)
+        gems.discard(gem)
+
+        self.assertEqual(EntityPool.free_count(ExperienceGem), 0)
+
+    def test_capacity_limits_the_free_entities(self):
+        with mock.patch("settings.ENTITY_POOL_CAPACITY", 2):
+            for _ in range(3):
+                EntityPool.release(ExperienceGem(0, 0, 1))
+
+        self.assertEqual(EntityPool.free_count(ExperienceGem), 2)
+
+    def test_recycled_monster_gets_the_stats_of_its_type(self):
+        factory = MonsterFactory()
+        monster = factory.acquire_monster(0, 0, "orc")
+        monster.take_damage(15)
+        EntityPool.release(monster)
+
+        self.assertIsNot(factory.acquire_monster(0, 0, "zombie"), monster)
+        recycled = factory.acquire_monster(50, 60, "orc")
+
+        self.assertIs(recycled, monster)
+        self.assertEqual((recycled.health, recycled.max_health, recycled.damage_amount), (20, 20, 2))
+        self.assertEqual((recycled.pos_x, recycled.pos_y), (50, 60))
+        self.assertEqual(recycled.monster_type, "orc")
+        self.assertIsInstance(recycled, Monster)
+
+    def test_new_and_recycled_monsters_share_the_stats_table(self):
+        factory = MonsterFactory()
+        with mock.patch.dict(MonsterFactory.STATS, {"orc": (30, 30, 3, 70)}):
+            created = factory.acquire_monster(0, 0, "orc")
+            EntityPool.release(factory.acquire_monster(0, 0, "orc"))
+            recycled = factory.acquire_monster(0, 0, "orc")
+
+        for monster in (created, recycled):
+            self.assertEqual((monster.health, monster.max_health, monster.damage_amount), (30, 30, 3))
+
+    def test_only_poolable_entities_are_recycled(self):
+        self.assertFalse(hasattr(Player, 'reset'))
+        self.assertFalse(hasattr(Player, 'acquire'))
+        with self.assertRaises(TypeError):
+            EntityPool.release(object())
+
+
+if __name__ == "__main__":
+    unittest.main()
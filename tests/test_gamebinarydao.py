@@ -0,0 +1,112 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from business.world.interfaces import IGameWorld
+from persistence.dao_factory import GameDAOFactory
+from persistence.gamebinarydao import GameWorldBinaryDAO
+from persistence.gamejsondao import GameWorldJsonDAO
+from persistence.save_converter import SaveConverter
+
+
+GAME_DATA = {
+    'player': {'health': 80, 'level': 3, 'experience_multiplier': 2.5, 'weapon_type': 'pistol',
+               'pos_x': 10.5, 'pos_y': 20.0},
+    'timer': 95,
+    'monsters': {'Monster': [{
+        'level_multiplier': 2, 'health': 12, 'max_health': 20, 'damage': 2, 'attack_range': 60,
+        'attack_cooldown': {'last_action_time': 4000, 'cooldown_time': 1000},
+        'pos_x': 300.25, 'pos_y': 400.0, 'monster_type': 'orc',
+    }]},
+    'bullets': {'Bullet': [{'pos_x': 1.0, 'pos_y': 2.0, 'dir_x': 0.6, 'dir_y': 0.8,
+                            'damage_amount': 5, 'health': 1, 'speed': 5.0}]},
+    'gems': {
+        'ExperienceGem': [{'pos_x': 5.0, 'pos_y': 6.0, 'amount': 7}],
+        'HealthGem': [{'pos_x': 8.0, 'pos_y': 9.0, 'amount': 1, 'boost': 25, 'duration': 5}],
+    },
+}
+
+
+class TestGameWorldBinaryDAO(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.save_path = os.path.join(self.directory.name, "game_world.sav")
+        self.dao = GameWorldBinaryDAO(self.save_path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_encoding_round_trips_the_game_data(self):
+        self.assertEqual(GameWorldBinaryDAO.decode(GameWorldBinaryDAO.encode(GAME_DATA)), GAME_DATA)
+
+    def test_new_and_cleared_saves_have_no_game_data(self):
+        self.assertFalse(self.dao.has_saved_game_data())
+
+        with open(self.save_path, 'wb') as file:
+            file.write(GameWorldBinaryDAO.encode(GAME_DATA))
+        dao = GameWorldBinaryDAO(self.save_path)
+        self.assertTrue(dao.has_saved_game_data())
+
+        dao.clear_save()
+        self.assertFalse(dao.has_saved_game_data())
+        self.assertEqual(os.path.getsize(self.save_path), 0)
+
+    def test_save_state_is_kept_in_memory(self):
+        self.dao.has_saved_game_data()
+        with patch("builtins.open") as mocked_open:
+            self.dao.clear_save()
+            self.assertFalse(self.dao.has_saved_game_data())
+        mocked_open.assert_not_called()
+
+        self.dao.save_encoded(GameWorldBinaryDAO.encode(GAME_DATA))
+        self.assertTrue(self.dao.has_saved_game_data())
+        self.assertFalse(os.path.exists(self.save_path + ".tmp"))
+
+    def test_other_versions_are_rejected(self):
+        buffer = bytearray(GameWorldBinaryDAO.encode(GAME_DATA))
+        buffer[4] = GameWorldBinaryDAO.VERSION + 1
+
+        with self.assertRaises(ValueError):
+            GameWorldBinaryDAO.decode(bytes(buffer))
+
+    def test_save_game_groups_entities_by_class(self):
+        game_world = MagicMock(spec=IGameWorld)
+        game_world.monsters = []
+        game_world.bullets = []
+        gem = MagicMock(json_format=MagicMock(return_value=GAME_DATA['gems']['ExperienceGem'][0]))
+        gem.__class__.__name__ = 'ExperienceGem'
+        game_world.experience_gems = [gem]
+        game_world.player = MagicMock(json_format=MagicMock(return_value=GAME_DATA['player']))
+        game_world.timer = 95
+
+        self.dao.save_game(game_world)
+        self.dao.load_game(game_world)
+
+        game_world.load_game_data.assert_called_once_with({
+            'player': GAME_DATA['player'], 'timer': 95, 'monsters': {}, 'bullets': {},
+            'gems': {'ExperienceGem': GAME_DATA['gems']['ExperienceGem']},
+        })
+
+    def test_converter_round_trips_a_json_save(self):
+        json_path = os.path.join(self.directory.name, "game_world.json")
+        with open(json_path, 'w', encoding="utf-8") as file:
+            json.dump(GAME_DATA, file)
+
+        SaveConverter.json_to_binary(json_path, self.save_path)
+        os.remove(json_path)
+        SaveConverter.binary_to_json(self.save_path, json_path)
+
+        with open(json_path, 'r', encoding="utf-8") as file:
+            self.assertEqual(json.load(file), GAME_DATA)
+
+    def test_factory_selects_the_dao_by_format(self):
+        self.assertIs(GameDAOFactory.DAOS["binary"], GameWorldBinaryDAO)
+        self.assertIs(GameDAOFactory.DAOS["json"], GameWorldJsonDAO)
+        with self.assertRaises(ValueError):
+            GameDAOFactory.create("xml")
+
+
+if __name__ == '__main__':
+    unittest.main()
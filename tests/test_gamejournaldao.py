@@ -0,0 +1,149 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from persistence.gamejournaldao import GameWorldJournalDAO
+
+
+class FakeEntity:
+    def __init__(self, handle, **record):
+        self.handle = handle
+        self.record = record
+
+    def json_format(self):
+        return dict(self.record)
+
+
+class Monster(FakeEntity):
+    pass
+
+
+class ExperienceGem(FakeEntity):
+    pass
+
+
+class FakePlayer:
+    def __init__(self):
+        self.record = {'health': 100, 'level': 1, 'pos_x': 0.0, 'pos_y': 0.0}
+
+    def json_format(self):
+        return dict(self.record)
+
+
+class FakeWorld:
+    def __init__(self):
+        self.monsters = []
+        self.bullets = []
+        self.experience_gems = []
+        self.player = FakePlayer()
+        self.timer = 0
+
+
+class TestGameWorldJournalDAO(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.base_path = os.path.join(self.directory.name, "game_world")
+        self.journal_path = self.base_path + ".journal"
+        self.dao = GameWorldJournalDAO(self.base_path)
+        self.world = FakeWorld()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def journal_lines(self):
+        with open(self.journal_path, 'r', encoding="utf-8") as file:
+            return [json.loads(line) for line in file]
+
+    def test_saves_after_the_first_only_append_the_changes(self):
+        zombie = Monster(1, pos_x=10.0, pos_y=10.0, health=10)
+        orc = Monster(2, pos_x=50.0, pos_y=50.0, health=20)
+        self.world.monsters = [zombie, orc]
+        self.dao.save_game(self.world)
+        self.assertFalse(os.path.exists(self.journal_path))
+
+        zombie.record['pos_x'] = 12.0
+        self.world.monsters = [zombie]
+        self.world.experience_gems = [ExperienceGem(3, pos_x=50.0, pos_y=50.0, amount=1)]
+        self.world.player.record['health'] = 90
+        self.world.timer = 5
+        self.dao.save_game(self.world)
+
+        (entry,) = self.journal_lines()
+        self.assertEqual(entry['move'], [[1, 12.0, 10.0]])
+        self.assertNotIn('change', entry)
+        self.assertEqual(entry['remove'], [2])
+        self.assertEqual(entry['spawn'], [[3, 'gems', 'ExperienceGem', {'pos_x': 50.0, 'pos_y': 50.0, 'amount': 1}]])
+        self.assertEqual(entry['player'], {'health': 90})
+
+        data = GameWorldJournalDAO(self.base_path).read_game_data()
+        self.assertEqual(data['monsters'], {'Monster': [{'pos_x': 12.0, 'pos_y': 10.0, 'health': 10}]})
+        self.assertEqual(data['gems'], {'ExperienceGem': [{'pos_x': 50.0, 'pos_y': 50.0, 'amount': 1}]})
+        self.assertEqual(data['player']['health'], 90)
+        self.assertEqual(data['timer'], 5)
+
+    def test_an_entry_cut_short_by_a_crash_is_ignored(self):
+        monster = Monster(1, pos_x=10.0, pos_y=10.0)
+        self.world.monsters = [monster]
+        self.dao.save_game(self.world)
+        monster.record['pos_x'] = 20.0
+        self.dao.save_game(self.world)
+
+        with open(self.journal_path, 'ab') as file:
+            file.write(b'{"generation":1,"sequ')
+
+        data = GameWorldJournalDAO(self.base_path).read_game_data()
+        self.assertEqual(data['monsters']['Monster'][0]['pos_x'], 20.0)
+
+    def test_a_long_journal_is_compacted_into_the_snapshot(self):
+        monster = Monster(1, pos_x=0.0, pos_y=0.0)
+        self.world.monsters = [monster]
+        with patch("settings.JOURNAL_COMPACT_BYTES", 200):
+            for step in range(20):
+                monster.record['pos_x'] = float(step)
+                self.world.timer = step
+                self.dao.save_game(self.world)
+            data = self.dao.read_game_data()
+
+        self.assertEqual(data['monsters']['Monster'][0]['pos_x'], 19.0)
+        self.assertEqual(data['timer'], 19)
+        journal_files = [name for name in os.listdir(self.directory.name) if ".journal." in name]
+        self.assertEqual(journal_files, [])
+        # The last save may have set the whole journal aside for compaction
+        journal_size = os.path.getsize(self.journal_path) if os.path.exists(self.journal_path) else 0
+        self.assertLess(journal_size, 200 + 100)
+
+    def test_loading_starts_a_new_snapshot_on_the_next_save(self):
+        self.world.monsters = [Monster(1, pos_x=0.0, pos_y=0.0)]
+        self.dao.save_game(self.world)
+        self.dao.save_game(self.world)
+
+        loaded = []
+        self.world.clear_all_entities = lambda: None
+        self.world.load_game_data = loaded.append
+        self.dao.load_game(self.world)
+        self.world.monsters = [Monster(7, pos_x=0.0, pos_y=0.0)]
+        self.dao.save_game(self.world)
+
+        self.assertEqual(len(loaded), 1)
+        self.assertFalse(os.path.exists(self.journal_path))
+        self.assertEqual(len(self.dao.read_game_data()['monsters']['Monster']), 1)
+
+    def test_clear_save_removes_every_file_once(self):
+        self.world.monsters = [Monster(1, pos_x=0.0, pos_y=0.0)]
+        self.dao.save_game(self.world)
+        self.dao.save_game(self.world)
+        self.assertTrue(self.dao.has_saved_game_data())
+
+        self.dao.clear_save()
+        self.assertEqual(os.listdir(self.directory.name), [])
+        with patch("os.remove") as remove:
+            self.dao.clear_save()
+        remove.assert_not_called()
+        self.assertFalse(self.dao.has_saved_game_data())
+        self.assertEqual(self.dao.read_game_data(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
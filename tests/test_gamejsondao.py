@@ -87,6 +87,14 @@ class TestGameWorldJsonDAO(unittest.TestCase):
         self.dao.clear_save()
         mock_open().write.assert_called_once_with(json.dumps({}, indent=4))
 
+    def test_clear_save_only_writes_when_there_is_a_save(self):
+        """Test that clearing an empty save and checking it again do not touch the file."""
+        self.dao.clear_save()
+        with patch("builtins.open") as mocked_open:
+            self.dao.clear_save()
+            self.assertFalse(self.dao.has_saved_game_data())
+        mocked_open.assert_not_called()
+
     @patch("builtins.open", new_callable=mock_open, read_data='{"monsters": {}, "player": {}}')
     @patch("os.path.exists", return_value=True)
     def test_load_game(self, mock_exists, mock_open):
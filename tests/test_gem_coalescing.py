@@ -0,0 +1,90 @@
+import os
+import unittest
+from unittest import mock
+
+import pygame
+
+import settings
+from business.entities.entity_pool import EntityPool
+from business.entities.experience_gem import ExperienceGem, HealthGem
+from business.world.game_world import GameWorld
+from business.world.simulation_clock import SimulationClock
+
+
+class TestGemCoalescing(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+    @classmethod
+    def tearDownClass(cls):
+        EntityPool.clear()
+        pygame.display.quit()
+
+    def setUp(self):
+        self.clock = SimulationClock()
+        self.world = GameWorld(None, None, None, self.clock)
+
+    def add_gems(self, *gems):
+        for gem in gems:
+            self.world.add_experience_gem(gem)
+        self.clock.advance(settings.GEM_COALESCE_INTERVAL_MS)
+        self.world.apply_pending_changes()
+
+    def test_clustered_plain_gems_merge_without_losing_experience(self):
+        self.add_gems(ExperienceGem(100, 100, 1), ExperienceGem(110, 100, 2),
+                      ExperienceGem(100, 115, 3), ExperienceGem(1000, 1000, 1))
+
+        amounts = sorted(gem.amount for gem in self.world.experience_gems)
+        self.assertEqual(amounts, [1, 6])
+
+    def test_clusters_wait_for_the_coalesce_interval(self):
+        self.add_gems(ExperienceGem(100, 100, 1))
+        self.world.add_experience_gem(ExperienceGem(105, 100, 1))
+        self.world.apply_pending_changes()
+
+        self.assertEqual(len(self.world.experience_gems), 2)
+
+    def test_boost_gems_keep_their_type(self):
+        self.add_gems(ExperienceGem(100, 100, 1), HealthGem(105, 100, 1, 25, 5))
+
+        self.assertEqual(sorted(type(gem).__name__ for gem in self.world.experience_gems),
+                         ["ExperienceGem", "HealthGem"])
+
+    def test_gems_merge_over_longer_distances_above_the_budget(self):
+        # Farther apart than the base merge radius, but within the largest one
+        gems = [ExperienceGem(100 + index * 100, 100, 1) for index in range(10)]
+        with mock.patch("settings.GEM_BUDGET", 4):
+            self.add_gems(*gems)
+
+        self.assertLessEqual(len(self.world.experience_gems), 4)
+        self.assertEqual(sum(gem.amount for gem in self.world.experience_gems), 10)
+
+    def test_budget_is_met_when_no_gems_are_within_the_base_radius(self):
+        gems = [ExperienceGem(100 + (index % 30) * 60, 100 + (index // 30) * 60, 1) for index in range(600)]
+        with mock.patch("settings.GEM_BUDGET", 200):
+            self.add_gems(*gems)
+
+            self.assertLessEqual(len(self.world.experience_gems), 200)
+            self.assertEqual(sum(gem.amount for gem in self.world.experience_gems), 600)
+
+    def test_boost_gems_do_not_count_against_the_budget(self):
+        boost_gems = [HealthGem(100 + index * 10, 100, 1, 25, 5) for index in range(10)]
+        plain_gems = [ExperienceGem(100, 2000, 1), ExperienceGem(3000, 2000, 1), ExperienceGem(3000, 100, 1)]
+        with mock.patch("settings.GEM_BUDGET", 4):
+            self.add_gems(*boost_gems, *plain_gems)
+
+        self.assertEqual(len(self.world.experience_gems), 13)
+
+    def test_merging_stays_local_when_the_budget_can_not_be_met(self):
+        gems = [ExperienceGem(100 + index * 1000, 100, 1) for index in range(6)]
+        with mock.patch("settings.GEM_BUDGET", 4):
+            self.add_gems(*gems)
+
+        self.assertEqual(len(self.world.experience_gems), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import random
+import unittest
+
+import pygame
+
+import settings
+from presentation.hud import HudLayer
+from presentation.text_cache import TextCache
+
+
+class FakePlayer:
+    def __init__(self):
+        self.level = 2
+        self.health = 60
+        self.max_health = 100
+        self.experience = 3
+        self.experience_to_next_level = 10
+
+
+class FakeWeapon:
+    def __init__(self, required_level, color):
+        self.required_level = required_level
+        self.image_path = pygame.Surface((32, 32), pygame.SRCALPHA)  # pylint: disable=E1101
+        pygame.draw.circle(self.image_path, color, (16, 16), 12)
+
+
+def draw_directly(screen, player, timer, weapons):
+    """Draws the HUD on the screen the way the game did before the HUD was cached."""
+    bar_width = settings.SCREEN_WIDTH // 4
+    bar_x = settings.SCREEN_WIDTH // 2 - bar_width // 2
+    pygame.draw.rect(screen, (45, 45, 45), (bar_x, settings.SCREEN_HEIGHT - 25, bar_width, 15))
+    pygame.draw.rect(screen, (0, 255, 0), (bar_x, settings.SCREEN_HEIGHT - 25,
+                                           int(bar_width * player.health / player.max_health), 15))
+
+    bar_width = settings.SCREEN_WIDTH // 2
+    pygame.draw.rect(screen, (161, 157, 155), (settings.SCREEN_WIDTH // 4, settings.SCREEN_HEIGHT - 50,
+                                               bar_width, 10))
+    pygame.draw.rect(screen, (255, 209, 92), (settings.SCREEN_WIDTH // 4, settings.SCREEN_HEIGHT - 50,
+                                              int(bar_width * player.experience / player.experience_to_next_level),
+                                              10))
+    screen.blit(TextCache.render(f"LEVEL: {player.level}", 30, (255, 209, 92)),
+                (settings.SCREEN_WIDTH // 2 - 45, settings.SCREEN_HEIGHT - 80))
+    screen.blit(TextCache.render(f"{timer // 60:02}:{timer % 60:02}", 40, (255, 255, 255), bold=True),
+                (settings.SCREEN_WIDTH // 2 - 35, 20))
+
+    start_x = (settings.SCREEN_WIDTH - (3 * 64 + 2 * 10)) // 2
+    lock_icon = pygame.transform.scale(pygame.image.load(HudLayer.LOCK_ICON).convert_alpha(), (64, 64))
+    for i, weapon in enumerate(weapons):
+        slot_rect = pygame.Rect(start_x + i * 74, settings.SCREEN_HEIGHT - 164, 64, 64)
+        pygame.draw.rect(screen, (100, 100, 100), slot_rect)
+        pygame.draw.rect(screen, (0, 0, 0), slot_rect, 2)
+        if player.level >= weapon.required_level:
+            screen.blit(pygame.transform.scale(weapon.image_path, (64, 64)), slot_rect.topleft)
+        else:
+            screen.blit(lock_icon, slot_rect.topleft)
+
+
+class TestHudLayer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        pygame.font.init()
+        pygame.display.set_mode(settings.SCREEN_DIMENSION)
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.display.quit()
+
+    def setUp(self):
+        self.weapons = [FakeWeapon(1, (200, 40, 40, 160)), FakeWeapon(2, (40, 200, 40, 255)),
+                        FakeWeapon(5, (40, 40, 200, 90))]
+        self.player = FakePlayer()
+
+    def noisy_screen(self):
+        screen = pygame.display.get_surface().copy()
+        rng = random.Random(4)
+        for _ in range(300):
+            color = (rng.randrange(256), rng.randrange(256), rng.randrange(256))
+            pygame.draw.rect(screen, color, (rng.randrange(settings.SCREEN_WIDTH),
+                                             rng.randrange(settings.SCREEN_HEIGHT), 90, 90))
+        return screen
+
+    def assert_same_pixels(self, surface, other):
+        self.assertEqual(pygame.image.tobytes(surface, "RGB"), pygame.image.tobytes(other, "RGB"))
+
+    def test_cached_hud_matches_drawing_it_directly(self):
+        hud = HudLayer(self.weapons)
+        expected = self.noisy_screen()
+        draw_directly(expected, self.player, 125, self.weapons)
+
+        for _ in range(2):
+            screen = self.noisy_screen()
+            hud.draw(screen, self.player, 125)
+            self.assert_same_pixels(screen, expected)
+
+    def test_only_changes_report_dirty_regions(self):
+        hud = HudLayer(self.weapons)
+        screen = self.noisy_screen()
+
+        self.assertTrue(hud.draw(screen, self.player, 1))
+        self.assertEqual(hud.draw(screen, self.player, 1), [])
+        self.player.health = 20
+        self.assertTrue(hud.draw(screen, self.player, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import os
+import unittest
+from unittest import mock
+
+import pygame
+
+import settings
+from business.entities.monster_factory import MonsterFactory
+from business.entities.monster_store import MonsterStore
+from business.world.population_manager import PopulationManager
+from business.world.simulation_clock import SimulationClock
+
+
+class TestPopulationManager(unittest.TestCase):
+    PLAYER = (settings.WORLD_WIDTH / 2, settings.WORLD_HEIGHT / 2)
+
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.display.quit()
+
+    def setUp(self):
+        self.clock = SimulationClock()
+        self.store = MonsterStore()
+        self.manager = PopulationManager(self.store, self.clock)
+        self.factory = MonsterFactory()
+
+    def add_monster(self, pos_x, pos_y):
+        monster = self.factory.create_monster(pos_x, pos_y, MonsterFactory.SPRITES["zombie"](pos_x, pos_y), "zombie")
+        self.store.adopt(monster)
+        return monster
+
+    def is_just_outside_the_view(self, monster):
+        player_x, player_y = self.PLAYER
+        offset_x = abs(monster.pos_x - player_x)
+        offset_y = abs(monster.pos_y - player_y)
+        limit_x = settings.SCREEN_WIDTH / 2 + settings.MONSTER_RELOCATE_MARGIN + 1
+        limit_y = settings.SCREEN_HEIGHT / 2 + settings.MONSTER_RELOCATE_MARGIN + 1
+        return offset_x <= limit_x and offset_y <= limit_y and (
+            offset_x > settings.SCREEN_WIDTH / 2 or offset_y > settings.SCREEN_HEIGHT / 2)
+
+    def test_farthest_offscreen_monster_is_moved_next_to_the_view(self):
+        near = self.add_monster(self.PLAYER[0] + settings.SCREEN_WIDTH, self.PLAYER[1])
+        far = self.add_monster(0, 0)
+
+        self.assertTrue(self.manager.relocate_farthest(*self.PLAYER))
+
+        self.assertTrue(self.is_just_outside_the_view(far))
+        self.assertEqual(near.pos_x, self.PLAYER[0] + settings.SCREEN_WIDTH)
+        self.assertEqual(self.manager.relocated, 1)
+
+    def test_monsters_on_screen_are_never_moved(self):
+        on_screen = self.add_monster(self.PLAYER[0] + 10, self.PLAYER[1])
+
+        self.assertFalse(self.manager.relocate_farthest(*self.PLAYER))
+        self.assertEqual((on_screen.pos_x, on_screen.pos_y), (self.PLAYER[0] + 10, self.PLAYER[1]))
+
+    def test_update_brings_back_monsters_past_the_distance(self):
+        stray = self.add_monster(0, 0)
+        close = self.add_monster(self.PLAYER[0] + settings.SCREEN_WIDTH, self.PLAYER[1])
+
+        self.clock.advance(settings.POPULATION_CHECK_INTERVAL_MS)
+        self.manager.update(*self.PLAYER)
+
+        self.assertTrue(self.is_just_outside_the_view(stray))
+        self.assertEqual(close.pos_x, self.PLAYER[0] + settings.SCREEN_WIDTH)
+        self.assertEqual(self.manager.metrics["relocated"], 1)
+
+    def test_capacity_follows_the_monster_cap(self):
+        self.add_monster(0, 0)
+        with mock.patch("settings.MONSTER_CAP", 2):
+            self.assertFalse(self.manager.at_capacity)
+            self.add_monster(0, 0)
+            self.assertTrue(self.manager.at_capacity)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+from unittest.mock import patch
+
+import pygame
+
+from presentation.screen_presenter import ScreenPresenter
+
+
+class TestScreenPresenter(unittest.TestCase):
+    @patch('pygame.display.flip')
+    def test_flips_when_dirty_rects_are_off(self, flip):
+        presenter = ScreenPresenter(dirty_rects=False)
+        presenter.mark_dirty([pygame.Rect(0, 0, 10, 10)])
+        presenter.present()
+        flip.assert_called_once_with()
+
+    @patch('pygame.display.update')
+    def test_updates_current_and_previous_regions(self, update):
+        presenter = ScreenPresenter(dirty_rects=True)
+        first, second = pygame.Rect(0, 0, 10, 10), pygame.Rect(50, 50, 10, 10)
+
+        presenter.mark_dirty([first])
+        presenter.present()
+        update.assert_called_with()  # The first frame is presented whole
+
+        presenter.mark_dirty([second])
+        presenter.present()
+        update.assert_called_with([first, second])
+
+        presenter.present()
+        update.assert_called_with([second])
+
+        presenter.mark_all_dirty()
+        presenter.present()
+        update.assert_called_with()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import random
+import unittest
+
+import pygame
+
+from business.world.spatial_grid import SpatialHashGrid
+
+
+class FakeSprite:
+    def __init__(self, pos_x, pos_y, size):
+        self.rect = pygame.Rect(0, 0, size, size)
+        self.rect.center = (int(pos_x), int(pos_y))
+
+
+class FakeEntity:
+    def __init__(self, pos_x, pos_y, size=10):
+        self.pos_x = pos_x
+        self.pos_y = pos_y
+        self.sprite = FakeSprite(pos_x, pos_y, size)
+        self.grid = None
+
+    def bind_spatial_grid(self, grid):
+        self.grid = grid
+
+    def move_to(self, pos_x, pos_y):
+        self.pos_x, self.pos_y = pos_x, pos_y
+        self.sprite.rect.center = (int(pos_x), int(pos_y))
+        if self.grid is not None:
+            self.grid.update(self)
+
+
+class TestSpatialHashGrid(unittest.TestCase):
+    def setUp(self):
+        random.seed(7)
+        self.grid = SpatialHashGrid(100)
+        self.entities = [FakeEntity(random.uniform(-50, 2000), random.uniform(-50, 2000),
+                                    random.choice([5, 64, 120])) for _ in range(300)]
+        for entity in self.entities:
+            self.grid.insert(entity)
+
+    def test_insert_binds_and_remove_unbinds(self):
+        entity = self.entities[0]
+        self.assertIs(entity.grid, self.grid)
+        self.grid.remove(entity)
+        self.assertIsNone(entity.grid)
+        self.assertEqual(len(self.grid), len(self.entities) - 1)
+
+    def test_query_rect_finds_every_overlapping_entity(self):
+        for _ in range(50):
+            rect = pygame.Rect(random.randint(0, 1800), random.randint(0, 1800),
+                               random.randint(1, 400), random.randint(1, 400))
+            expected = {e for e in self.entities if e.sprite.rect.colliderect(rect)}
+            found = set(self.grid.query_rect(rect))
+            self.assertTrue(expected <= found)
+
+    def test_query_radius_matches_brute_force(self):
+        expected = {e for e in self.entities if (e.pos_x - 500) ** 2 + (e.pos_y - 700) ** 2 <= 250 ** 2}
+        self.assertEqual(set(self.grid.query_radius(500, 700, 250)), expected)
+
+    def test_nearest_matches_brute_force(self):
+        for _ in range(50):
+            x, y = random.uniform(-500, 2500), random.uniform(-500, 2500)
+            expected = min((e.pos_x - x) ** 2 + (e.pos_y - y) ** 2 for e in self.entities)
+            nearest = self.grid.nearest(x, y)
+            self.assertAlmostEqual((nearest.pos_x - x) ** 2 + (nearest.pos_y - y) ** 2, expected)
+
+    def test_nearest_respects_max_distance(self):
+        grid = SpatialHashGrid(100)
+        grid.insert(FakeEntity(1000, 1000))
+        self.assertIsNone(grid.nearest(0, 0, max_distance=500))
+        self.assertIsNone(SpatialHashGrid(100).nearest(0, 0))
+
+    def test_moving_entity_changes_cell(self):
+        entity = self.entities[0]
+        entity.move_to(5000, 5000)
+        self.assertIn(entity, self.grid.query_rect(pygame.Rect(4990, 4990, 20, 20)))
+        self.assertIs(self.grid.nearest(5001, 5001), entity)
+
+
+if __name__ == '__main__':
+    unittest.main()
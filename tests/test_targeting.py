@@ -0,0 +1,87 @@
+import unittest
+
+import pygame
+
+from business.entities.targeting import (DensestClusterTargeting, LowestHealthTargeting,
+                                         NearestTargeting, TargetingStrategy)
+from business.world.spatial_grid import SpatialHashGrid
+
+
+class FakeSprite:
+    def __init__(self):
+        self.rect = pygame.Rect(0, 0, 10, 10)
+
+
+class FakeMonster:
+    def __init__(self, handle, pos_x, pos_y, health=10):
+        self.handle = handle
+        self.pos_x = pos_x
+        self.pos_y = pos_y
+        self.health = health
+        self.sprite = FakeSprite()
+
+    def bind_spatial_grid(self, grid):
+        pass
+
+
+class FakeWorld:
+    def __init__(self, monsters):
+        self.__grid = SpatialHashGrid(100)
+        self.__monsters = {}
+        for monster in monsters:
+            self.add(monster)
+
+    def add(self, monster):
+        self.__monsters[monster.handle] = monster
+        self.__grid.insert(monster)
+
+    def remove(self, monster):
+        del self.__monsters[monster.handle]
+        self.__grid.remove(monster)
+
+    def get_monster(self, handle):
+        return self.__monsters.get(handle)
+
+    def nearest_monster(self, pos_x, pos_y, max_distance=None):
+        return self.__grid.nearest(pos_x, pos_y, max_distance)
+
+    def monsters_in_radius(self, pos_x, pos_y, radius):
+        return self.__grid.query_radius(pos_x, pos_y, radius)
+
+
+class TestTargeting(unittest.TestCase):
+    def test_target_is_kept_until_lost(self):
+        far = FakeMonster(1, 300, 0)
+        world = FakeWorld([far])
+        targeting = NearestTargeting(max_range=1000)
+        self.assertIs(targeting.target(world, 0, 0), far)
+
+        # A closer monster does not steal the target while it is still valid
+        close = FakeMonster(2, 50, 0)
+        world.add(close)
+        self.assertIs(targeting.target(world, 0, 0), far)
+
+        world.remove(far)
+        self.assertIs(targeting.target(world, 0, 0), close)
+
+        close.pos_x = 2000
+        self.assertIsNone(targeting.target(world, 0, 0))
+
+    def test_lowest_health_prefers_weak_monsters(self):
+        weak = FakeMonster(1, 500, 0, health=1)
+        world = FakeWorld([FakeMonster(2, 10, 0, health=50), weak])
+        self.assertIs(LowestHealthTargeting(max_range=1000).select(world, 0, 0), weak)
+
+    def test_densest_cluster_prefers_crowds(self):
+        crowd = [FakeMonster(handle, 600 + handle, 0) for handle in range(1, 5)]
+        world = FakeWorld([FakeMonster(10, 20, 0)] + crowd)
+        target = DensestClusterTargeting(max_range=1000, cluster_radius=50).select(world, 0, 0)
+        self.assertIn(target, crowd)
+
+    def test_unknown_strategy_is_rejected(self):
+        with self.assertRaises(ValueError):
+            TargetingStrategy.create("random")
+
+
+if __name__ == '__main__':
+    unittest.main()
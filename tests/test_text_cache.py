@@ -0,0 +1,38 @@
+import unittest
+from unittest.mock import patch
+
+import pygame
+
+from presentation.text_cache import FontRegistry, TextCache
+
+
+class TestTextCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+
+    def setUp(self):
+        TextCache.clear()
+
+    def test_fonts_are_shared(self):
+        self.assertIs(FontRegistry.get(30), FontRegistry.get(30))
+        self.assertIsNot(FontRegistry.get(30), FontRegistry.get(30, bold=True))
+
+    def test_same_text_is_rendered_once(self):
+        first = TextCache.render("LEVEL: 1", 30, (255, 209, 92))
+        self.assertIs(TextCache.render("LEVEL: 1", 30, (255, 209, 92)), first)
+        self.assertIsNot(TextCache.render("LEVEL: 1", 30, (255, 255, 255)), first)
+
+    def test_least_recently_used_text_is_dropped(self):
+        with patch('settings.TEXT_CACHE_SIZE', 2):
+            first = TextCache.render("a", 30, (0, 0, 0))
+            second = TextCache.render("b", 30, (0, 0, 0))
+            TextCache.render("a", 30, (0, 0, 0))
+            TextCache.render("c", 30, (0, 0, 0))
+
+            self.assertIs(TextCache.render("a", 30, (0, 0, 0)), first)
+            self.assertIsNot(TextCache.render("b", 30, (0, 0, 0)), second)
+
+
+if __name__ == '__main__':
+    unittest.main()